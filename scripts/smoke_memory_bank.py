@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import argparse
+import json
+import re
 import shutil
 import subprocess
 import sys
@@ -14,6 +16,52 @@ def run(cmd: list[str], *, cwd: Path) -> None:
     subprocess.run(cmd, cwd=str(cwd), check=True)
 
 
+def run_capture(cmd: list[str], *, cwd: Path) -> str:
+    print("+", " ".join(cmd))
+    return subprocess.check_output(cmd, cwd=str(cwd), text=True)
+
+
+def set_repo_map_depth(project: Path, depth: int) -> None:
+    config = project / ".sddkit" / "config.toml"
+    text = config.read_text(encoding="utf-8")
+    config.write_text(re.sub(r"(?m)^depth = \d+$", f"depth = {depth}", text, count=1), encoding="utf-8")
+
+
+def smoke_repo_map(cli: Path, project: Path, *, git: bool) -> None:
+    """`[repo_map] depth = 3` lists nested module roots; `depth = 1` output stays byte-identical."""
+
+    for rel in ("packages/web/package.json", "packages/web/app/package.json", "packages/web/app/deep/package.json", "libs/core/pyproject.toml"):
+        (project / rel).parent.mkdir(parents=True, exist_ok=True)
+        (project / rel).write_text("{}\n" if rel.endswith(".json") else "[project]\n", encoding="utf-8")
+    if git:
+        run(["git", "add", "packages", "libs"], cwd=project)
+        run(["git", "commit", "-m", "Add module roots"], cwd=project)
+    sync_cmd = [sys.executable, str(cli), "sync", "--project", "."]
+    check_cmd = [sys.executable, str(cli), "check", "--project", "."]
+    agents = project / "AGENTS.md"
+    run(sync_cmd, cwd=project)
+    depth1 = agents.read_bytes()
+
+    set_repo_map_depth(project, 3)
+    run(sync_cmd, cwd=project)
+    text = agents.read_text(encoding="utf-8")
+    expected = ["  - `packages/web/` (node)", "  - `packages/web/app/` (node)", "  - `libs/core/` (python)"]
+    missing = [line for line in expected if line not in text.splitlines()]
+    if missing or "packages/web/app/deep/" in text:
+        raise RuntimeError("depth = 3 repo map is wrong:\n" + text)
+    if git:
+        cache = json.loads((project / ".sddkit" / "cache" / "repo_map.json").read_text(encoding="utf-8"))
+        if cache["key"]["depth"] != 3 or ["packages/web/app", ["node"]] not in cache["modules"]:
+            raise RuntimeError(f"repo_map.json cache is wrong: {cache}")
+    run(check_cmd, cwd=project)
+
+    set_repo_map_depth(project, 1)
+    run(sync_cmd, cwd=project)
+    if agents.read_bytes() != depth1:
+        raise RuntimeError("depth = 1 AGENTS.md changed after a depth = 3 round trip")
+    run(check_cmd, cwd=project)
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--keep", action="store_true", help="Keep the temporary repo directory on success/failure")
@@ -52,9 +100,10 @@ def main() -> int:
 
         # Ensure the submodule checkout matches this working tree's HEAD (so the smoke test
         # can validate unmerged changes on a feature branch).
-        run(["git", "checkout", kit_sha], cwd=repo / ".tooling" / "sdd-workflow-kit")
+        project_kit = repo / ".tooling" / "sdd-workflow-kit"
+        run(["git", "checkout", kit_sha], cwd=project_kit)
 
-        project_cli = repo / ".tooling" / "sdd-workflow-kit" / "bin" / "sdd-kit"
+        project_cli = project_kit / "bin" / "sdd-kit"
 
         run(
             [
@@ -82,6 +131,128 @@ def main() -> int:
         if missing:
             raise RuntimeError("Missing expected files:\n" + "\n".join(str(p) for p in missing))
 
+        # Memory Bank index/search: hits are anchored at `path:line`, and a refresh only
+        # re-reads changed files and drops removed ones.
+        bank = repo / "meta" / "memory_bank"
+        scratch = bank / "smoke_scratch.md"
+        scratch.write_text("# Smoke scratch\n\nqwertyuiop notes.\n", encoding="utf-8")
+        memory_cmd = [sys.executable, str(project_cli), "memory"]
+        out = run_capture(memory_cmd + ["index", "--project", "."], cwd=repo)
+        if "removed 0)" not in out or "(updated 0," in out:
+            raise RuntimeError(f"Unexpected initial memory index: {out}")
+        out = run_capture(memory_cmd + ["search", "--project", ".", "Mandatory", "Reading", "Sequence"], cwd=repo)
+        if not out.startswith("meta/memory_bank/README.md:15\t"):
+            raise RuntimeError(f"memory search did not anchor the README heading:\n{out}")
+        out = run_capture(memory_cmd + ["search", "--project", ".", "--json", "qwertyuiop"], cwd=repo)
+        if [hit["path"] for hit in json.loads(out)] != ["meta/memory_bank/smoke_scratch.md"]:
+            raise RuntimeError(f"memory search missed the scratch file:\n{out}")
+        with (bank / "tech_stack.md").open("a", encoding="utf-8") as fh:
+            fh.write("\n## Smoke zyxwvut runtime\n\nSmoke-only section.\n")
+        scratch.unlink()
+        out = run_capture(memory_cmd + ["index", "--project", "."], cwd=repo)
+        if "(updated 1, removed 1)" not in out:
+            raise RuntimeError(f"memory index did not refresh incrementally: {out}")
+        out = run_capture(memory_cmd + ["search", "--project", ".", "--json", "zyxwvut"], cwd=repo)
+        hits = json.loads(out)
+        if not hits or hits[0]["path"] != "meta/memory_bank/tech_stack.md" or hits[0]["heading"] != "Smoke zyxwvut runtime":
+            raise RuntimeError(f"memory search missed the edited section:\n{out}")
+        out = run_capture(memory_cmd + ["search", "--project", ".", "--json", "qwertyuiop"], cwd=repo)
+        if json.loads(out):
+            raise RuntimeError(f"memory search still returns a deleted file:\n{out}")
+
+        # Skill slicing: --skills globs and a named [skills.profiles] entry install only what they select.
+        installed = repo / ".codex" / "skills"
+        run([sys.executable, str(project_cli), "install-skills", "--project", ".", "--skills", "docx"], cwd=repo)
+        with (repo / ".sddkit" / "config.toml").open("a", encoding="utf-8") as fh:
+            fh.write('\n[skills.profiles]\nsmoke = ["pdf", "xlsx"]\n')
+        run([sys.executable, str(project_cli), "install-skills", "--project", ".", "--profile", "smoke"], cwd=repo)
+        got = sorted(p.name for p in installed.iterdir())
+        if got != ["docx", "pdf", "xlsx"]:
+            raise RuntimeError(f"Skill slicing installed unexpected skills: {got}")
+
+        # Archive install: with only skillpacks/codex.skillpack.zip shipped, skills are extracted from
+        # the archive and AGENTS.md (which lists the pack's skills) must still pass the drift check.
+        run([sys.executable, str(project_cli), "pack-skills", "--pack", "codex"], cwd=repo)
+        loose_pack = project_kit / "skillpacks" / "codex"
+        shutil.move(str(loose_pack), str(tmp_root / "codex-loose"))
+        run([sys.executable, str(project_cli), "install-skills", "--project", ".", "--skills", "pptx"], cwd=repo)
+        extracted = installed / "pptx" / "SKILL.md"
+        if not extracted.exists() or extracted.read_bytes() != (tmp_root / "codex-loose" / "skills" / "pptx" / "SKILL.md").read_bytes():
+            raise RuntimeError("Archive install did not extract pptx/SKILL.md intact")
+        run([sys.executable, str(project_cli), "check", "--project", "."], cwd=repo)
+        shutil.move(str(tmp_root / "codex-loose"), str(loose_pack))
+
+        # Specs index: a Spec Kit feature dir and a lifecycle entry, filtered by status and open
+        # tasks. Checkboxes in code fences are not tasks, and a refresh re-parses only what changed.
+        feature = repo / "specs" / "002-smoke-feature"
+        feature.mkdir(parents=True)
+        (feature / "spec.md").write_text("# Spec\n", encoding="utf-8")
+        (feature / "plan.md").write_text("# Plan\n", encoding="utf-8")
+        feature_tasks = feature / "tasks.md"
+        feature_tasks.write_text(
+            "- [x] T001 Setup\n- [ ] T002 Build\n\n```md\n- [ ] not a task\n```\n",
+            encoding="utf-8",
+        )
+        (repo / "specs" / "active").mkdir(parents=True, exist_ok=True)
+        (repo / "specs" / "active" / "smoke-lifecycle.md").write_text("# Lifecycle\n\n- [x] Done item\n", encoding="utf-8")
+        specs_cmd = [sys.executable, str(project_cli), "specs", "--project", "."]
+        out = run_capture(specs_cmd + ["--status", "in_progress"], cwd=repo)
+        if out != "002-smoke-feature\tin_progress\t1/2\tspecs/002-smoke-feature\n":
+            raise RuntimeError(f"specs --status in_progress:\n{out}")
+        out = run_capture(specs_cmd + ["--status", "active"], cwd=repo)
+        if out != "smoke-lifecycle\tactive\t1/1\tspecs/active/smoke-lifecycle.md\n":
+            raise RuntimeError(f"specs --status active:\n{out}")
+        out = run_capture(specs_cmd + ["--open", "--json"], cwd=repo)
+        if [(e["id"], e["open_tasks"]) for e in json.loads(out)] != [("002-smoke-feature", ["T002 Build"])]:
+            raise RuntimeError(f"specs --open --json:\n{out}")
+
+        # Mark every cached record; only the entry whose tasks.md changes may lose its mark.
+        specs_cache = repo / ".sddkit" / "cache" / "specs_index.json"
+        cache_data = json.loads(specs_cache.read_text(encoding="utf-8"))
+        for record in cache_data["entries"].values():
+            record["id"] += "-cached"
+        specs_cache.write_text(json.dumps(cache_data), encoding="utf-8")
+        with feature_tasks.open("a", encoding="utf-8") as fh:
+            fh.write("- [x] T003 Ship\n")
+        out = run_capture(specs_cmd + ["--json"], cwd=repo)
+        got = sorted((e["id"], e["tasks_done"], e["tasks_total"]) for e in json.loads(out))
+        if got != [("002-smoke-feature", 2, 3), ("smoke-lifecycle-cached", 1, 1)]:
+            raise RuntimeError(f"specs refresh did not re-parse only the touched entry: {got}")
+
+        # Repo map: nested module roots from `git ls-files` (cached) and from the non-git walk.
+        smoke_repo_map(project_cli, repo, git=True)
+        plain = tmp_root / "plain"
+        plain.mkdir()
+        run([sys.executable, str(project_cli), "bootstrap", "--project", ".", "--profile", "memory_bank", "--locale", "en"], cwd=plain)
+        smoke_repo_map(project_cli, plain, git=False)
+
+        # Monorepo: a nested project with its own config is synced and checked from the repo root.
+        nested = repo / "services" / "api"
+        nested.mkdir(parents=True)
+        run(
+            [
+                sys.executable,
+                str(project_cli),
+                "bootstrap",
+                "--project",
+                "services/api",
+                "--profile",
+                "memory_bank",
+                "--locale",
+                "en",
+            ],
+            cwd=repo,
+        )
+        nested_agents = nested / "AGENTS.md"
+        nested_agents.write_text(nested_agents.read_text(encoding="utf-8") + "local drift\n", encoding="utf-8")
+        check_cmd = [sys.executable, str(project_cli), "check", "--project", ".", "--monorepo"]
+        print("+", " ".join(check_cmd))
+        res = subprocess.run(check_cmd, cwd=str(repo), capture_output=True, text=True)
+        if res.returncode == 0 or "services/api" not in res.stdout:
+            raise RuntimeError(f"check --monorepo missed drift in the nested project:\n{res.stdout}{res.stderr}")
+        run([sys.executable, str(project_cli), "sync", "--project", ".", "--monorepo"], cwd=repo)
+        run(check_cmd, cwd=repo)
+
         print("OK: memory_bank profile bootstrap + drift check")
         if ns.keep:
             print(f"Kept: {tmp_root}")
@@ -8,6 +8,7 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
 from pathlib import Path
 
 
@@ -21,6 +22,21 @@ def run_capture(cmd: list[str], *, cwd: Path) -> str:
     return subprocess.check_output(cmd, cwd=str(cwd), text=True)
 
 
+def start_serve(cli: Path, *, cwd: Path) -> subprocess.Popen[bytes]:
+    serve_cmd = [sys.executable, str(cli), "serve", "--project", ".", "--idle-timeout", "120"]
+    status_cmd = [sys.executable, str(cli), "serve", "--project", ".", "--status"]
+    print("+", " ".join(serve_cmd))
+    server = subprocess.Popen(serve_cmd, cwd=str(cwd))
+    deadline = time.monotonic() + 30
+    while subprocess.run(status_cmd, cwd=str(cwd), capture_output=True).returncode != 0:
+        if server.poll() is not None or time.monotonic() > deadline:
+            server.kill()
+            server.wait()
+            raise RuntimeError("sdd-kit serve did not start")
+        time.sleep(0.2)
+    return server
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--keep", action="store_true", help="Keep the temporary repo directory on success/failure")
@@ -165,6 +181,88 @@ def main() -> int:
         # Drift check should pass.
         run([sys.executable, str(project_cli), "check", "--project", "."], cwd=repo)
 
+        # The upstream lock only lets `sync` skip unchanged targets. A change to the kit's own
+        # rendering code (same upstream pin) must still be reported by `check` and re-rendered by `sync`.
+        if not (repo / ".sddkit" / "speckit.lock.json").exists():
+            raise RuntimeError("Spec Kit upstream lock was not written by sync")
+        speckit_py = project_kit / "sddkit" / "speckit.py"
+        speckit_src = speckit_py.read_text(encoding="utf-8")
+        anchor = "    out = rewrite_paths(out)\n    return out\n"
+        if anchor not in speckit_src:
+            raise RuntimeError("Could not find generate_command_prompt() return to patch")
+        render_sentinel = "SMOKE-SPECKIT-RENDER-CHANGE"
+        speckit_py.write_text(
+            speckit_src.replace(anchor, f'    out = rewrite_paths(out)\n    return out + "\\n<!-- {render_sentinel} -->\\n"\n'),
+            encoding="utf-8",
+        )
+        check_cmd = [sys.executable, str(project_cli), "check", "--project", "."]
+        print("+", " ".join(check_cmd))
+        res = subprocess.run(check_cmd, cwd=str(repo), capture_output=True, text=True)
+        if res.returncode == 0 or "DRIFT" not in res.stdout:
+            raise RuntimeError(f"check trusted the upstream lock after a kit rendering change:\n{res.stdout}{res.stderr}")
+        run([sys.executable, str(project_cli), "sync", "--project", "."], cwd=repo)
+        skill_text = (repo / ".codex" / "skills" / "speckit-specify" / "SKILL.md").read_text(encoding="utf-8")
+        if render_sentinel not in skill_text:
+            raise RuntimeError("sync skipped speckit targets after a kit rendering change")
+        run(check_cmd, cwd=repo)
+
+        # `serve`: check/sync are answered by the daemon; once the kit changes it exits and
+        # clients fall back in-process.
+        status_cmd = [sys.executable, str(project_cli), "serve", "--project", ".", "--status"]
+        server = start_serve(project_cli, cwd=repo)
+        try:
+            timed_check = check_cmd + ["--timing"]
+            print("+", " ".join(timed_check))
+            res = subprocess.run(timed_check, cwd=str(repo), capture_output=True, text=True)
+            if res.returncode != 0 or "daemon " not in res.stderr:
+                raise RuntimeError(f"check was not answered by the daemon:\n{res.stdout}{res.stderr}")
+            skill_md = repo / ".codex" / "skills" / "speckit-plan" / "SKILL.md"
+            skill_md.write_text(skill_md.read_text(encoding="utf-8") + "local drift\n", encoding="utf-8")
+            print("+", " ".join(check_cmd))
+            res = subprocess.run(check_cmd, cwd=str(repo), capture_output=True, text=True)
+            if res.returncode == 0 or "DRIFT" not in res.stdout:
+                raise RuntimeError(f"Daemon check missed drift:\n{res.stdout}{res.stderr}")
+            run([sys.executable, str(project_cli), "sync", "--project", "."], cwd=repo)
+            run(check_cmd, cwd=repo)
+
+            future = time.time_ns() + 10**9
+            os.utime(project_kit / "sddkit" / "templates.py", ns=(future, future))
+            print("+", " ".join(timed_check))
+            res = subprocess.run(timed_check, cwd=str(repo), capture_output=True, text=True)
+            if res.returncode != 0 or "daemon " in res.stderr:
+                raise RuntimeError(f"check did not fall back in-process after a kit change:\n{res.stdout}{res.stderr}")
+            server.wait(timeout=30)
+            if subprocess.run(status_cmd, cwd=str(repo), capture_output=True).returncode == 0:
+                raise RuntimeError("sdd-kit serve kept running after the kit changed")
+        finally:
+            if server.poll() is None:
+                server.kill()
+                server.wait()
+
+        # Without git, the repo map walks nested dirs (`[repo_map] depth > 1`); the daemon must
+        # notice a new nested module root instead of answering from its warm plan.
+        plain = tmp_root / "plain"
+        (plain / "apps" / "one").mkdir(parents=True)
+        (plain / "apps" / "one" / "package.json").write_text("{}\n", encoding="utf-8")
+        run([sys.executable, str(project_cli), "bootstrap", "--project", ".", "--profile", "memory_bank", "--locale", "en"], cwd=plain)
+        plain_config = plain / ".sddkit" / "config.toml"
+        plain_config.write_text(plain_config.read_text(encoding="utf-8").replace("depth = 1", "depth = 3"), encoding="utf-8")
+        run([sys.executable, str(project_cli), "sync", "--project", "."], cwd=plain)
+        server = start_serve(project_cli, cwd=plain)
+        try:
+            run(check_cmd, cwd=plain)
+            (plain / "apps" / "two").mkdir()
+            (plain / "apps" / "two" / "package.json").write_text("{}\n", encoding="utf-8")
+            timed_check = check_cmd + ["--timing"]
+            print("+", " ".join(timed_check))
+            res = subprocess.run(timed_check, cwd=str(plain), capture_output=True, text=True)
+            if res.returncode == 0 or "DRIFT AGENTS.md" not in res.stdout or "daemon " not in res.stderr:
+                raise RuntimeError(f"Daemon check missed a new nested module root:\n{res.stdout}{res.stderr}")
+        finally:
+            if server.poll() is None:
+                server.kill()
+                server.wait()
+
         print("OK: Spec Kit hybrid install + scripts + drift check")
         if ns.keep:
             print(f"Kept: {tmp_root}")
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+CACHE_DIRNAME = ".sddkit/cache"
+
+
+def cache_dir(project_root: Path) -> Path:
+    """Return `.sddkit/cache/`, creating it with a self-ignoring `.gitignore`.
+
+    Cache files are derived data (indexes); they must never show up as drift or
+    get committed, regardless of the host repo's own ignore rules.
+    """
+
+    d = project_root / CACHE_DIRNAME
+    d.mkdir(parents=True, exist_ok=True)
+    ignore = d / ".gitignore"
+    if not ignore.exists():
+        ignore.write_text("*\n", encoding="utf-8")
+    return d
+
+
+def load_json_cache(path: Path, *, version: int) -> dict[str, Any] | None:
+    """Load a cache file, returning None when missing, corrupt or from another format version."""
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != version:
+        return None
+    return data
+
+
+def save_json_cache(path: Path, data: dict[str, Any]) -> None:
+    # Write atomically so a concurrent reader never sees a half-written index.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import json
 import sys
+import time
 from pathlib import Path
 
+from . import daemon
 from .config import load_config, write_default_config
-from .detect import detect_project
-from .skills import import_codex_skills
-from .sync import check_project, sync_project
+from .memory import MemoryIndex
+from .monorepo import check_monorepo, sync_monorepo
+from .skills import build_skillpack_archive, import_codex_skills, open_skillpack_archive, resolve_skill_selection
+from .specs import STATUSES, SpecsIndex
+from .sync import RunContext, check_project, sync_project
 
 
 def _abs(p: str | Path) -> Path:
@@ -21,6 +26,7 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
     common = argparse.ArgumentParser(add_help=False)
     common.add_argument("--project", default=".", help="Project root (default: .)")
     common.add_argument("--config", default=".sddkit/config.toml", help="Config path (relative to project root by default)")
+    common.add_argument("--timing", action="store_true", help="Print wall-clock time per phase to stderr")
 
     p_detect = sub.add_parser("detect", parents=[common], help="Detect project characteristics")
 
@@ -36,40 +42,132 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
     p_sync = sub.add_parser("sync", parents=[common], help="Sync managed files (safe, idempotent)")
     p_sync.add_argument("--locale", default=None, help="Template locale (en/ru). Overrides config for this run.")
     p_sync.add_argument("--dry-run", action="store_true", help="Print plan, do not write")
+    p_sync.add_argument("--monorepo", action="store_true", help="Sync every nested project with its own config under --project")
+    p_sync.add_argument("--jobs", type=int, default=None, help="Parallel workers for --monorepo (default: min(8, CPUs))")
+    p_sync.add_argument("--no-daemon", action="store_true", help="Run in-process even if `sdd-kit serve` is running")
 
     p_check = sub.add_parser("check", parents=[common], help="Check whether managed files are up to date")
     p_check.add_argument("--locale", default=None, help="Template locale (en/ru). Overrides config for this run.")
     p_check.add_argument("--fail-on-missing-config", default="false", help="true/false (default: false)")
+    p_check.add_argument("--monorepo", action="store_true", help="Check every nested project with its own config under --project")
+    p_check.add_argument("--jobs", type=int, default=None, help="Parallel workers for --monorepo (default: min(8, CPUs))")
+    p_check.add_argument("--no-daemon", action="store_true", help="Run in-process even if `sdd-kit serve` is running")
+
+    p_serve = sub.add_parser("serve", parents=[common], help="Keep a warm check/sync daemon on a per-project Unix socket")
+    p_serve.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=daemon.DEFAULT_IDLE_TIMEOUT,
+        help=f"Exit after this many idle seconds; 0 disables (default: {daemon.DEFAULT_IDLE_TIMEOUT:.0f})",
+    )
+    p_serve.add_argument("--status", action="store_true", help="Report whether a daemon is running, then exit")
+    p_serve.add_argument("--stop", action="store_true", help="Stop a running daemon, then exit")
 
     p_import = sub.add_parser("import-codex-skills", help="Import skills from CODEX_HOME into this repo skillpack")
     p_import.add_argument("--from", dest="from_dir", required=True, help="Source directory (e.g. ~/.codex/skills)")
     p_import.add_argument("--pack", default="codex", help="Pack name under skillpacks/ (default: codex)")
     p_import.add_argument("--kit-root", default=None, help="Kit repo root (defaults to auto-detect)")
 
+    p_pack = sub.add_parser("pack-skills", help="Build skillpacks/<pack>.skillpack.zip (indexed, per-skill extraction)")
+    p_pack.add_argument("--pack", default="codex", help="Pack name under skillpacks/ (default: codex)")
+    p_pack.add_argument("--kit-root", default=None, help="Kit repo root (defaults to auto-detect)")
+
     p_install = sub.add_parser("install-skills", parents=[common], help="Install skills from kit skillpack into project or global CODEX_HOME")
     p_install.add_argument("--pack", default="codex", help="Pack name under kit skillpacks/ (default: codex)")
     p_install.add_argument("--to", default="project", choices=["project", "global"], help="Install destination")
     p_install.add_argument("--dry-run", action="store_true", help="Print plan, do not write")
+    p_install.add_argument(
+        "--skills",
+        action="append",
+        default=None,
+        help="Skill dir globs to install (repeatable or comma-separated, e.g. 'docx,pptx' or 'sdd-*')",
+    )
+    p_install.add_argument("--profile", default=None, help="Named profile from [skills.profiles] in config")
+
+    p_memory = sub.add_parser("memory", help="Indexed full-text search over the Memory Bank")
+    memory_sub = p_memory.add_subparsers(dest="memory_cmd", required=True)
+    memory_sub.add_parser("index", parents=[common], help="Update the Memory Bank index (changed files only)")
+    p_memory_search = memory_sub.add_parser("search", parents=[common], help="BM25-ranked search over Memory Bank sections")
+    p_memory_search.add_argument("query", nargs="+", help="Search terms")
+    p_memory_search.add_argument("--limit", type=int, default=10, help="Max results (default: 10)")
+    p_memory_search.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    p_specs = sub.add_parser("specs", parents=[common], help="Query the incremental specs index (Spec Kit and lifecycle layouts)")
+    p_specs.add_argument("--status", action="append", choices=STATUSES, help="Filter by status (repeatable)")
+    p_specs.add_argument("--open", action="store_true", help="Only specs with unchecked tasks")
+    p_specs.add_argument("--id", dest="id_prefix", default=None, help="Filter by feature/spec id prefix")
+    p_specs.add_argument("--tasks", action="store_true", help="Also list open tasks")
+    p_specs.add_argument("--json", action="store_true", help="Print results as JSON")
 
     return parser.parse_args(argv)
 
 
+class _Timing:
+    """Wall-clock phases for `--timing`; reported on stderr so stdout stays parseable."""
+
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self._start = self._last = time.perf_counter()
+        self._phases: list[tuple[str, float]] = []
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self._phases.append((phase, now - self._last))
+        self._last = now
+
+    def report(self, cmd: str) -> None:
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self._start
+        parts = ", ".join(f"{name} {secs * 1000:.0f}ms" for name, secs in self._phases)
+        print(f"sdd-kit timing: {cmd} {total * 1000:.0f}ms" + (f" ({parts})" if parts else ""), file=sys.stderr)
+
+
 def main(argv: list[str] | None = None) -> int:
     ns = _parse_args(sys.argv[1:] if argv is None else argv)
+    timing = _Timing(bool(getattr(ns, "timing", False)))
+    try:
+        return _run(ns, RunContext(), timing)
+    finally:
+        timing.report(ns.cmd)
+
+
+def _via_daemon(project_root: Path, payload: dict[str, object], timing: _Timing) -> int | None:
+    # Thin client: returns None when no daemon answers, so the caller runs in-process.
+    resp = daemon.request(project_root, payload)
+    if resp is None:
+        return None
+    for line in resp["output"]:
+        print(line)
+    timing.mark("daemon")
+    return int(resp["code"])
 
+
+def _run(ns: argparse.Namespace, run: RunContext, timing: _Timing) -> int:
     if ns.cmd == "import-codex-skills":
         from_dir = _abs(ns.from_dir)
         kit_root = _abs(ns.kit_root) if ns.kit_root else Path(__file__).resolve().parents[1]
         import_codex_skills(kit_root=kit_root, pack_name=ns.pack, source_dir=from_dir)
         return 0
 
+    if ns.cmd == "pack-skills":
+        kit_root = _abs(ns.kit_root) if ns.kit_root else Path(__file__).resolve().parents[1]
+        out = build_skillpack_archive(kit_root / "skillpacks" / ns.pack)
+        stats = open_skillpack_archive(out).stats()
+        print(f"Packed skills: {kit_root / 'skillpacks' / ns.pack} -> {out}")
+        print(
+            f"{stats.skills} skills, {stats.files} files, {stats.blobs} unique "
+            f"({stats.deduplicated_bytes / 1024:.0f} KiB of duplicate content stored once)"
+        )
+        return 0
+
     project_root = _abs(ns.project)
     config_path = Path(ns.config)
     if not config_path.is_absolute():
         config_path = project_root / config_path
 
     if ns.cmd == "detect":
-        detection = detect_project(project_root)
+        detection = run.detection(project_root)
         for k in sorted(detection.keys()):
             print(f"{k}={detection[k]}")
         return 0
@@ -78,7 +176,7 @@ def main(argv: list[str] | None = None) -> int:
         if ns.profile == "airis":
             print("WARNING: profile 'airis' is deprecated; use '--profile memory_bank'.")
         if not config_path.exists():
-            detection = detect_project(project_root)
+            detection = run.detection(project_root)
             write_default_config(
                 config_path,
                 project_root=project_root,
@@ -89,19 +187,48 @@ def main(argv: list[str] | None = None) -> int:
             print(f"Wrote {config_path}")
         cfg = load_config(config_path)
         locale = ns.locale or cfg.locale
-        detection = detect_project(project_root)
-        sync_project(project_root, config_path=config_path, cfg=cfg, detection=detection, locale=locale, dry_run=False)
+        detection = run.detection(project_root)
+        sync_project(project_root, config_path=config_path, cfg=cfg, detection=detection, locale=locale, dry_run=False, run=run)
+        return 0
+
+    if ns.cmd == "sync" and ns.monorepo:
+        if Path(ns.config).is_absolute():
+            print("--monorepo requires --config relative to each project root")
+            return 2
+        count = sync_monorepo(project_root, config_rel=ns.config, locale=ns.locale, dry_run=bool(ns.dry_run), jobs=ns.jobs, run=run)
+        if not count:
+            print(f"No {ns.config} found under {project_root}")
         return 0
 
     if ns.cmd == "sync":
+        if not ns.no_daemon and config_path.exists():
+            code = _via_daemon(
+                project_root,
+                {"cmd": "sync", "config": str(config_path), "locale": ns.locale, "dry_run": bool(ns.dry_run)},
+                timing,
+            )
+            if code is not None:
+                return code
         cfg = load_config(config_path)
         locale = ns.locale or cfg.locale
-        detection = detect_project(project_root)
-        sync_project(project_root, config_path=config_path, cfg=cfg, detection=detection, locale=locale, dry_run=bool(ns.dry_run))
+        timing.mark("config")
+        detection = run.detection(project_root)
+        timing.mark("detect")
+        sync_project(project_root, config_path=config_path, cfg=cfg, detection=detection, locale=locale, dry_run=bool(ns.dry_run), run=run)
+        timing.mark("sync")
         return 0
 
     if ns.cmd == "check":
         fail_missing = str(ns.fail_on_missing_config).strip().lower() in {"1", "true", "yes", "y"}
+        if ns.monorepo:
+            if Path(ns.config).is_absolute():
+                print("--monorepo requires --config relative to each project root")
+                return 2
+            count, ok = check_monorepo(project_root, config_rel=ns.config, locale=ns.locale, jobs=ns.jobs, run=run)
+            if not count:
+                print(f"No {ns.config} found under {project_root}")
+                return 2 if fail_missing else 0
+            return 0 if ok else 2
         if not config_path.exists():
             msg = f"Config not found: {config_path}"
             if fail_missing:
@@ -110,27 +237,109 @@ def main(argv: list[str] | None = None) -> int:
             print(msg)
             print("Skipping (not bootstrapped). Run: sdd-kit bootstrap --project .")
             return 0
+        if not ns.no_daemon:
+            code = _via_daemon(project_root, {"cmd": "check", "config": str(config_path), "locale": ns.locale}, timing)
+            if code is not None:
+                return code
         cfg = load_config(config_path)
         locale = ns.locale or cfg.locale
-        detection = detect_project(project_root)
-        ok = check_project(project_root, config_path=config_path, cfg=cfg, detection=detection, locale=locale)
+        timing.mark("config")
+        detection = run.detection(project_root)
+        timing.mark("detect")
+        ok = check_project(project_root, config_path=config_path, cfg=cfg, detection=detection, locale=locale, run=run)
+        timing.mark("check")
         return 0 if ok else 2
 
+    if ns.cmd == "serve":
+        if ns.status or ns.stop:
+            resp = daemon.request(project_root, {"cmd": "stop" if ns.stop else "ping"}, timeout=5.0)
+            if resp is None:
+                print(f"No sdd-kit daemon running for {project_root}")
+                return 1 if ns.status else 0
+            if ns.stop:
+                print("Stopped")
+            else:
+                print(f"Running: pid {resp.get('pid', '?')} on {daemon.socket_path(project_root)}")
+            return 0
+        if not daemon.supported():
+            print("sdd-kit serve requires Unix domain sockets")
+            return 2
+        server = daemon.Daemon(project_root, idle_timeout=ns.idle_timeout)
+        print(f"Serving {project_root} on {daemon.socket_path(project_root)}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        except RuntimeError as e:
+            print(str(e))
+            return 2
+        return 0
+
     if ns.cmd == "install-skills":
         cfg = load_config(config_path) if config_path.exists() else load_config(None)
         locale = getattr(ns, "locale", None) or cfg.locale
-        detection = detect_project(project_root)
-        sync_project(
-            project_root,
-            config_path=config_path,
-            cfg=cfg,
-            detection=detection,
-            locale=locale,
-            dry_run=bool(ns.dry_run),
-            skills_install_pack=ns.pack,
-            skills_install_to=ns.to,
-            skills_install_only=True,
-        )
+        detection = run.detection(project_root)
+        try:
+            select = resolve_skill_selection(cfg, patterns=ns.skills, profile=ns.profile)
+            sync_project(
+                project_root,
+                config_path=config_path,
+                cfg=cfg,
+                detection=detection,
+                locale=locale,
+                dry_run=bool(ns.dry_run),
+                skills_install_pack=ns.pack,
+                skills_install_to=ns.to,
+                skills_install_only=True,
+                skills_install_select=select,
+                run=run,
+            )
+        except ValueError as e:
+            # Unknown profile or globs that match no skill.
+            print(str(e))
+            return 2
+        return 0
+
+    if ns.cmd == "memory":
+        cfg = load_config(config_path)
+        index = MemoryIndex(project_root, cfg.memory_bank_root)
+        stats = index.refresh()
+        index.save()
+        timing.mark("index")
+        if ns.memory_cmd == "index":
+            print(f"Indexed {stats.files} files / {stats.sections} sections (updated {stats.updated}, removed {stats.removed})")
+            return 0
+        if not stats.files:
+            print(f"Memory Bank not found or empty: {project_root / cfg.memory_bank_root}")
+            return 2
+        hits = index.search(" ".join(ns.query), limit=ns.limit)
+        timing.mark("search")
+        if ns.json:
+            print(json.dumps([hit.__dict__ for hit in hits], ensure_ascii=False, indent=2))
+            return 0
+        for hit in hits:
+            print(f"{hit.path}:{hit.line}\t{hit.score:.2f}\t{hit.heading or '(top)'}")
+        return 0
+
+    if ns.cmd == "specs":
+        cfg = load_config(config_path)
+        roots = [cfg.specs_root]
+        if (project_root / cfg.meta_sdd_root / "specs").is_dir():
+            roots.append(f"{cfg.meta_sdd_root.strip('/')}/specs")
+        specs_index = SpecsIndex(project_root, roots)
+        specs_index.refresh()
+        specs_index.save()
+        timing.mark("index")
+        entries = specs_index.query(statuses=ns.status, open_only=bool(ns.open), id_prefix=ns.id_prefix)
+        timing.mark("query")
+        if ns.json:
+            print(json.dumps([e.__dict__ for e in entries], ensure_ascii=False, indent=2))
+            return 0
+        for e in entries:
+            print(f"{e.id}\t{e.status}\t{e.tasks_done}/{e.tasks_total}\t{e.path}")
+            if ns.tasks:
+                for task in e.open_tasks:
+                    print(f"  - [ ] {task}")
         return 0
 
     raise AssertionError(f"Unhandled command: {ns.cmd}")
@@ -41,8 +41,15 @@ class SddKitConfig:
     manage_codex_scaffold: bool = False
     codex_scaffold_mode: str = "seed"  # seed|managed
 
+    # AGENTS.md repo map: 1 = top-level dirs only; N > 1 also lists module roots
+    # (pyproject.toml, package.json, go.mod, ...) up to N levels deep.
+    repo_map_depth: int = 1
+
     skills_default_pack: str = "codex"
     skills_default_install_to: str = "project"  # project|global
+    skills_default_profile: str = ""
+    # Named install profiles: ((name, (glob, ...)), ...); tuples keep the config hashable.
+    skills_profiles: tuple[tuple[str, tuple[str, ...]], ...] = ()
     github_kit_path: str = ".tooling/sdd-workflow-kit"
     github_config_path: str = ".sddkit/config.toml"
     github_fail_on_missing_config: bool = False
@@ -63,6 +70,19 @@ def _deep_get(d: dict[str, Any], path: str, default: Any) -> Any:
     return cur
 
 
+def _parse_skill_profiles(raw: Any) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    if not isinstance(raw, dict):
+        return ()
+    out: list[tuple[str, tuple[str, ...]]] = []
+    for name, patterns in sorted(raw.items()):
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        if not isinstance(patterns, list):
+            raise ValueError(f"skills.profiles.{name} must be a list of skill globs")
+        out.append((str(name), tuple(str(p) for p in patterns)))
+    return tuple(out)
+
+
 def load_config(config_path: Path | None) -> SddKitConfig:
     if config_path is None or not config_path.exists():
         return DEFAULT_CONFIG
@@ -104,8 +124,11 @@ def load_config(config_path: Path | None) -> SddKitConfig:
         manage_meta_sdd=bool(_deep_get(raw, "manage.meta_sdd", DEFAULT_CONFIG.manage_meta_sdd)),
         manage_codex_scaffold=bool(_deep_get(raw, "manage.codex_scaffold", DEFAULT_CONFIG.manage_codex_scaffold)),
         codex_scaffold_mode=raw_codex_scaffold_mode,
+        repo_map_depth=int(_deep_get(raw, "repo_map.depth", DEFAULT_CONFIG.repo_map_depth)),
         skills_default_pack=str(_deep_get(raw, "skills.default_pack", DEFAULT_CONFIG.skills_default_pack)),
         skills_default_install_to=str(_deep_get(raw, "skills.default_install_to", DEFAULT_CONFIG.skills_default_install_to)),
+        skills_default_profile=str(_deep_get(raw, "skills.default_profile", DEFAULT_CONFIG.skills_default_profile)),
+        skills_profiles=_parse_skill_profiles(_deep_get(raw, "skills.profiles", {})),
         github_kit_path=str(_deep_get(raw, "github.kit_path", DEFAULT_CONFIG.github_kit_path)),
         github_config_path=str(_deep_get(raw, "github.config", DEFAULT_CONFIG.github_config_path)),
         github_fail_on_missing_config=bool(_deep_get(raw, "github.fail_on_missing_config", DEFAULT_CONFIG.github_fail_on_missing_config)),
@@ -184,6 +207,14 @@ script_variant = "sh"
 [skills]
 default_pack = "codex"
 default_install_to = "project"
+# default_profile = "docs"
+#
+# [skills.profiles]
+# docs = ["docx", "pptx", "xlsx", "pdf"]
+
+[repo_map]
+# 1 = top-level dirs only; e.g. 3 also lists module roots (package.json, go.mod, ...) in monorepos
+depth = 1
 
 [github]
 kit_path = ".tooling/sdd-workflow-kit"
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .cache import CACHE_DIRNAME, cache_dir
+from .config import SddKitConfig, load_config
+from .detect import detect_project
+from .gitmeta import find_git_dir
+from .sync import (
+    PlanItem,
+    ProjectContext,
+    RunContext,
+    _apply_project_sync,
+    _check_project_plan,
+    _kit_root,
+    _kit_source_files,
+    _plan_project_sync,
+)
+
+
+_PROTOCOL_VERSION = 1
+_SOCKET_NAME = "serve.sock"
+# sockaddr_un.sun_path is 104-108 bytes depending on the platform.
+_MAX_SOCKET_PATH = 100
+_CLIENT_TIMEOUT = 60.0
+DEFAULT_IDLE_TIMEOUT = 1800.0
+
+
+def supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path(project_root: Path) -> Path:
+    """Per-project socket under `.sddkit/cache/`, or a hashed temp path when that is too long."""
+
+    root = project_root.resolve()
+    path = root / CACHE_DIRNAME / _SOCKET_NAME
+    if len(os.fsencode(path)) <= _MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha1(os.fsencode(root)).hexdigest()[:16]
+    uid = getattr(os, "getuid", lambda: 0)()
+    return Path(tempfile.gettempdir()) / f"sdd-kit-{uid}-{digest}.sock"
+
+
+def request(project_root: Path, payload: dict[str, Any], *, timeout: float = _CLIENT_TIMEOUT) -> dict[str, Any] | None:
+    """Send one request to the project's daemon.
+
+    Returns None when no daemon is listening or it declines the request, so the
+    caller can fall back to running in-process.
+    """
+
+    if not supported():
+        return None
+    path = socket_path(project_root)
+    if not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps({**payload, "v": _PROTOCOL_VERSION}).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as fh:
+                raw = fh.readline()
+    except OSError:
+        return None
+    try:
+        resp = json.loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(resp, dict) or "error" in resp or not isinstance(resp.get("code"), int):
+        return None
+    return resp
+
+
+def _fingerprint(paths: list[Path]) -> list[tuple[int, int]]:
+    out: list[tuple[int, int]] = []
+    for p in paths:
+        try:
+            st = p.stat()
+        except OSError:
+            out.append((0, -1))
+            continue
+        out.append((st.st_mtime_ns, st.st_size))
+    return out
+
+
+def _kit_watched_paths(kit_root: Path) -> list[Path]:
+    # Kit code, bundled templates and the pinned Spec Kit checkout: if any of
+    # these change, the warm plan and the imported kit code are stale.
+    paths = _kit_source_files(kit_root)
+    upstream_git = find_git_dir(kit_root / "upstreams" / "spec-kit")
+    if upstream_git is not None:
+        head = upstream_git / "HEAD"
+        paths += [head, upstream_git / "packed-refs"]
+        try:
+            ref = head.read_text(encoding="utf-8").strip()
+        except OSError:
+            ref = ""
+        if ref.startswith("ref:"):
+            # A branch checkout moves the ref, not HEAD itself.
+            paths.append(upstream_git / ref.removeprefix("ref:").strip())
+    return paths
+
+
+def _project_watched_paths(ctx: ProjectContext, plan: list[PlanItem]) -> list[Path]:
+    """Paths whose stat fingerprint covers every input of a rendered plan.
+
+    Directory mtimes catch added/removed entries (repo map, docs index);
+    `.git/index` catches changes to tracked top-level dirs and module roots.
+    Without git, every dir the repo map walk listed is watched instead, so a
+    new nested module root is noticed. Plan targets catch create/update/
+    unmanaged decisions. Detection is recomputed per request.
+    """
+
+    root, cfg = ctx.project_root, ctx.cfg
+    docs_root = cfg.docs_root.strip("/") or "docs"
+    paths = {
+        root,
+        root / ".github",
+        root / docs_root,
+        root / docs_root / "SDD",
+        root / (cfg.memory_bank_root.strip("/") or "meta/memory_bank"),
+    }
+    fragments = root / ".sddkit" / "fragments"
+    paths.add(fragments)
+    if fragments.is_dir():
+        paths.update(p for p in fragments.iterdir() if p.is_file())
+    if (root / ".git").exists():
+        git_dir = find_git_dir(root)
+        if git_dir is not None:
+            paths.add(git_dir / "index")
+    paths.update(root / rel for rel in ctx.repo_index.walked_dirs)
+    paths.update(item.target for item in plan)
+    return sorted(paths)
+
+
+@dataclass
+class _WarmPlan:
+    config_fp: list[tuple[int, int]]
+    cfg: SddKitConfig
+    detection: dict[str, str]
+    ctx: ProjectContext
+    plan: list[PlanItem]
+    watched: list[Path]
+    watched_fp: list[tuple[int, int]]
+
+
+class Daemon:
+    """Keeps config, detection and the rendered plan warm for one project.
+
+    Requests are newline-delimited JSON over a Unix socket and are served one at
+    a time. Before each request the daemon re-stats the inputs of the cached
+    plan and re-plans only when a fingerprint changed. When the kit itself
+    changes it declines the request and exits, so clients fall back in-process.
+    """
+
+    def __init__(self, project_root: Path, *, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+        self.project_root = project_root.resolve()
+        self.idle_timeout = idle_timeout
+        self.kit_root = _kit_root()
+        self._kit_watched = _kit_watched_paths(self.kit_root)
+        self._kit_fp = _fingerprint(self._kit_watched)
+        self._warm: dict[tuple[str, str | None], _WarmPlan] = {}
+        self._stop = False
+
+    def _warm_plan(self, config_path: Path, locale: str | None) -> _WarmPlan:
+        key = (str(config_path), locale)
+        config_fp = _fingerprint([config_path])
+        detection = detect_project(self.project_root)
+        warm = self._warm.get(key)
+        if (
+            warm is not None
+            and warm.config_fp == config_fp
+            and warm.detection == detection
+            and _fingerprint(warm.watched) == warm.watched_fp
+        ):
+            return warm
+
+        cfg = warm.cfg if warm is not None and warm.config_fp == config_fp else load_config(config_path)
+        ctx = RunContext().project(self.project_root, cfg, detection)
+        # The warm plan also answers `check`, so render everything instead of trusting the lock.
+        plan = _plan_project_sync(ctx, self.kit_root, locale=locale or cfg.locale, reuse_lock=False)
+        if cfg.manage_speckit:
+            _ = ctx.agents_auto_fragment
+        watched = _project_watched_paths(ctx, plan)
+        warm = _WarmPlan(
+            config_fp=config_fp,
+            cfg=cfg,
+            detection=detection,
+            ctx=ctx,
+            plan=plan,
+            watched=watched,
+            watched_fp=_fingerprint(watched),
+        )
+        self._warm[key] = warm
+        return warm
+
+    def handle(self, req: dict[str, Any]) -> dict[str, Any]:
+        if req.get("v") != _PROTOCOL_VERSION:
+            return {"error": "protocol version mismatch"}
+        cmd = req.get("cmd")
+        if cmd == "ping":
+            return {"code": 0, "output": [], "pid": os.getpid()}
+        if cmd == "stop":
+            self._stop = True
+            return {"code": 0, "output": []}
+        if cmd not in {"check", "sync"}:
+            return {"error": f"unknown command: {cmd}"}
+        if _fingerprint(self._kit_watched) != self._kit_fp:
+            self._stop = True
+            return {"error": "kit changed; daemon is exiting"}
+
+        config_path = Path(str(req.get("config", "")))
+        if not config_path.is_absolute() or not config_path.exists():
+            return {"error": f"config not found: {config_path}"}
+        locale = req.get("locale")
+        warm = self._warm_plan(config_path, locale)
+
+        lines: list[str] = []
+        if cmd == "check":
+            ok = _check_project_plan(warm.ctx, warm.plan, emit=lines.append)
+            return {"code": 0 if ok else 2, "output": lines}
+
+        dry_run = bool(req.get("dry_run"))
+        _apply_project_sync(warm.ctx, warm.plan, config_path=config_path, dry_run=dry_run, emit=lines.append)
+        return {"code": 0, "output": lines}
+
+    def _serve_one(self, conn: socket.socket) -> None:
+        with conn, conn.makefile("rb") as rfile:
+            try:
+                req = json.loads(rfile.readline())
+                if not isinstance(req, dict):
+                    raise ValueError("request must be a JSON object")
+                resp = self.handle(req)
+            except Exception as e:  # Never take the daemon down; the client falls back.
+                resp = {"error": f"{type(e).__name__}: {e}"}
+            try:
+                conn.sendall(json.dumps(resp, ensure_ascii=False).encode("utf-8") + b"\n")
+            except OSError:
+                pass
+
+    def serve_forever(self) -> None:
+        """Listen on the project socket until stopped, the kit changes or the idle timeout passes."""
+
+        if not supported():
+            raise RuntimeError("sdd-kit serve requires Unix domain sockets")
+        path = socket_path(self.project_root)
+        if path.parent == self.project_root / CACHE_DIRNAME:
+            cache_dir(self.project_root)
+        if request(self.project_root, {"cmd": "ping"}) is not None:
+            raise RuntimeError(f"sdd-kit daemon already running on {path}")
+        path.unlink(missing_ok=True)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(str(path))
+            os.chmod(path, 0o600)
+            server.listen()
+            server.settimeout(self.idle_timeout or None)
+            try:
+                while not self._stop:
+                    try:
+                        conn, _ = server.accept()
+                    except socket.timeout:
+                        break
+                    conn.settimeout(_CLIENT_TIMEOUT)
+                    self._serve_one(conn)
+            finally:
+                path.unlink(missing_ok=True)
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import re
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+
+_SHA1_RE = re.compile(r"^[0-9a-f]{40}$")
+
+# Pack object types (see git's Documentation/gitformat-pack.txt).
+_OBJ_TAG = 4
+_OBJ_OFS_DELTA = 6
+_OBJ_REF_DELTA = 7
+
+# Guard against pathological tag chains (tag -> tag -> ... -> commit).
+_MAX_PEEL_DEPTH = 8
+
+
+@dataclass(frozen=True)
+class GitHead:
+    sha: str
+    tags: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class _TagInfo:
+    target: str
+    annotated: bool
+    tagger_time: int
+
+
+def find_git_dir(repo_root: Path) -> Path | None:
+    """Locate the git dir for `repo_root`, following `.git` files.
+
+    Submodules and worktrees use a `.git` *file* containing `gitdir: <path>`
+    (relative to the file's directory). Like git itself, we search parent
+    directories when `repo_root` has no `.git` entry of its own.
+    """
+
+    for base in (repo_root, *repo_root.parents):
+        dot_git = base / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                first = dot_git.read_text(encoding="utf-8", errors="replace").splitlines()[0].strip()
+            except (OSError, IndexError):
+                return None
+            if not first.startswith("gitdir:"):
+                return None
+            target = Path(first.removeprefix("gitdir:").strip())
+            if not target.is_absolute():
+                target = base / target
+            return target.resolve() if target.is_dir() else None
+    return None
+
+
+def index_checksum(git_dir: Path) -> str | None:
+    """Return the SHA trailer of `<git_dir>/index`, a content hash of the staged tree.
+
+    It changes whenever the set of tracked paths (or their staged blobs) changes,
+    so it is a cheap cache key for anything derived from `git ls-files`. Returns
+    None when there is no index or `index.skipHash` left the trailer zeroed.
+    """
+
+    try:
+        with (git_dir / "index").open("rb") as fh:
+            if fh.read(4) != b"DIRC":
+                return None
+            fh.seek(-20, 2)
+            trailer = fh.read(20)
+    except OSError:
+        return None
+    if len(trailer) != 20 or trailer == bytes(20):
+        return None
+    return trailer.hex()
+
+
+def _common_dir(git_dir: Path) -> Path:
+    # Linked worktrees keep refs/objects in the main repository ("commondir").
+    p = git_dir / "commondir"
+    if p.is_file():
+        raw = p.read_text(encoding="utf-8", errors="replace").strip()
+        common = Path(raw)
+        if not common.is_absolute():
+            common = git_dir / common
+        return common.resolve()
+    return git_dir
+
+
+def _read_packed_refs(common_dir: Path) -> tuple[dict[str, str], dict[str, str]]:
+    """Return (refs, peeled) from `packed-refs`; `peeled` maps ref -> `^` target."""
+
+    refs: dict[str, str] = {}
+    peeled: dict[str, str] = {}
+    p = common_dir / "packed-refs"
+    if not p.is_file():
+        return refs, peeled
+    last_ref = ""
+    for line in p.read_text(encoding="utf-8", errors="replace").splitlines():
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("^"):
+            if last_ref:
+                peeled[last_ref] = line[1:].strip()
+            continue
+        sha, _, name = line.partition(" ")
+        last_ref = name.strip()
+        refs[last_ref] = sha.strip()
+    return refs, peeled
+
+
+def _read_loose_ref(git_dir: Path, common_dir: Path, name: str) -> str | None:
+    for base in (git_dir, common_dir):
+        p = base / name
+        if p.is_file():
+            return p.read_text(encoding="utf-8", errors="replace").strip()
+    return None
+
+
+def _resolve_ref(git_dir: Path, common_dir: Path, name: str, packed: dict[str, str]) -> str | None:
+    for _ in range(_MAX_PEEL_DEPTH):
+        raw = _read_loose_ref(git_dir, common_dir, name)
+        if raw is None:
+            raw = packed.get(name)
+        if raw is None:
+            return None
+        if raw.startswith("ref:"):
+            name = raw.removeprefix("ref:").strip()
+            continue
+        return raw if _SHA1_RE.match(raw) else None
+    return None
+
+
+class _ObjectStore:
+    """Minimal read-only access to loose and packed objects (tags only need bodies)."""
+
+    def __init__(self, common_dir: Path) -> None:
+        self._objects = common_dir / "objects"
+        self._indexes: list[tuple[Path, bytes]] | None = None
+
+    def _pack_indexes(self) -> list[tuple[Path, bytes]]:
+        if self._indexes is None:
+            pack_dir = self._objects / "pack"
+            paths = sorted(pack_dir.glob("*.idx")) if pack_dir.is_dir() else []
+            self._indexes = [(p, p.read_bytes()) for p in paths]
+        return self._indexes
+
+    def read(self, sha: str) -> tuple[str, bytes] | None:
+        """Return (kind, body); the body is only inflated for tag objects."""
+
+        loose = self._objects / sha[:2] / sha[2:]
+        if loose.is_file():
+            inflater = zlib.decompressobj()
+            raw = loose.read_bytes()
+            head = inflater.decompress(raw, 64)
+            kind = head.split(b" ", 1)[0].decode("ascii", errors="replace")
+            if kind != "tag":
+                return kind, b""
+            data = head + inflater.decompress(inflater.unconsumed_tail)
+            return kind, data.partition(b"\x00")[2]
+
+        for idx_path, idx in self._pack_indexes():
+            offset = _pack_offset(idx, sha)
+            if offset is None:
+                continue
+            with idx_path.with_suffix(".pack").open("rb") as fh:
+                fh.seek(offset)
+                byte = fh.read(1)[0]
+                obj_type = (byte >> 4) & 0x7
+                while byte & 0x80:
+                    byte = fh.read(1)[0]
+                if obj_type in {_OBJ_OFS_DELTA, _OBJ_REF_DELTA}:
+                    # Deltified objects need the base chain; leave them to `git`.
+                    raise ValueError(f"Deltified object in pack: {sha}")
+                if obj_type != _OBJ_TAG:
+                    return "other", b""
+                inflater = zlib.decompressobj()
+                chunks: list[bytes] = []
+                while not inflater.eof:
+                    buf = fh.read(64 * 1024)
+                    if not buf:
+                        break
+                    chunks.append(inflater.decompress(buf))
+                return "tag", b"".join(chunks)
+        return None
+
+
+def _pack_offset(idx: bytes, sha: str) -> int | None:
+    """Binary-search a v2 pack index for `sha`; return the pack offset or None."""
+
+    if idx[:4] != b"\xfftOc" or int.from_bytes(idx[4:8], "big") != 2:
+        raise ValueError("Unsupported pack index version")
+    want = bytes.fromhex(sha)
+    fanout = 8
+    lo = int.from_bytes(idx[fanout + 4 * (want[0] - 1) : fanout + 4 * want[0]], "big") if want[0] else 0
+    hi = int.from_bytes(idx[fanout + 4 * want[0] : fanout + 4 * (want[0] + 1)], "big")
+    total = int.from_bytes(idx[fanout + 4 * 255 : fanout + 4 * 256], "big")
+    names = fanout + 4 * 256
+    while lo < hi:
+        mid = (lo + hi) // 2
+        cur = idx[names + 20 * mid : names + 20 * (mid + 1)]
+        if cur < want:
+            lo = mid + 1
+        elif cur > want:
+            hi = mid
+        else:
+            offsets = names + 20 * total + 4 * total
+            off = int.from_bytes(idx[offsets + 4 * mid : offsets + 4 * (mid + 1)], "big")
+            if off & 0x80000000:
+                large = offsets + 4 * total + 8 * (off & 0x7FFFFFFF)
+                off = int.from_bytes(idx[large : large + 8], "big")
+            return off
+    return None
+
+
+def _parse_tag_object(body: bytes) -> tuple[str, int]:
+    target = ""
+    tagger_time = 0
+    for line in body.split(b"\n"):
+        if not line:
+            break
+        if line.startswith(b"object "):
+            target = line[7:].decode("ascii").strip()
+        elif line.startswith(b"tagger "):
+            parts = line.rsplit(b" ", 2)
+            if len(parts) == 3 and parts[1].isdigit():
+                tagger_time = int(parts[1])
+    return target, tagger_time
+
+
+def _tag_info(store: _ObjectStore, ref_sha: str, peeled: str | None, head_sha: str) -> _TagInfo | None:
+    """Peel a tag ref; return None when it does not point at `head_sha`.
+
+    Annotated tags point at tag objects, which we read to find the commit and the
+    tagger date. Lightweight tags name the commit directly.
+    """
+
+    if ref_sha == head_sha:
+        return _TagInfo(target=head_sha, annotated=False, tagger_time=0)
+    if peeled is not None and peeled != head_sha:
+        # packed-refs already tells us where this annotated tag points.
+        return None
+
+    sha = ref_sha
+    annotated = False
+    tagger_time = 0
+    for _ in range(_MAX_PEEL_DEPTH):
+        try:
+            obj = store.read(sha)
+        except ValueError:
+            if peeled is None:
+                raise
+            obj = None
+        if obj is None or obj[0] != "tag":
+            break
+        target, when = _parse_tag_object(obj[1])
+        if not annotated:
+            tagger_time = when
+        annotated = True
+        sha = target
+    if peeled is not None and not annotated:
+        # Annotated tag whose object we could not read; trust the peeled commit.
+        return _TagInfo(target=peeled, annotated=True, tagger_time=0)
+    if sha != head_sha:
+        return None
+    return _TagInfo(target=sha, annotated=annotated, tagger_time=tagger_time)
+
+
+def _iter_tag_refs(common_dir: Path, packed: dict[str, str]) -> dict[str, str]:
+    tags = {name: sha for name, sha in packed.items() if name.startswith("refs/tags/")}
+    tags_dir = common_dir / "refs" / "tags"
+    if tags_dir.is_dir():
+        for p in tags_dir.rglob("*"):
+            if not p.is_file():
+                continue
+            sha = p.read_text(encoding="utf-8", errors="replace").strip()
+            if _SHA1_RE.match(sha):
+                tags[f"refs/tags/{p.relative_to(tags_dir).as_posix()}"] = sha
+    return tags
+
+
+def read_head(repo_root: Path) -> GitHead | None:
+    """Read HEAD and the tags pointing exactly at it without spawning `git`.
+
+    Returns None when the repository uses a layout we do not parse (reftable,
+    SHA-256 object format, deltified tag objects, ...); callers should then fall
+    back to the `git` CLI.
+    """
+
+    git_dir = find_git_dir(repo_root)
+    if git_dir is None:
+        return None
+    try:
+        common_dir = _common_dir(git_dir)
+        if (common_dir / "reftable").exists():
+            return None
+        packed, packed_peeled = _read_packed_refs(common_dir)
+        sha = _resolve_ref(git_dir, common_dir, "HEAD", packed)
+        if sha is None:
+            return None
+
+        store = _ObjectStore(common_dir)
+        matches: list[tuple[bool, int, str]] = []
+        for ref, ref_sha in _iter_tag_refs(common_dir, packed).items():
+            # A loose ref overrides its packed-refs entry (and that entry's peeled value).
+            peeled = packed_peeled.get(ref) if packed.get(ref) == ref_sha else None
+            info = _tag_info(store, ref_sha, peeled, sha)
+            if info is not None:
+                matches.append((info.annotated, info.tagger_time, ref.removeprefix("refs/tags/")))
+        # `git describe --tags` prefers annotated tags, then the most recent one.
+        matches.sort(key=lambda m: (not m[0], -m[1], m[2]))
+        return GitHead(sha=sha, tags=tuple(m[2] for m in matches))
+    except (OSError, ValueError, zlib.error, UnicodeDecodeError):
+        return None
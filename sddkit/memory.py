@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .cache import cache_dir, load_json_cache, save_json_cache
+
+
+_INDEX_VERSION = 1
+_INDEX_FILENAME = "memory_index.json"
+
+_TOKEN_RE = re.compile(r"\w+")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+# Standard Okapi BM25 parameters.
+_BM25_K1 = 1.5
+_BM25_B = 0.75
+
+
+@dataclass(frozen=True)
+class MemoryHit:
+    path: str  # relative to project root (posix)
+    line: int  # 1-based line of the section heading
+    heading: str
+    score: float
+
+
+@dataclass(frozen=True)
+class IndexStats:
+    files: int
+    sections: int
+    updated: int
+    removed: int
+
+
+def tokenize(text: str) -> list[str]:
+    # Unicode-aware (`\w`) so ru-locale Memory Banks are searchable too.
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1]
+
+
+def split_sections(text: str) -> list[tuple[int, str, str]]:
+    """Split Markdown into `(line, heading, text)` chunks at ATX headings.
+
+    Headings inside fenced code blocks are ignored. Content before the first
+    heading becomes a section with an empty heading anchored at line 1.
+    """
+
+    sections: list[tuple[int, str, str]] = []
+    start_line = 1
+    heading = ""
+    buf: list[str] = []
+    in_fence = False
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        m = None if in_fence else _HEADING_RE.match(line)
+        if m:
+            if heading or any(b.strip() for b in buf):
+                sections.append((start_line, heading, "\n".join(buf)))
+            start_line = lineno
+            heading = m.group(2)
+            buf = [heading]
+            continue
+        buf.append(line)
+    if heading or any(b.strip() for b in buf):
+        sections.append((start_line, heading, "\n".join(buf)))
+    return sections
+
+
+class MemoryIndex:
+    """Incremental BM25 index over the Memory Bank Markdown files.
+
+    Persisted as JSON under `.sddkit/cache/`. Each refresh only re-reads files
+    whose `(mtime_ns, size)` changed; postings of changed/removed files are
+    dropped by section id, so the rest of the index is reused as is.
+
+    Layout:
+    - files: {path: {"mtime_ns", "size", "sections": [sid, ...]}}
+    - sections: {sid: {"path", "line", "heading", "length", "terms": [...]}}
+    - postings: {term: {sid: tf}}
+    """
+
+    def __init__(self, project_root: Path, memory_root: str) -> None:
+        self.project_root = project_root
+        self.memory_root = memory_root.strip("/") or "meta/memory_bank"
+        self._path = project_root / ".sddkit" / "cache" / _INDEX_FILENAME
+        data = load_json_cache(self._path, version=_INDEX_VERSION)
+        if data is None or data.get("root") != self.memory_root:
+            data = self._empty()
+        self._data: dict[str, Any] = data
+        self._dirty = False
+
+    def _empty(self) -> dict[str, Any]:
+        return {
+            "version": _INDEX_VERSION,
+            "root": self.memory_root,
+            "next_sid": 0,
+            "total_length": 0,
+            "files": {},
+            "sections": {},
+            "postings": {},
+        }
+
+    def _drop_file(self, rel: str) -> None:
+        entry = self._data["files"].pop(rel, None)
+        if entry is None:
+            return
+        postings = self._data["postings"]
+        for sid in entry["sections"]:
+            section = self._data["sections"].pop(sid)
+            self._data["total_length"] -= section["length"]
+            for term in section["terms"]:
+                plist = postings.get(term)
+                if plist is None:
+                    continue
+                plist.pop(sid, None)
+                if not plist:
+                    del postings[term]
+        self._dirty = True
+
+    def _add_file(self, rel: str, path: Path, mtime_ns: int, size: int) -> None:
+        text = path.read_text(encoding="utf-8", errors="replace")
+        postings = self._data["postings"]
+        sids: list[str] = []
+        for line, heading, body in split_sections(text):
+            tokens = tokenize(body)
+            if not tokens:
+                continue
+            sid = str(self._data["next_sid"])
+            self._data["next_sid"] += 1
+            tf: dict[str, int] = {}
+            for tok in tokens:
+                tf[tok] = tf.get(tok, 0) + 1
+            for term, count in tf.items():
+                postings.setdefault(term, {})[sid] = count
+            self._data["sections"][sid] = {
+                "path": rel,
+                "line": line,
+                "heading": heading,
+                "length": len(tokens),
+                "terms": sorted(tf),
+            }
+            self._data["total_length"] += len(tokens)
+            sids.append(sid)
+        self._data["files"][rel] = {"mtime_ns": mtime_ns, "size": size, "sections": sids}
+        self._dirty = True
+
+    def refresh(self) -> IndexStats:
+        base = self.project_root / self.memory_root
+        seen: set[str] = set()
+        updated = 0
+        if base.is_dir():
+            for path in sorted(base.rglob("*.md")):
+                if not path.is_file():
+                    continue
+                rel = path.relative_to(self.project_root).as_posix()
+                seen.add(rel)
+                st = path.stat()
+                cur = self._data["files"].get(rel)
+                if cur is not None and cur["mtime_ns"] == st.st_mtime_ns and cur["size"] == st.st_size:
+                    continue
+                self._drop_file(rel)
+                self._add_file(rel, path, st.st_mtime_ns, st.st_size)
+                updated += 1
+        removed = [rel for rel in self._data["files"] if rel not in seen]
+        for rel in removed:
+            self._drop_file(rel)
+        return IndexStats(
+            files=len(self._data["files"]),
+            sections=len(self._data["sections"]),
+            updated=updated,
+            removed=len(removed),
+        )
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        cache_dir(self.project_root)
+        save_json_cache(self._path, self._data)
+        self._dirty = False
+
+    def search(self, query: str, *, limit: int = 10) -> list[MemoryHit]:
+        sections = self._data["sections"]
+        n = len(sections)
+        if n == 0:
+            return []
+        avgdl = self._data["total_length"] / n
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            plist = self._data["postings"].get(term)
+            if not plist:
+                continue
+            idf = math.log((n - len(plist) + 0.5) / (len(plist) + 0.5) + 1.0)
+            for sid, tf in plist.items():
+                norm = 1 - _BM25_B + _BM25_B * sections[sid]["length"] / avgdl
+                scores[sid] = scores.get(sid, 0.0) + idf * tf * (_BM25_K1 + 1) / (tf + _BM25_K1 * norm)
+
+        # Highest score first; ties break on path/line so output is deterministic.
+        top = heapq.nsmallest(limit, scores, key=lambda sid: (-scores[sid], sections[sid]["path"], sections[sid]["line"]))
+        return [
+            MemoryHit(
+                path=sections[sid]["path"],
+                line=sections[sid]["line"],
+                heading=sections[sid]["heading"],
+                score=scores[sid],
+            )
+            for sid in top
+        ]
+
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .config import load_config
+from .sync import (
+    _DEFAULT_REPO_DIR_IGNORES,
+    PlanItem,
+    ProjectContext,
+    RunContext,
+    _apply_project_sync,
+    _assert_no_duplicate_plan_targets,
+    _check_project_plan,
+    _kit_root,
+    _plan_project_sync,
+    _plan_writes,
+    _project_rel,
+)
+
+
+@dataclass(frozen=True)
+class MonorepoProject:
+    root: Path
+    config_path: Path
+
+
+@dataclass(frozen=True)
+class _PlannedProject:
+    project: MonorepoProject
+    ctx: ProjectContext
+    plan: list[PlanItem]
+
+
+def default_jobs() -> int:
+    return min(8, os.cpu_count() or 1)
+
+
+def discover_projects(repo_root: Path, *, config_rel: str = ".sddkit/config.toml") -> list[MonorepoProject]:
+    """Find every directory under `repo_root` (inclusive) that has its own sdd-kit config.
+
+    This is a single top-down walk. Ignored directories (`_DEFAULT_REPO_DIR_IGNORES`
+    and dot-dirs) are pruned, so we never descend into `node_modules`, build
+    outputs or the vendored kit. Results are ordered parent-first, then by path.
+    """
+
+    first_part = Path(config_rel).parts[0]
+    out: list[MonorepoProject] = []
+    for dirpath, dirnames, filenames in os.walk(repo_root):
+        base = Path(dirpath)
+        if first_part in dirnames or first_part in filenames:
+            config_path = base / config_rel
+            if config_path.is_file():
+                out.append(MonorepoProject(root=base, config_path=config_path))
+        dirnames[:] = sorted(d for d in dirnames if d not in _DEFAULT_REPO_DIR_IGNORES and not d.startswith("."))
+    return out
+
+
+def _plan_all(
+    projects: list[MonorepoProject],
+    *,
+    repo_root: Path,
+    locale: str | None,
+    run: RunContext,
+    check: bool,
+) -> list[_PlannedProject]:
+    # Planning stays sequential: it is CPU-bound and shares the run/template/upstream caches.
+    kit_root = _kit_root()
+    planned: list[_PlannedProject] = []
+    for proj in projects:
+        cfg = load_config(proj.config_path)
+        ctx = run.project(proj.root, cfg, run.detection(proj.root))
+        project_locale = locale or cfg.locale
+        if check:
+            plan = _plan_writes(ctx, kit_root, project_locale, reuse_lock=False)
+            _assert_no_duplicate_plan_targets(plan, project_root=proj.root)
+        else:
+            plan = _plan_project_sync(ctx, kit_root, locale=project_locale)
+        if cfg.manage_speckit:
+            # Render the AGENTS.md auto fragment now so workers only do I/O.
+            _ = ctx.agents_auto_fragment
+        planned.append(_PlannedProject(project=proj, ctx=ctx, plan=plan))
+
+    # Nested projects must never fight over the same file when applied concurrently.
+    _assert_no_duplicate_plan_targets([item for p in planned for item in p.plan], project_root=repo_root)
+    return planned
+
+
+def _print_project_lines(repo_root: Path, proj: MonorepoProject, lines: list[str]) -> None:
+    print(f"== {_project_rel(proj.root, repo_root)} ==")
+    for line in lines:
+        print(line)
+
+
+def sync_monorepo(
+    repo_root: Path,
+    *,
+    config_rel: str,
+    locale: str | None,
+    dry_run: bool,
+    jobs: int | None = None,
+    run: RunContext | None = None,
+) -> int:
+    """Plan every nested project in one process, then apply the plans in parallel.
+
+    Returns the number of projects synced.
+    """
+
+    run = run or RunContext()
+    projects = discover_projects(repo_root, config_rel=config_rel)
+    planned = _plan_all(projects, repo_root=repo_root, locale=locale, run=run, check=False)
+
+    def apply(entry: _PlannedProject) -> list[str]:
+        lines: list[str] = []
+        _apply_project_sync(
+            entry.ctx,
+            entry.plan,
+            config_path=entry.project.config_path,
+            dry_run=dry_run,
+            emit=lines.append,
+        )
+        return lines
+
+    with ThreadPoolExecutor(max_workers=jobs or default_jobs()) as pool:
+        # `map` yields in submission order, so output stays grouped and deterministic.
+        for entry, lines in zip(planned, pool.map(apply, planned)):
+            _print_project_lines(repo_root, entry.project, lines)
+    return len(planned)
+
+
+def check_monorepo(
+    repo_root: Path,
+    *,
+    config_rel: str,
+    locale: str | None,
+    jobs: int | None = None,
+    run: RunContext | None = None,
+) -> tuple[int, bool]:
+    """Check every nested project; returns (projects checked, all up to date)."""
+
+    run = run or RunContext()
+    projects = discover_projects(repo_root, config_rel=config_rel)
+    planned = _plan_all(projects, repo_root=repo_root, locale=locale, run=run, check=True)
+
+    def check(entry: _PlannedProject) -> tuple[bool, list[str]]:
+        lines: list[str] = []
+        ok = _check_project_plan(entry.ctx, entry.plan, emit=lines.append)
+        return ok, lines
+
+    all_ok = True
+    with ThreadPoolExecutor(max_workers=jobs or default_jobs()) as pool:
+        for entry, (ok, lines) in zip(planned, pool.map(check, planned)):
+            _print_project_lines(repo_root, entry.project, lines or ["OK"])
+            all_ok = all_ok and ok
+    return len(planned), all_ok
@@ -1,8 +1,30 @@
 from __future__ import annotations
 
+import fnmatch
+import hashlib
+import json
+import os
 import shutil
+import tempfile
+import zipfile
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Iterable
+
+from .config import SddKitConfig
+
+
+# Optional packed form of `skillpacks/<pack>/`: a zip next to the pack dir with a
+# JSON index stored first, so listing skills never scans the archive members.
+# File contents are stored once per sha256 (`blobs/<sha256>`), which folds the
+# duplicated trees (e.g. docx/ooxml == pptx/ooxml) into a single copy.
+ARCHIVE_SUFFIX = ".skillpack.zip"
+_ARCHIVE_INDEX = "skillpack.json"
+_ARCHIVE_VERSION = 2
+_ARCHIVE_IGNORES = {"__pycache__", ".DS_Store"}
+# Fixed member timestamp keeps archives byte-identical across rebuilds.
+_ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
 
 
 @dataclass(frozen=True)
@@ -40,6 +62,9 @@ def list_skillpack_skills(skillpack_dir: Path) -> list[SkillInfo]:
     skills_root = skillpack_dir / "skills"
     out: list[SkillInfo] = []
     if not skills_root.exists():
+        archive = skillpack_archive_path(skillpack_dir)
+        if archive.is_file():
+            return open_skillpack_archive(archive).skill_infos()
         return out
     for skill_file in sorted(skills_root.rglob("SKILL.md")):
         if not skill_file.is_file():
@@ -73,3 +98,192 @@ def import_codex_skills(*, kit_root: Path, pack_name: str, source_dir: Path) ->
         shutil.rmtree(dest)
     shutil.copytree(src, dest, dirs_exist_ok=False)
     print(f"Imported skills: {src} -> {dest}")
+
+
+def skillpack_archive_path(skillpack_dir: Path) -> Path:
+    return skillpack_dir.parent / f"{skillpack_dir.name}{ARCHIVE_SUFFIX}"
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def build_skillpack_archive(skillpack_dir: Path, out_path: Path | None = None) -> Path:
+    """Pack `skillpacks/<pack>/skills` into `skillpacks/<pack>.skillpack.zip`.
+
+    The index records every skill (dir, name, description) and its files
+    (path, sha256, size, mode), so readers can list skills and extract a single
+    skill without touching the rest of the archive.
+    """
+
+    skills_root = skillpack_dir / "skills"
+    if not skills_root.is_dir():
+        raise FileNotFoundError(f"Skillpack dir not found: {skills_root}")
+    out_path = out_path or skillpack_archive_path(skillpack_dir)
+
+    skills: list[dict[str, Any]] = []
+    blobs: dict[str, Path] = {}
+    for skill_dir in sorted({p.parent for p in skills_root.rglob("SKILL.md") if p.is_file()}):
+        rel_dir = skill_dir.relative_to(skills_root).as_posix()
+        name, desc = _parse_frontmatter((skill_dir / "SKILL.md").read_text(encoding="utf-8", errors="replace"))
+        files: list[list[Any]] = []
+        for dirpath, dirnames, filenames in os.walk(skill_dir):
+            dirnames[:] = sorted(d for d in dirnames if d not in _ARCHIVE_IGNORES)
+            for fname in sorted(filenames):
+                if fname in _ARCHIVE_IGNORES or fname.endswith((".pyc", ".pyo")):
+                    continue
+                path = Path(dirpath) / fname
+                rel = path.relative_to(skills_root).as_posix()
+                st = path.stat()
+                digest = _sha256_file(path)
+                files.append([rel, digest, st.st_size, st.st_mode & 0o777])
+                blobs.setdefault(digest, path)
+        skills.append({"dir": rel_dir, "name": name or rel_dir, "description": desc, "files": files})
+
+    index = {"version": _ARCHIVE_VERSION, "pack": skillpack_dir.name, "skills": skills}
+    fd, tmp = tempfile.mkstemp(prefix=f".{out_path.name}.", dir=str(out_path.parent))
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            info = zipfile.ZipInfo(_ARCHIVE_INDEX, date_time=_ZIP_EPOCH)
+            info.compress_type = zipfile.ZIP_STORED
+            zf.writestr(info, json.dumps(index, ensure_ascii=False, sort_keys=True))
+            for digest in sorted(blobs):
+                info = zipfile.ZipInfo(f"blobs/{digest}", date_time=_ZIP_EPOCH)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                zf.writestr(info, blobs[digest].read_bytes())
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, out_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return out_path
+
+
+@dataclass(frozen=True)
+class SkillpackStats:
+    skills: int
+    files: int
+    blobs: int
+    deduplicated_bytes: int
+
+
+class SkillpackArchive:
+    """Read-only view of a packed skillpack (see `build_skillpack_archive`)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with zipfile.ZipFile(path) as zf:
+            index = json.loads(zf.read(_ARCHIVE_INDEX))
+        if index.get("version") != _ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported skillpack archive version in {path}: {index.get('version')}")
+        self.pack: str = index["pack"]
+        self._skills: dict[str, dict[str, Any]] = {s["dir"]: s for s in index["skills"]}
+
+    def skill_dirs(self) -> list[str]:
+        return sorted(self._skills)
+
+    def stats(self) -> SkillpackStats:
+        files = 0
+        blobs: set[str] = set()
+        dedup_bytes = 0
+        for skill in self._skills.values():
+            for _rel, digest, size, _mode in skill["files"]:
+                files += 1
+                if digest in blobs:
+                    dedup_bytes += size
+                blobs.add(digest)
+        return SkillpackStats(skills=len(self._skills), files=files, blobs=len(blobs), deduplicated_bytes=dedup_bytes)
+
+    def skill_infos(self) -> list[SkillInfo]:
+        out = [
+            SkillInfo(
+                name=s["name"],
+                description=s["description"],
+                rel_path=str(Path("skillpacks") / self.pack / "skills" / s["dir"] / "SKILL.md"),
+            )
+            for s in self._skills.values()
+        ]
+        out.sort(key=lambda s: s.name.lower())
+        return out
+
+    def extract_skill(self, skill_dir: str, dest: Path) -> int:
+        """Extract one skill into `dest` (which must not exist), verifying file hashes.
+
+        Files are staged in a sibling temp dir and moved into place at the end,
+        so an interrupted or corrupt extraction never leaves a partial skill.
+        """
+
+        skill = self._skills[skill_dir]
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{dest.name}.", dir=str(dest.parent)))
+        os.chmod(staging, 0o755)  # mkdtemp creates 0700; match a regular copied skill dir.
+        prefix = f"{skill_dir}/"
+        try:
+            with zipfile.ZipFile(self.path) as zf:
+                for rel, digest, _size, mode in skill["files"]:
+                    data = zf.read(f"blobs/{digest}")
+                    if hashlib.sha256(data).hexdigest() != digest:
+                        raise ValueError(f"Hash mismatch for {rel} in {self.path}")
+                    out = staging / rel.removeprefix(prefix)
+                    out.parent.mkdir(parents=True, exist_ok=True)
+                    out.write_bytes(data)
+                    os.chmod(out, mode)
+            os.replace(staging, dest)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return len(skill["files"])
+
+
+def open_skillpack_archive(path: Path) -> SkillpackArchive:
+    # Keyed on mtime too, so a rebuilt archive is never served from a stale index.
+    return _open_skillpack_archive(path.resolve(), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _open_skillpack_archive(path: Path, mtime_ns: int) -> SkillpackArchive:
+    del mtime_ns
+    return SkillpackArchive(path)
+
+
+def resolve_skill_selection(cfg: SddKitConfig, *, patterns: list[str] | None, profile: str | None) -> tuple[str, ...] | None:
+    """Combine `--skills` globs with a named profile; None means "every skill in the pack".
+
+    Falls back to `skills.default_profile` when neither is given.
+    """
+
+    profiles = dict(cfg.skills_profiles)
+    name = profile or (cfg.skills_default_profile if not patterns else "")
+    selected: list[str] = []
+    if name:
+        if name not in profiles:
+            known = ", ".join(sorted(profiles)) or "none configured"
+            raise ValueError(f"Unknown skills profile: {name} (known: {known})")
+        selected += profiles[name]
+    for raw in patterns or []:
+        selected += [p.strip() for p in raw.split(",") if p.strip()]
+    return tuple(selected) if selected else None
+
+
+def select_skill_dirs(skill_dirs: Iterable[str], patterns: tuple[str, ...] | None) -> tuple[list[str], list[str]]:
+    """Filter skill dirs (pack-relative, posix) by globs matched against the dir or its basename.
+
+    Returns (selected, patterns that matched nothing).
+    """
+
+    dirs = list(skill_dirs)
+    if patterns is None:
+        return dirs, []
+    matched: set[str] = set()
+    unmatched: list[str] = []
+    for pattern in patterns:
+        hits = [d for d in dirs if fnmatch.fnmatchcase(d, pattern) or fnmatch.fnmatchcase(d.rsplit("/", 1)[-1], pattern)]
+        if not hits:
+            unmatched.append(pattern)
+        matched.update(hits)
+    return [d for d in dirs if d in matched], unmatched
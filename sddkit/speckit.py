@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
+from .gitmeta import read_head
+
 
 @dataclass(frozen=True)
 class SpeckitUpstream:
@@ -44,6 +48,22 @@ def ensure_speckit_upstream(kit_root: Path) -> SpeckitUpstream:
 
 
 def _describe_git_head(repo_root: Path) -> str:
+    """Return `<tag> (<sha7>)` or `<sha12>` for the checkout at `repo_root`.
+
+    HEAD is read in-process so sync/check do not spawn `git`; the CLI is only
+    used when the on-disk layout is not understood. Callers that need the label
+    repeatedly memoize the `SpeckitUpstream` for the run instead.
+    """
+
+    head = read_head(repo_root)
+    if head is not None:
+        if head.tags:
+            return f"{head.tags[0]} ({head.sha[:7]})"
+        return head.sha[:12]
+    return _describe_git_head_subprocess(repo_root)
+
+
+def _describe_git_head_subprocess(repo_root: Path) -> str:
     try:
         sha = (
             subprocess.run(
@@ -72,6 +92,73 @@ def _describe_git_head(repo_root: Path) -> str:
         return "unknown"
 
 
+def read_upstream_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Committed alongside the config so whoever bumps the pin gets a delta plan and report.
+UPSTREAM_LOCK_RELPATH = ".sddkit/speckit.lock.json"
+_UPSTREAM_LOCK_VERSION = 1
+
+
+@dataclass(frozen=True)
+class UpstreamLock:
+    """What the last `sync` installed from Spec Kit.
+
+    - pin: upstream version label at that time
+    - render_key: everything else that affects rendering (kit source digest, script variant, agents)
+    - sources: upstream path (relative to the upstream root) -> sha256
+    - targets: project path -> sha256 of the content written
+    """
+
+    pin: str
+    render_key: str
+    sources: dict[str, str]
+    targets: dict[str, str]
+
+
+def load_upstream_lock(project_root: Path) -> UpstreamLock | None:
+    try:
+        data = json.loads((project_root / UPSTREAM_LOCK_RELPATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _UPSTREAM_LOCK_VERSION:
+        return None
+    try:
+        return UpstreamLock(
+            pin=str(data["pin"]),
+            render_key=str(data["render_key"]),
+            sources=dict(data["sources"]),
+            targets=dict(data["targets"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def dump_upstream_lock(lock: UpstreamLock) -> str:
+    data = {
+        "version": _UPSTREAM_LOCK_VERSION,
+        "pin": lock.pin,
+        "render_key": lock.render_key,
+        "sources": lock.sources,
+        "targets": lock.targets,
+    }
+    return json.dumps(data, indent=2, sort_keys=True) + "\n"
+
+
+def diff_upstream_sources(old: dict[str, str], new: dict[str, str]) -> tuple[list[str], list[str], list[str]]:
+    """Return (changed, added, removed) upstream paths between two pins."""
+
+    changed = sorted(rel for rel, digest in new.items() if rel in old and old[rel] != digest)
+    added = sorted(rel for rel in new if rel not in old)
+    removed = sorted(rel for rel in old if rel not in new)
+    return changed, added, removed
+
+
 def list_template_files(upstream: SpeckitUpstream) -> list[Path]:
     base = upstream.root / "templates"
     out: list[Path] = []
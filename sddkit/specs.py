@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from .cache import cache_dir, load_json_cache, save_json_cache
+from .memory import _FENCE_RE
+
+
+_INDEX_VERSION = 2
+_INDEX_FILENAME = "specs_index.json"
+
+# Spec Kit feature dirs: `specs/001-some-feature/`.
+_SPECKIT_FEATURE_RE = re.compile(r"^\d{3,}-")
+_SPECKIT_FILES = ("spec.md", "plan.md", "tasks.md")
+# Legacy lifecycle layout: `specs/{pending,active,completed}/<spec>.(json|md)` or `<spec>/`.
+_LIFECYCLE_DIRS = ("pending", "active", "completed")
+_CHECKBOX_RE = re.compile(r"^\s*[-*+]\s+\[([ xX])\]\s*(.*)$")
+_MAX_OPEN_TASK_LEN = 160
+
+STATUSES = ("specified", "planned", "tasked", "in_progress", "done", *_LIFECYCLE_DIRS)
+
+
+@dataclass(frozen=True)
+class SpecEntry:
+    id: str
+    path: str  # relative to project root (posix)
+    layout: str  # speckit|lifecycle
+    status: str
+    tasks_total: int
+    tasks_done: int
+    open_tasks: tuple[str, ...]
+    mtime_ns: int
+
+
+def _parse_checkboxes(text: str) -> tuple[int, int, list[str]]:
+    total = 0
+    done = 0
+    open_tasks: list[str] = []
+    in_fence = False
+    for line in text.splitlines():
+        # Checkboxes inside fenced code blocks are examples, not tasks.
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        m = None if in_fence else _CHECKBOX_RE.match(line)
+        if not m:
+            continue
+        total += 1
+        if m.group(1) in {"x", "X"}:
+            done += 1
+        else:
+            open_tasks.append(m.group(2).strip()[:_MAX_OPEN_TASK_LEN])
+    return total, done, open_tasks
+
+
+def _parse_json_spec(path: Path) -> tuple[int, int]:
+    # Legacy JSON SDD specs keep rolled-up counts on the `spec-root` node.
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        root = data["hierarchy"]["spec-root"]
+        return int(root.get("total_tasks", 0)), int(root.get("completed_tasks", 0))
+    except (OSError, ValueError, KeyError, TypeError):
+        return 0, 0
+
+
+def _speckit_status(present: set[str], total: int, done: int) -> str:
+    if "tasks.md" in present:
+        if total and done == total:
+            return "done"
+        return "in_progress" if done else "tasked"
+    if "plan.md" in present:
+        return "planned"
+    return "specified"
+
+
+def _stat_fingerprint(paths: Iterable[Path]) -> list[list[int]]:
+    out: list[list[int]] = []
+    for p in paths:
+        try:
+            st = p.stat()
+        except OSError:
+            out.append([0, -1])
+            continue
+        out.append([st.st_mtime_ns, st.st_size])
+    return out
+
+
+class SpecsIndex:
+    """Incrementally maintained index of specs under `.sddkit/cache/`.
+
+    Covers both Spec Kit feature dirs (`specs/###-feature/{spec,plan,tasks}.md`)
+    and the legacy lifecycle layout (`specs/{pending,active,completed}/`).
+
+    A refresh only lists a container dir when its own mtime changed (entries
+    added/removed) and only re-parses an entry when its fingerprint (dir mtime
+    plus mtime/size of the files we read) changed. A `by_status` map is kept
+    alongside the entries so status filters are a dict lookup.
+    """
+
+    def __init__(self, project_root: Path, roots: list[str]) -> None:
+        self.project_root = project_root
+        self.roots = [r.strip("/") for r in roots if r.strip("/")]
+        self._path = project_root / ".sddkit" / "cache" / _INDEX_FILENAME
+        data = load_json_cache(self._path, version=_INDEX_VERSION)
+        if data is None or data.get("roots") != self.roots:
+            data = {"version": _INDEX_VERSION, "roots": self.roots, "containers": {}, "entries": {}, "by_status": {}}
+        self._data: dict[str, Any] = data
+        self._dirty = False
+
+    # --- refresh -----------------------------------------------------------
+
+    def _list_container(self, rel: str, *, want_dirs_only: bool) -> list[str]:
+        """Return child names of a container dir, re-listing only if its mtime changed."""
+
+        path = self.project_root / rel
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            if self._data["containers"].pop(rel, None) is not None:
+                self._dirty = True
+            return []
+        cached = self._data["containers"].get(rel)
+        if cached is not None and cached["mtime_ns"] == mtime_ns:
+            return list(cached["children"])
+        children: list[str] = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.startswith(".") or entry.name == "README.md":
+                    continue
+                if want_dirs_only and not entry.is_dir():
+                    continue
+                children.append(entry.name)
+        children.sort()
+        self._data["containers"][rel] = {"mtime_ns": mtime_ns, "children": children}
+        self._dirty = True
+        return children
+
+    def _refresh_entry(self, key: str, fingerprint: list[list[int]], build: Callable[[], SpecEntry]) -> bool:
+        cur = self._data["entries"].get(key)
+        if cur is not None and cur["fingerprint"] == fingerprint:
+            return False
+        entry = build()
+        record = asdict(entry)
+        record["open_tasks"] = list(entry.open_tasks)
+        record["fingerprint"] = fingerprint
+        self._data["entries"][key] = record
+        self._dirty = True
+        return True
+
+    def _build_speckit(self, rel: str, name: str) -> SpecEntry:
+        base = self.project_root / rel
+        present = {f for f in _SPECKIT_FILES if (base / f).is_file()}
+        total, done, open_tasks = 0, 0, []
+        if "tasks.md" in present:
+            total, done, open_tasks = _parse_checkboxes((base / "tasks.md").read_text(encoding="utf-8", errors="replace"))
+        mtimes = [(base / f).stat().st_mtime_ns for f in present] or [base.stat().st_mtime_ns]
+        return SpecEntry(
+            id=name,
+            path=rel,
+            layout="speckit",
+            status=_speckit_status(present, total, done),
+            tasks_total=total,
+            tasks_done=done,
+            open_tasks=tuple(open_tasks),
+            mtime_ns=max(mtimes),
+        )
+
+    def _build_lifecycle(self, rel: str, name: str, status: str) -> SpecEntry:
+        path = self.project_root / rel
+        total, done, open_tasks = 0, 0, []
+        if path.is_dir():
+            tasks = path / "tasks.md"
+            if tasks.is_file():
+                total, done, open_tasks = _parse_checkboxes(tasks.read_text(encoding="utf-8", errors="replace"))
+        elif path.suffix == ".json":
+            total, done = _parse_json_spec(path)
+        elif path.suffix == ".md":
+            total, done, open_tasks = _parse_checkboxes(path.read_text(encoding="utf-8", errors="replace"))
+        spec_id = name.removesuffix(".json").removesuffix(".md")
+        return SpecEntry(
+            id=spec_id,
+            path=rel,
+            layout="lifecycle",
+            status=status,
+            tasks_total=total,
+            tasks_done=done,
+            open_tasks=tuple(open_tasks),
+            mtime_ns=path.stat().st_mtime_ns,
+        )
+
+    def refresh(self) -> int:
+        """Bring the index up to date; returns the number of re-parsed entries."""
+
+        seen: set[str] = set()
+        updated = 0
+        for root in self.roots:
+            for name in self._list_container(root, want_dirs_only=True):
+                rel = f"{root}/{name}"
+                base = self.project_root / rel
+                if name in _LIFECYCLE_DIRS:
+                    for child in self._list_container(rel, want_dirs_only=False):
+                        child_rel = f"{rel}/{child}"
+                        child_path = self.project_root / child_rel
+                        watched = [child_path, child_path / "tasks.md"] if child_path.is_dir() else [child_path]
+                        seen.add(child_rel)
+                        updated += self._refresh_entry(
+                            child_rel,
+                            _stat_fingerprint(watched),
+                            lambda r=child_rel, n=child, s=name: self._build_lifecycle(r, n, s),
+                        )
+                    continue
+                if not _SPECKIT_FEATURE_RE.match(name):
+                    continue
+                seen.add(rel)
+                updated += self._refresh_entry(
+                    rel,
+                    _stat_fingerprint([base, *(base / f for f in _SPECKIT_FILES)]),
+                    lambda r=rel, n=name: self._build_speckit(r, n),
+                )
+
+        stale = [key for key in self._data["entries"] if key not in seen]
+        for key in stale:
+            del self._data["entries"][key]
+            self._dirty = True
+        if updated or stale:
+            by_status: dict[str, list[str]] = {}
+            for key in sorted(self._data["entries"]):
+                by_status.setdefault(self._data["entries"][key]["status"], []).append(key)
+            self._data["by_status"] = by_status
+        return updated
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        cache_dir(self.project_root)
+        save_json_cache(self._path, self._data)
+        self._dirty = False
+
+    # --- query -------------------------------------------------------------
+
+    def query(
+        self,
+        *,
+        statuses: list[str] | None = None,
+        open_only: bool = False,
+        id_prefix: str | None = None,
+    ) -> list[SpecEntry]:
+        entries = self._data["entries"]
+        if statuses:
+            keys = [k for s in statuses for k in self._data["by_status"].get(s, [])]
+        else:
+            keys = sorted(entries)
+        out: list[SpecEntry] = []
+        for key in keys:
+            rec = entries[key]
+            if open_only and rec["tasks_done"] >= rec["tasks_total"]:
+                continue
+            if id_prefix and not rec["id"].startswith(id_prefix):
+                continue
+            out.append(
+                SpecEntry(
+                    id=rec["id"],
+                    path=rec["path"],
+                    layout=rec["layout"],
+                    status=rec["status"],
+                    tasks_total=rec["tasks_total"],
+                    tasks_done=rec["tasks_done"],
+                    open_tasks=tuple(rec["open_tasks"]),
+                    mtime_ns=rec["mtime_ns"],
+                )
+            )
+        return out
@@ -1,19 +1,38 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import re
 import shutil
 import subprocess
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 from . import __version__
+from .cache import CACHE_DIRNAME, cache_dir, load_json_cache, save_json_cache
 from .config import SddKitConfig
+from .detect import detect_project
+from .gitmeta import find_git_dir, index_checksum
 from .managed import MANAGED_MARKER, ManagedFile, is_managed_file, managed_header
-from .speckit import ensure_speckit_upstream, generate_command_prompt, list_command_templates, list_script_files, list_template_files
-from .skills import list_skillpack_skills
-from .templates import list_template_names, load_template, render_template
+from .speckit import (
+    UPSTREAM_LOCK_RELPATH,
+    SpeckitUpstream,
+    UpstreamLock,
+    content_hash,
+    diff_upstream_sources,
+    dump_upstream_lock,
+    ensure_speckit_upstream,
+    generate_command_prompt,
+    list_command_templates,
+    list_script_files,
+    list_template_files,
+    load_upstream_lock,
+    read_upstream_text,
+)
+from .skills import SkillInfo, list_skillpack_skills, open_skillpack_archive, select_skill_dirs, skillpack_archive_path
+from .templates import TemplateData, list_template_names, load_template, render_template
 
 
 @dataclass(frozen=True)
@@ -43,6 +62,14 @@ class PlannedCopyDir:
     reason: str
 
 
+@dataclass(frozen=True)
+class PlannedExtractSkill:
+    archive: Path
+    skill_dir: str
+    target: Path
+    reason: str
+
+
 @dataclass(frozen=True)
 class PlannedEnsureExists:
     target: Path
@@ -51,7 +78,16 @@ class PlannedEnsureExists:
     mode: int | None = None
 
 
-PlanItem = PlannedWrite | PlannedSkip | PlannedUnmanaged | PlannedCopyDir | PlannedEnsureExists
+@dataclass(frozen=True)
+class PlannedUpstreamLock:
+    target: Path
+    content: str
+    report: tuple[str, ...]
+
+
+PlanItem = (
+    PlannedWrite | PlannedSkip | PlannedUnmanaged | PlannedCopyDir | PlannedExtractSkill | PlannedEnsureExists | PlannedUpstreamLock
+)
 
 
 def _kit_root() -> Path:
@@ -59,6 +95,29 @@ def _kit_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+def _kit_source_files(kit_root: Path) -> list[Path]:
+    """Kit code and bundled templates: everything that shapes rendered output."""
+
+    paths: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(kit_root / "sddkit"):
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        paths.extend(Path(dirpath) / name for name in sorted(filenames))
+    return paths
+
+
+def _kit_source_digest(kit_root: Path) -> str:
+    # The kit is pinned by commit, so `__version__` alone misses rendering changes.
+    h = hashlib.sha256()
+    for p in _kit_source_files(kit_root):
+        h.update(p.relative_to(kit_root).as_posix().encode("utf-8") + b"\0")
+        try:
+            h.update(p.read_bytes())
+        except OSError:
+            pass
+        h.update(b"\0")
+    return h.hexdigest()
+
+
 def _project_rel(p: Path, root: Path) -> str:
     try:
         return str(p.relative_to(root))
@@ -171,41 +230,146 @@ _DEFAULT_REPO_DIR_IGNORES = {
 }
 
 
-def _discover_top_level_dirs(project_root: Path, cfg: SddKitConfig | None = None) -> list[str]:
-    names: set[str] = set()
+# Files that mark a module/package root in the depth-N repo map, with the label shown.
+_MODULE_MARKERS = {
+    "pyproject.toml": "python",
+    "setup.py": "python",
+    "package.json": "node",
+    "go.mod": "go",
+    "Cargo.toml": "rust",
+    "pom.xml": "java",
+    "build.gradle": "gradle",
+    "build.gradle.kts": "gradle",
+    "composer.json": "php",
+    "Gemfile": "ruby",
+    "mix.exs": "elixir",
+}
+_MAX_REPO_MAP_MODULES = 200
+_REPO_INDEX_CACHE = "repo_map.json"
+_REPO_INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class RepoIndex:
+    top_level: tuple[str, ...]  # top-level dirs that contain tracked files
+    modules: tuple[tuple[str, tuple[str, ...]], ...]  # (module root dir, marker labels), sorted
+    # Non-git walk only: dirs whose listing the result depends on (relative, posix).
+    walked_dirs: tuple[str, ...] = ()
+
+
+def _module_path_ignored(parts: list[str]) -> bool:
+    return any(part in _DEFAULT_REPO_DIR_IGNORES or part.startswith(".") for part in parts)
+
+
+def _index_tracked_paths(paths: Iterable[str], *, depth: int) -> RepoIndex:
+    """Derive top-level dirs and module roots (up to `depth` levels) in one pass over paths."""
+
+    top: set[str] = set()
+    modules: dict[str, set[str]] = {}
+    for path in paths:
+        if "/" not in path:
+            continue
+        parts = path.split("/")
+        top.add(parts[0])
+        label = _MODULE_MARKERS.get(parts[-1])
+        if label is None or len(parts) - 1 > depth or _module_path_ignored(parts[:-1]):
+            continue
+        modules.setdefault("/".join(parts[:-1]), set()).add(label)
+    return RepoIndex(
+        top_level=tuple(sorted(top)),
+        modules=tuple((d, tuple(sorted(labels))) for d, labels in sorted(modules.items())),
+    )
+
+
+def _git_repo_index(project_root: Path, depth: int) -> RepoIndex | None:
+    """Index `git ls-files`, cached in `.sddkit/cache/` per git index checksum.
+
+    The index checksum is a content hash of the staged tree, so an unchanged
+    checkout reuses the previous result without spawning git or re-scanning
+    every tracked path.
+    """
+
+    if not (project_root / ".git").exists():
+        return None
+    git_dir = find_git_dir(project_root)
+    checksum = index_checksum(git_dir) if git_dir is not None else None
+    cache_path = project_root / CACHE_DIRNAME / _REPO_INDEX_CACHE
+    key = {"index": checksum, "depth": depth, "markers": sorted(_MODULE_MARKERS)}
+    if checksum is not None:
+        data = load_json_cache(cache_path, version=_REPO_INDEX_VERSION)
+        if data is not None and data.get("key") == key:
+            return RepoIndex(
+                top_level=tuple(data["top_level"]),
+                modules=tuple((d, tuple(labels)) for d, labels in data["modules"]),
+            )
 
-    # Prefer git-tracked paths so local untracked build/artifact dirs don't cause drift.
     try:
-        if (project_root / ".git").exists():
-            raw = subprocess.run(
-                ["git", "ls-files", "-z"],
-                cwd=str(project_root),
-                check=True,
-                capture_output=True,
-            ).stdout
-            for part in raw.split(b"\x00"):
-                if not part:
-                    continue
-                try:
-                    p = part.decode("utf-8", errors="ignore")
-                except Exception:
-                    continue
-                if "/" not in p:
-                    continue
-                top = p.split("/", 1)[0]
-                names.add(top)
+        raw = subprocess.run(
+            ["git", "ls-files", "-z"],
+            cwd=str(project_root),
+            check=True,
+            capture_output=True,
+        ).stdout
     except Exception:
-        # Fall back to filesystem discovery.
-        pass
+        return None
+    index = _index_tracked_paths((part.decode("utf-8", errors="ignore") for part in raw.split(b"\x00") if part), depth=depth)
+    if checksum is not None:
+        try:
+            cache_dir(project_root)
+            save_json_cache(
+                cache_path,
+                {
+                    "version": _REPO_INDEX_VERSION,
+                    "key": key,
+                    "top_level": list(index.top_level),
+                    "modules": [[d, list(labels)] for d, labels in index.modules],
+                },
+            )
+        except OSError:
+            # Read-only checkouts still get a correct (uncached) map.
+            pass
+    return index
+
 
+def _walk_repo_index(project_root: Path, depth: int) -> RepoIndex:
+    """Filesystem fallback for non-git projects (includes untracked dirs)."""
+
+    try:
+        top = sorted(p.name for p in project_root.iterdir() if p.is_dir())
+    except Exception:
+        return RepoIndex(top_level=(), modules=())
+    if depth <= 1:
+        return RepoIndex(top_level=tuple(top), modules=())
+    paths: list[str] = []
+    walked: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        rel = Path(dirpath).relative_to(project_root).as_posix()
+        level = 0 if rel == "." else rel.count("/") + 1
+        if level >= depth:
+            dirnames[:] = []
+        else:
+            dirnames[:] = [d for d in dirnames if d not in _DEFAULT_REPO_DIR_IGNORES and not d.startswith(".")]
+        walked.append(rel)
+        if level:
+            paths += [f"{rel}/{name}" for name in filenames if name in _MODULE_MARKERS]
+    index = _index_tracked_paths(paths, depth=depth)
+    return RepoIndex(top_level=tuple(top), modules=index.modules, walked_dirs=tuple(walked))
+
+
+def _discover_repo_index(project_root: Path, depth: int) -> RepoIndex:
+    # Prefer git-tracked paths so local untracked build/artifact dirs don't cause drift.
+    index = _git_repo_index(project_root, depth)
+    if index is None or not index.top_level:
+        return _walk_repo_index(project_root, depth)
+    return index
+
+
+def _discover_top_level_dirs(project_root: Path, cfg: SddKitConfig | None = None, repo_index: RepoIndex | None = None) -> list[str]:
+    if repo_index is None:
+        repo_index = _discover_repo_index(project_root, cfg.repo_map_depth if cfg is not None else 1)
+    names: set[str] = set(repo_index.top_level)
     if not names:
-        try:
-            for p in project_root.iterdir():
-                if not p.is_dir():
-                    continue
-                names.add(p.name)
-        except Exception:
-            return []
+        return []
 
     # Include directories that are expected to exist after `sync` based on config,
     # so AGENTS.md is deterministic on first bootstrap (before scaffolds exist).
@@ -230,8 +394,8 @@ def _discover_top_level_dirs(project_root: Path, cfg: SddKitConfig | None = None
     return out
 
 
-def _describe_dir(name: str) -> str:
-    hint = {
+def _dir_hint(name: str) -> str | None:
+    return {
         "src": "application/source code",
         "app": "application entrypoint(s)",
         "apps": "application entrypoint(s)",
@@ -254,7 +418,11 @@ def _describe_dir(name: str) -> str:
         "examples": "examples",
         "meta": "process docs and meta artifacts",
     }.get(name)
-    return f" ({hint})" if hint else ""
+
+
+def _describe_dir(name: str, labels: tuple[str, ...] = ()) -> str:
+    parts = [p for p in (_dir_hint(name), ", ".join(labels)) if p]
+    return f" ({'; '.join(parts)})" if parts else ""
 
 
 def _discover_docs_links(project_root: Path, cfg: SddKitConfig) -> list[str]:
@@ -300,19 +468,40 @@ def _discover_docs_links(project_root: Path, cfg: SddKitConfig) -> list[str]:
     return unique
 
 
-def _render_repo_map_section(project_root: Path, cfg: SddKitConfig | None = None) -> str:
-    dirs = _discover_top_level_dirs(project_root, cfg)
+def _render_repo_map_section(ctx: ProjectContext) -> str:
+    dirs = ctx.top_level_dirs
     if not dirs:
         return ""
     lines = ["## Repository map (auto)", ""]
+    if ctx.cfg.repo_map_depth <= 1:
+        for d in dirs:
+            lines.append(f"- `{d}/`{_describe_dir(d)}")
+        lines.append("")
+        return "\n".join(lines)
+
+    # Depth-N: annotate top-level module roots and nest deeper ones under their top-level dir.
+    modules = dict(ctx.repo_index.modules)
+    nested: dict[str, list[str]] = {}
+    for module in modules:
+        if "/" in module:
+            nested.setdefault(module.split("/", 1)[0], []).append(module)
+    shown = 0
     for d in dirs:
-        lines.append(f"- `{d}/`{_describe_dir(d)}")
+        lines.append(f"- `{d}/`{_describe_dir(d, modules.get(d, ()))}")
+        for module in nested.get(d, []):
+            if shown >= _MAX_REPO_MAP_MODULES:
+                break
+            lines.append(f"  - `{module}/` ({', '.join(modules[module])})")
+            shown += 1
+    hidden = sum(len(v) for k, v in nested.items() if k in dirs) - shown
+    if hidden > 0:
+        lines.append(f"- … {hidden} more module roots not shown")
     lines.append("")
     return "\n".join(lines)
 
 
-def _render_docs_index_section(project_root: Path, cfg: SddKitConfig) -> str:
-    docs = _discover_docs_links(project_root, cfg)
+def _render_docs_index_section(ctx: ProjectContext) -> str:
+    docs = ctx.docs_links
     if not docs:
         return ""
     lines = ["## Docs index (auto)", ""]
@@ -335,10 +524,156 @@ def _render_memory_bank_section(project_root: Path, cfg: SddKitConfig) -> str:
     )
 
 
-def _render_agents_auto_fragment(*, project_root: Path, cfg: SddKitConfig, detection: dict[str, str]) -> str:
-    cmds = _infer_commands(detection)
-    repo_map = _render_repo_map_section(project_root, cfg)
-    docs_index = _render_docs_index_section(project_root, cfg)
+class ProjectContext:
+    """Run-scoped discovery results for one project.
+
+    Detection, inferred commands, the repo map and the docs index are computed
+    lazily and at most once, then shared by every renderer (AGENTS.md, the Spec
+    Kit auto fragment, scaffold templates) during a single CLI invocation.
+    """
+
+    def __init__(self, run: RunContext, project_root: Path, cfg: SddKitConfig, detection: dict[str, str]) -> None:
+        self.run = run
+        self.project_root = project_root
+        self.cfg = cfg
+        self.detection = detection
+
+    @cached_property
+    def commands(self) -> dict[str, str]:
+        return _infer_commands(self.detection)
+
+    @cached_property
+    def repo_index(self) -> RepoIndex:
+        return _discover_repo_index(self.project_root, max(1, self.cfg.repo_map_depth))
+
+    @cached_property
+    def top_level_dirs(self) -> list[str]:
+        return _discover_top_level_dirs(self.project_root, self.cfg, self.repo_index)
+
+    @cached_property
+    def docs_links(self) -> list[str]:
+        return _discover_docs_links(self.project_root, self.cfg)
+
+    @cached_property
+    def agents_auto_fragment(self) -> str:
+        return _render_agents_auto_fragment(self)
+
+
+class RunContext:
+    """Caches shared across all projects handled by one CLI invocation."""
+
+    def __init__(self) -> None:
+        self._projects: dict[tuple[Path, SddKitConfig, tuple[tuple[str, str], ...]], ProjectContext] = {}
+        self._skillpacks: dict[Path, list[SkillInfo]] = {}
+        self._detections: dict[Path, dict[str, str]] = {}
+        self._templates: dict[tuple[str, str], TemplateData] = {}
+        self._template_names: dict[tuple[str, str], list[str]] = {}
+        self._upstreams: dict[Path, SpeckitUpstream] = {}
+        self._upstream_listings: dict[tuple[SpeckitUpstream, str], list[Path]] = {}
+        self._upstream_texts: dict[Path, str] = {}
+        self._upstream_hashes: dict[Path, str] = {}
+        self._kit_digests: dict[Path, str] = {}
+
+    def detection(self, project_root: Path) -> dict[str, str]:
+        key = project_root.resolve()
+        detection = self._detections.get(key)
+        if detection is None:
+            detection = detect_project(project_root)
+            self._detections[key] = detection
+        return detection
+
+    def project(self, project_root: Path, cfg: SddKitConfig, detection: dict[str, str]) -> ProjectContext:
+        key = (project_root.resolve(), cfg, tuple(sorted(detection.items())))
+        ctx = self._projects.get(key)
+        if ctx is None:
+            ctx = ProjectContext(self, project_root, cfg, detection)
+            self._projects[key] = ctx
+        return ctx
+
+    def skillpack_skills(self, skillpack_dir: Path) -> list[SkillInfo]:
+        key = skillpack_dir.resolve()
+        skills = self._skillpacks.get(key)
+        if skills is None:
+            skills = list_skillpack_skills(skillpack_dir)
+            self._skillpacks[key] = skills
+        return skills
+
+    def kit_digest(self, kit_root: Path) -> str:
+        key = kit_root.resolve()
+        digest = self._kit_digests.get(key)
+        if digest is None:
+            digest = _kit_source_digest(kit_root)
+            self._kit_digests[key] = digest
+        return digest
+
+    def template(self, locale: str, name: str) -> TemplateData:
+        key = (locale, name)
+        tpl = self._templates.get(key)
+        if tpl is None:
+            tpl = load_template(locale, name)
+            self._templates[key] = tpl
+        return tpl
+
+    def template_names(self, locale: str, root: str) -> list[str]:
+        key = (locale, root)
+        names = self._template_names.get(key)
+        if names is None:
+            names = list_template_names(locale, root)
+            self._template_names[key] = names
+        return names
+
+    def speckit_upstream(self, kit_root: Path) -> SpeckitUpstream:
+        key = kit_root.resolve()
+        upstream = self._upstreams.get(key)
+        if upstream is None:
+            upstream = ensure_speckit_upstream(kit_root)
+            self._upstreams[key] = upstream
+        return upstream
+
+    def speckit_templates(self, upstream: SpeckitUpstream) -> list[Path]:
+        key = (upstream, "templates")
+        paths = self._upstream_listings.get(key)
+        if paths is None:
+            paths = list_template_files(upstream)
+            self._upstream_listings[key] = paths
+        return paths
+
+    def speckit_scripts(self, upstream: SpeckitUpstream, script_variant: str) -> list[Path]:
+        key = (upstream, f"scripts/{script_variant}")
+        paths = self._upstream_listings.get(key)
+        if paths is None:
+            paths = list_script_files(upstream, script_variant)
+            self._upstream_listings[key] = paths
+        return paths
+
+    def speckit_commands(self, upstream: SpeckitUpstream) -> list[Path]:
+        key = (upstream, "commands")
+        paths = self._upstream_listings.get(key)
+        if paths is None:
+            paths = list_command_templates(upstream)
+            self._upstream_listings[key] = paths
+        return paths
+
+    def upstream_text(self, path: Path) -> str:
+        text = self._upstream_texts.get(path)
+        if text is None:
+            text = read_upstream_text(path)
+            self._upstream_texts[path] = text
+        return text
+
+    def upstream_hash(self, path: Path) -> str:
+        digest = self._upstream_hashes.get(path)
+        if digest is None:
+            digest = content_hash(self.upstream_text(path))
+            self._upstream_hashes[path] = digest
+        return digest
+
+
+def _render_agents_auto_fragment(ctx: ProjectContext) -> str:
+    cfg = ctx.cfg
+    cmds = ctx.commands
+    repo_map = _render_repo_map_section(ctx)
+    docs_index = _render_docs_index_section(ctx)
 
     lines = [
         "# Auto context (generated by sdd-kit)",
@@ -359,23 +694,24 @@ def _render_agents_auto_fragment(*, project_root: Path, cfg: SddKitConfig, detec
     return "\n".join(lines).rstrip() + "\n"
 
 
-def _render_agents_md(*, project_root: Path, kit_root: Path, cfg: SddKitConfig, detection: dict[str, str], locale: str) -> str:
+def _render_agents_md(*, ctx: ProjectContext, kit_root: Path, locale: str) -> str:
     # AGENTS.md is intentionally English-only across locales for consistency.
-    tpl = load_template("en", "agents/AGENTS.md.tmpl").text
+    tpl = ctx.run.template("en", "agents/AGENTS.md.tmpl").text
+    project_root, cfg, detection = ctx.project_root, ctx.cfg, ctx.detection
 
     skillpack_dir = kit_root / "skillpacks" / cfg.skills_default_pack
-    skills = list_skillpack_skills(skillpack_dir)
+    skills = ctx.run.skillpack_skills(skillpack_dir)
     skills_lines = []
     for s in skills:
         # Keep it one line per skill to reduce churn.
         skills_lines.append(f"- {s.name}: {s.description} (file: {s.rel_path})")
     skills_block = "\n".join(skills_lines) if skills_lines else "- (no skillpack found; run `sdd-kit import-codex-skills` in the kit repo)"
 
-    cmds = _infer_commands(detection)
+    cmds = ctx.commands
     memory_bank_root = cfg.memory_bank_root.strip("/").rstrip("/") or "meta/memory_bank"
     memory_bank_section = _render_memory_bank_section(project_root, cfg)
-    repo_map_section = _render_repo_map_section(project_root, cfg)
-    docs_index_section = _render_docs_index_section(project_root, cfg)
+    repo_map_section = _render_repo_map_section(ctx)
+    docs_index_section = _render_docs_index_section(ctx)
 
     data = {
         "kit_version": __version__,
@@ -409,13 +745,13 @@ def _render_agents_md(*, project_root: Path, kit_root: Path, cfg: SddKitConfig,
     return rendered
 
 
-def _render_docs_template(locale: str, name: str, data: dict[str, str]) -> str:
-    tpl = load_template(locale, f"docs/templates/{name}.tmpl").text
+def _render_docs_template(run: RunContext, locale: str, name: str, data: dict[str, str]) -> str:
+    tpl = run.template(locale, f"docs/templates/{name}.tmpl").text
     return render_template(tpl, data)
 
 
-def _render_workflow(locale: str, cfg: SddKitConfig, detection: dict[str, str]) -> str:
-    tpl = load_template(locale, "github/workflows/sdd-kit-check.yml.tmpl").text
+def _render_workflow(run: RunContext, locale: str, cfg: SddKitConfig, detection: dict[str, str]) -> str:
+    tpl = run.template(locale, "github/workflows/sdd-kit-check.yml.tmpl").text
     return render_template(
         tpl,
         {
@@ -657,31 +993,144 @@ def _default_agents_manual_overlay(cfg: SddKitConfig) -> str:
     return "\n".join(lines) + "\n"
 
 
-def _plan_speckit_installer(*, project_root: Path, kit_root: Path, cfg: SddKitConfig) -> list[PlanItem]:
+def _speckit_render_key(run: RunContext, kit_root: Path, cfg: SddKitConfig) -> str:
+    # Anything besides upstream content that changes how derived targets render.
+    agents = ",".join(_parse_speckit_agents(cfg.speckit_agent))
+    return f"kit={run.kit_digest(kit_root)};script={cfg.speckit_script_variant};agents={agents}"
+
+
+class _SpeckitDelta:
+    """Tracks upstream source -> derived target hashes while planning the installer.
+
+    Given the lock from the previous sync (with the same render key), a target
+    whose upstream source is unchanged and whose on-disk content still matches
+    the recorded hash is skipped without re-rendering. Everything else is
+    planned as usual, so local drift is still repaired. With `reuse_lock=False`
+    (drift checks) every target is rendered and the lock is only recorded.
+    """
+
+    def __init__(
+        self,
+        run: RunContext,
+        project_root: Path,
+        kit_root: Path,
+        upstream: SpeckitUpstream,
+        cfg: SddKitConfig,
+        *,
+        reuse_lock: bool = True,
+    ) -> None:
+        self.run = run
+        self.project_root = project_root
+        self.upstream = upstream
+        self.render_key = _speckit_render_key(run, kit_root, cfg)
+        self.previous = load_upstream_lock(project_root)
+        self._reusable = reuse_lock and self.previous is not None and self.previous.render_key == self.render_key
+        self.sources: dict[str, str] = {}
+        self.targets: dict[str, str] = {}
+
+    def source(self, src: Path) -> str:
+        rel = src.relative_to(self.upstream.root).as_posix()
+        self.sources[rel] = self.run.upstream_hash(src)
+        return rel
+
+    def _target_rel(self, target: Path) -> str:
+        try:
+            return target.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return target.as_posix()
+
+    def unchanged(self, target: Path, src_rel: str) -> bool:
+        if not self._reusable:
+            return False
+        assert self.previous is not None
+        rel = self._target_rel(target)
+        recorded = self.previous.targets.get(rel)
+        if recorded is None or self.previous.sources.get(src_rel) != self.sources[src_rel]:
+            return False
+        try:
+            actual = target.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return False
+        if content_hash(actual) != recorded:
+            return False
+        self.targets[rel] = recorded
+        return True
+
+    def rendered(self, target: Path, content: str) -> None:
+        self.targets[self._target_rel(target)] = content_hash(content)
+
+    def report(self) -> tuple[str, ...]:
+        prev = self.previous
+        if prev is None:
+            return ()
+        changed, added, removed = diff_upstream_sources(prev.sources, self.sources)
+        if prev.pin == self.upstream.version_label and not (changed or added or removed):
+            return ()
+        lines = [
+            f"UPSTREAM spec-kit {prev.pin} -> {self.upstream.version_label}: "
+            f"{len(changed)} changed, {len(added)} added, {len(removed)} removed"
+        ]
+        lines += [f"  ~ {rel}" for rel in changed]
+        lines += [f"  + {rel}" for rel in added]
+        lines += [f"  - {rel}" for rel in removed]
+        return tuple(lines)
+
+    def lock_item(self) -> PlannedUpstreamLock:
+        lock = UpstreamLock(
+            pin=self.upstream.version_label,
+            render_key=self.render_key,
+            sources=dict(sorted(self.sources.items())),
+            targets=dict(sorted(self.targets.items())),
+        )
+        return PlannedUpstreamLock(
+            target=self.project_root / UPSTREAM_LOCK_RELPATH,
+            content=dump_upstream_lock(lock),
+            report=self.report(),
+        )
+
+
+def _plan_speckit_installer(
+    *,
+    run: RunContext,
+    project_root: Path,
+    kit_root: Path,
+    cfg: SddKitConfig,
+    reuse_lock: bool = True,
+) -> list[PlanItem]:
     if not cfg.manage_speckit:
         return []
 
-    upstream = ensure_speckit_upstream(kit_root)
+    upstream = run.speckit_upstream(kit_root)
+    delta = _SpeckitDelta(run, project_root, kit_root, upstream, cfg, reuse_lock=reuse_lock)
     plan: list[PlanItem] = []
 
     # .specify/templates/*
-    for src in list_template_files(upstream):
+    for src in run.speckit_templates(upstream):
+        src_rel = delta.source(src)
         rel = src.relative_to(upstream.root / "templates")
         target = project_root / ".specify" / "templates" / rel
-        body = src.read_text(encoding="utf-8", errors="replace")
+        if delta.unchanged(target, src_rel):
+            plan.append(PlannedSkip(target=target, reason="upstream unchanged"))
+            continue
+        body = run.upstream_text(src)
         content = managed_header("markdown", f"speckit/templates/{rel.as_posix()}") + body
         if target.exists() and cfg.safe_mode and not is_managed_file(target):
             plan.append(PlannedUnmanaged(target=target, reason="exists but is not managed (safe_mode)"))
             continue
         reason = "create" if not target.exists() else ("update (managed)" if is_managed_file(target) else "update")
         plan.append(PlannedWrite(target=target, content=content, reason=reason))
+        delta.rendered(target, content)
 
     # .specify/scripts/{bash|powershell}/*
     scripts_subdir = "bash" if cfg.speckit_script_variant == "sh" else "powershell"
-    for src in list_script_files(upstream, cfg.speckit_script_variant):
+    for src in run.speckit_scripts(upstream, cfg.speckit_script_variant):
+        src_rel = delta.source(src)
         rel = src.relative_to(upstream.root / "scripts" / scripts_subdir)
         target = project_root / ".specify" / "scripts" / scripts_subdir / rel
-        body = src.read_text(encoding="utf-8", errors="replace")
+        if delta.unchanged(target, src_rel):
+            plan.append(PlannedSkip(target=target, reason="upstream unchanged"))
+            continue
+        body = run.upstream_text(src)
         content = _inject_managed_into_shell_script(body, f"speckit/scripts/{scripts_subdir}/{rel.as_posix()}")
         mode = 0o755 if (cfg.speckit_script_variant == "sh" and target.suffix == ".sh") else None
         if target.exists() and cfg.safe_mode and not is_managed_file(target):
@@ -689,10 +1138,11 @@ def _plan_speckit_installer(*, project_root: Path, kit_root: Path, cfg: SddKitCo
             continue
         reason = "create" if not target.exists() else ("update (managed)" if is_managed_file(target) else "update")
         plan.append(PlannedWrite(target=target, content=content, reason=reason, mode=mode))
+        delta.rendered(target, content)
 
     # Ensure constitution exists, but never enforce its content (users can customize it).
     const_src = upstream.root / "templates" / "constitution-template.md"
-    const_body = const_src.read_text(encoding="utf-8", errors="replace") if const_src.exists() else ""
+    const_body = run.upstream_text(const_src) if const_src.exists() else ""
     plan.append(
         PlannedEnsureExists(
             target=project_root / ".specify" / "memory" / "constitution.md",
@@ -703,7 +1153,7 @@ def _plan_speckit_installer(*, project_root: Path, kit_root: Path, cfg: SddKitCo
 
     # License/attribution notice for vendored Spec Kit content installed into the project.
     lic_src = upstream.root / "LICENSE"
-    lic_text = lic_src.read_text(encoding="utf-8", errors="replace") if lic_src.exists() else ""
+    lic_text = run.upstream_text(lic_src) if lic_src.exists() else ""
     notice_body = (
         "# Third-Party Notices\n\n"
         "This project includes Spec Kit-derived templates and scripts installed by sdd-workflow-kit.\n\n"
@@ -735,9 +1185,17 @@ def _plan_speckit_installer(*, project_root: Path, kit_root: Path, cfg: SddKitCo
         else:
             out_dir = project_root / ".claude" / "commands"
 
-        for src in list_command_templates(upstream):
+        for src in run.speckit_commands(upstream):
             name = src.stem
-            template_text = src.read_text(encoding="utf-8", errors="replace")
+            src_rel = delta.source(src)
+            if agent == "codex":
+                target = out_root / f"speckit-{name}" / "SKILL.md"
+            else:
+                target = out_dir / f"speckit.{name}.md"
+            if delta.unchanged(target, src_rel):
+                plan.append(PlannedSkip(target=target, reason="upstream unchanged"))
+                continue
+            template_text = run.upstream_text(src)
             prompt = generate_command_prompt(
                 template_text,
                 script_variant=cfg.speckit_script_variant,
@@ -750,18 +1208,17 @@ def _plan_speckit_installer(*, project_root: Path, kit_root: Path, cfg: SddKitCo
                     prompt_body=prompt,
                     template=f"speckit/commands/{name}.md",
                 )
-                target = out_root / f"speckit-{name}" / "SKILL.md"
             else:
                 prompt = _inject_managed_into_prompt_frontmatter(prompt, f"speckit/commands/{name}.md")
-                target = out_dir / f"speckit.{name}.md"
             if target.exists() and cfg.safe_mode and not is_managed_file(target):
                 plan.append(PlannedUnmanaged(target=target, reason="exists but is not managed (safe_mode)"))
                 continue
             reason = "create" if not target.exists() else ("update (managed)" if is_managed_file(target) else "update")
             plan.append(PlannedWrite(target=target, content=prompt, reason=reason))
+            delta.rendered(target, prompt)
 
         # Overlay commands (not part of upstream spec-kit). Kept separate so upstream updates stay clean.
-        overlay_tmpl = load_template("en", "speckit/commands/planreview.md.tmpl").text
+        overlay_tmpl = run.template("en", "speckit/commands/planreview.md.tmpl").text
         overlay_body = render_template(
             overlay_tmpl,
             {
@@ -819,6 +1276,7 @@ def _plan_speckit_installer(*, project_root: Path, kit_root: Path, cfg: SddKitCo
             )
         )
 
+    plan.append(delta.lock_item())
     return plan
 
 
@@ -863,10 +1321,8 @@ def _compose_agents_manual_fragment(*, auto_fragment: str, team_fragment: str) -
 
 def _plan_from_template_tree(
     *,
-    project_root: Path,
+    ctx: ProjectContext,
     kit_root: Path,
-    cfg: SddKitConfig,
-    detection: dict[str, str],
     locale: str,
     template_root: str,
     dest_root: str,
@@ -876,10 +1332,11 @@ def _plan_from_template_tree(
 ) -> list[PlanItem]:
     # template_root is relative to templates locale root, e.g. "scaffolds/memory_bank"
     # dest_root is relative to project root, e.g. "meta/memory_bank"
+    project_root, cfg, detection = ctx.project_root, ctx.cfg, ctx.detection
     dest_root = dest_root.strip("/").rstrip("/")
-    names = list_template_names(locale, template_root)
+    names = ctx.run.template_names(locale, template_root)
 
-    cmds = _infer_commands(detection)
+    cmds = ctx.commands
     data = {
         "kit_version": __version__,
         "project_name": cfg.project_name,
@@ -907,7 +1364,7 @@ def _plan_from_template_tree(
         out_rel = rel_inside.removesuffix(".tmpl")
         target = project_root / dest_root / out_rel
 
-        tmpl = load_template(locale, name).text
+        tmpl = ctx.run.template(locale, name).text
         body = render_template(tmpl, data)
 
         if ensure_only:
@@ -940,7 +1397,8 @@ def _plan_from_template_tree(
     return plan
 
 
-def _plan_writes(project_root: Path, kit_root: Path, cfg: SddKitConfig, detection: dict[str, str], locale: str) -> list[PlanItem]:
+def _plan_writes(ctx: ProjectContext, kit_root: Path, locale: str, *, reuse_lock: bool = True) -> list[PlanItem]:
+    project_root, cfg, detection = ctx.project_root, ctx.cfg, ctx.detection
     plan: list[PlanItem] = []
 
     docs_root = cfg.docs_root.strip("/").rstrip("/") or "docs"
@@ -981,29 +1439,29 @@ def _plan_writes(project_root: Path, kit_root: Path, cfg: SddKitConfig, detectio
     for mf in managed:
         target = project_root / mf.relpath
         if mf.relpath == "AGENTS.md":
-            body = _render_agents_md(project_root=project_root, kit_root=kit_root, cfg=cfg, detection=detection, locale=locale)
+            body = _render_agents_md(ctx=ctx, kit_root=kit_root, locale=locale)
         elif mf.relpath.endswith("sdd-kit-check.yml"):
-            body = _render_workflow(locale, cfg, detection)
+            body = _render_workflow(ctx.run, locale, cfg, detection)
         elif mf.relpath.startswith(f"{docs_root}/"):
             # Map to template file name.
             tmpl_name = mf.relpath.replace("/", "__")
             # We keep a small map for clarity.
             if mf.relpath == f"{docs_root}/templates/ADR-Template.md":
-                body = _render_docs_template(locale, "ADR-Template.md", base_data)
+                body = _render_docs_template(ctx.run, locale, "ADR-Template.md", base_data)
             elif mf.relpath == f"{docs_root}/templates/Feature-Template.md":
-                body = _render_docs_template(locale, "Feature-Template.md", base_data)
+                body = _render_docs_template(ctx.run, locale, "Feature-Template.md", base_data)
             elif mf.relpath == f"{docs_root}/templates/Architecture-Template.md":
-                body = _render_docs_template(locale, "Architecture-Template.md", base_data)
+                body = _render_docs_template(ctx.run, locale, "Architecture-Template.md", base_data)
             elif mf.relpath == f"{docs_root}/Architecture/Overview.md":
-                body = _render_docs_template(locale, "Architecture__Overview.md", base_data)
+                body = _render_docs_template(ctx.run, locale, "Architecture__Overview.md", base_data)
             elif mf.relpath == f"{docs_root}/SDD/README.md":
-                body = _render_docs_template(locale, "SDD__README.md", base_data)
+                body = _render_docs_template(ctx.run, locale, "SDD__README.md", base_data)
             else:
                 body = f"# Placeholder ({tmpl_name})\n"
         elif mf.relpath.startswith(f"{specs_root}/") and mf.relpath.endswith(".keep"):
             body = ""
         elif mf.relpath == f"{specs_root}/README.md":
-            tpl = load_template(locale, "specs/README.md.tmpl").text
+            tpl = ctx.run.template(locale, "specs/README.md.tmpl").text
             body = render_template(tpl, base_data)
         else:
             body = ""
@@ -1020,10 +1478,8 @@ def _plan_writes(project_root: Path, kit_root: Path, cfg: SddKitConfig, detectio
     # Profile-driven scaffolds (Memory Bank + meta tools + meta/sdd).
     if cfg.manage_memory_bank:
         plan += _plan_from_template_tree(
-            project_root=project_root,
+            ctx=ctx,
             kit_root=kit_root,
-            cfg=cfg,
-            detection=detection,
             locale=locale,
             template_root="scaffolds/memory_bank",
             dest_root=cfg.memory_bank_root,
@@ -1033,10 +1489,8 @@ def _plan_writes(project_root: Path, kit_root: Path, cfg: SddKitConfig, detectio
 
     if cfg.manage_meta_tools:
         plan += _plan_from_template_tree(
-            project_root=project_root,
+            ctx=ctx,
             kit_root=kit_root,
-            cfg=cfg,
-            detection=detection,
             locale=locale,
             template_root="scaffolds/meta_tools",
             dest_root=cfg.meta_tools_root,
@@ -1046,10 +1500,8 @@ def _plan_writes(project_root: Path, kit_root: Path, cfg: SddKitConfig, detectio
 
     if cfg.manage_meta_sdd:
         plan += _plan_from_template_tree(
-            project_root=project_root,
+            ctx=ctx,
             kit_root=kit_root,
-            cfg=cfg,
-            detection=detection,
             locale=locale,
             template_root="scaffolds/meta_sdd",
             dest_root=cfg.meta_sdd_root,
@@ -1058,10 +1510,8 @@ def _plan_writes(project_root: Path, kit_root: Path, cfg: SddKitConfig, detectio
 
     if cfg.manage_codex_scaffold:
         plan += _plan_from_template_tree(
-            project_root=project_root,
+            ctx=ctx,
             kit_root=kit_root,
-            cfg=cfg,
-            detection=detection,
             locale=locale,
             template_root="scaffolds/codex",
             dest_root=cfg.codex_root,
@@ -1070,7 +1520,7 @@ def _plan_writes(project_root: Path, kit_root: Path, cfg: SddKitConfig, detectio
         )
 
     # Spec Kit (speckit) installer: `.specify/*` and `speckit.*` prompts.
-    plan += _plan_speckit_installer(project_root=project_root, kit_root=kit_root, cfg=cfg)
+    plan += _plan_speckit_installer(run=ctx.run, project_root=project_root, kit_root=kit_root, cfg=cfg, reuse_lock=reuse_lock)
 
     return plan
 
@@ -1086,6 +1536,8 @@ def sync_project(
     skills_install_pack: str | None = None,
     skills_install_to: str | None = None,
     skills_install_only: bool = False,
+    skills_install_select: tuple[str, ...] | None = None,
+    run: RunContext | None = None,
 ) -> None:
     """Synchronize project files and manage skill installations.
     
@@ -1106,40 +1558,101 @@ def sync_project(
         skills_install_pack (str | None): Optional package for skill installation.
         skills_install_to (str | None): Optional destination for skill installation.
         skills_install_only (bool): If True, only installs skills without syncing files.
+        skills_install_select (tuple[str, ...] | None): Skill globs to install; None
+            installs the whole pack.
+        run (RunContext | None): Run-scoped caches shared across projects; a fresh
+            one is created when omitted.
     """
     kit_root = _kit_root()
+    ctx = (run or RunContext()).project(project_root, cfg, detection)
+    plan = _plan_project_sync(
+        ctx,
+        kit_root,
+        locale=locale,
+        skills_install_pack=skills_install_pack,
+        skills_install_to=skills_install_to,
+        skills_install_only=skills_install_only,
+        skills_install_select=skills_install_select,
+    )
+    _apply_project_sync(ctx, plan, config_path=config_path, dry_run=dry_run, skills_install_only=skills_install_only)
+
+
+def _plan_project_sync(
+    ctx: ProjectContext,
+    kit_root: Path,
+    *,
+    locale: str,
+    skills_install_pack: str | None = None,
+    skills_install_to: str | None = None,
+    skills_install_only: bool = False,
+    skills_install_select: tuple[str, ...] | None = None,
+    reuse_lock: bool = True,
+) -> list[PlanItem]:
+    project_root, cfg, detection = ctx.project_root, ctx.cfg, ctx.detection
     plan: list[PlanItem] = []
     if not skills_install_only:
-        plan += _plan_writes(project_root, kit_root, cfg, detection, locale)
+        plan += _plan_writes(ctx, kit_root, locale, reuse_lock=reuse_lock)
 
     if skills_install_pack is not None:
         skills_dest = skills_install_to or cfg.skills_default_install_to
         if skills_install_pack == "speckit":
-            plan += _plan_speckit_skill_install(project_root, kit_root, cfg=cfg, detection=detection, dest=skills_dest)
+            plan += _plan_speckit_skill_install(ctx.run, project_root, kit_root, cfg=cfg, detection=detection, dest=skills_dest)
         else:
-            plan += _plan_skill_install(project_root, kit_root, pack=skills_install_pack, dest=skills_dest)
+            plan += _plan_skill_install(project_root, kit_root, pack=skills_install_pack, dest=skills_dest, select=skills_install_select)
 
     _assert_no_duplicate_plan_targets(plan, project_root=project_root)
+    return plan
+
+
+def _apply_project_sync(
+    ctx: ProjectContext,
+    plan: list[PlanItem],
+    *,
+    config_path: Path,
+    dry_run: bool,
+    skills_install_only: bool = False,
+    emit: Callable[[str], None] = print,
+) -> None:
+    """Execute a sync plan; `emit` receives one status line per action."""
 
+    project_root, cfg = ctx.project_root, ctx.cfg
     for item in plan:
         if isinstance(item, PlannedSkip):
-            print(f"SKIP {_project_rel(item.target, project_root)} ({item.reason})")
+            emit(f"SKIP {_project_rel(item.target, project_root)} ({item.reason})")
+            continue
+        if isinstance(item, PlannedUpstreamLock):
+            for line in item.report:
+                emit(line)
+            current = item.target.read_text(encoding="utf-8") if item.target.exists() else None
+            if current == item.content:
+                continue
+            emit(f"WRITE {_project_rel(item.target, project_root)} (record Spec Kit upstream)")
+            if dry_run:
+                continue
+            item.target.parent.mkdir(parents=True, exist_ok=True)
+            item.target.write_text(item.content, encoding="utf-8")
             continue
         if isinstance(item, PlannedUnmanaged):
-            print(f"SKIP {_project_rel(item.target, project_root)} ({item.reason})")
+            emit(f"SKIP {_project_rel(item.target, project_root)} ({item.reason})")
             continue
         if isinstance(item, PlannedCopyDir):
-            print(f"COPY {_project_rel(item.target, project_root)} ({item.reason})")
+            emit(f"COPY {_project_rel(item.target, project_root)} ({item.reason})")
             if dry_run:
                 continue
             item.target.parent.mkdir(parents=True, exist_ok=True)
             shutil.copytree(item.source, item.target, dirs_exist_ok=False)
             continue
+        if isinstance(item, PlannedExtractSkill):
+            emit(f"EXTRACT {_project_rel(item.target, project_root)} ({item.reason})")
+            if dry_run:
+                continue
+            open_skillpack_archive(item.archive).extract_skill(item.skill_dir, item.target)
+            continue
         if isinstance(item, PlannedEnsureExists):
             if item.target.exists():
-                print(f"SKIP {_project_rel(item.target, project_root)} (exists)")
+                emit(f"SKIP {_project_rel(item.target, project_root)} (exists)")
                 continue
-            print(f"WRITE {_project_rel(item.target, project_root)} ({item.reason})")
+            emit(f"WRITE {_project_rel(item.target, project_root)} ({item.reason})")
             if dry_run:
                 continue
             item.target.parent.mkdir(parents=True, exist_ok=True)
@@ -1147,7 +1660,7 @@ def sync_project(
             if item.mode is not None:
                 os.chmod(item.target, item.mode)
             continue
-        print(f"WRITE {_project_rel(item.target, project_root)} ({item.reason})")
+        emit(f"WRITE {_project_rel(item.target, project_root)} ({item.reason})")
         if dry_run:
             continue
         item.target.parent.mkdir(parents=True, exist_ok=True)
@@ -1163,11 +1676,11 @@ def sync_project(
         if agents_path.exists() and frag_path.exists():
             cur = agents_path.read_text(encoding="utf-8", errors="replace")
             team = frag_path.read_text(encoding="utf-8", errors="replace")
-            auto = _render_agents_auto_fragment(project_root=project_root, cfg=cfg, detection=detection)
+            auto = ctx.agents_auto_fragment
             frag = _compose_agents_manual_fragment(auto_fragment=auto, team_fragment=team)
             updated = _upsert_agents_manual_block(cur, frag)
             if _normalize_newlines(cur) != updated:
-                print(f"PATCH {_project_rel(agents_path, project_root)} (manual block)")
+                emit(f"PATCH {_project_rel(agents_path, project_root)} (manual block)")
                 if not dry_run:
                     agents_path.write_text(updated, encoding="utf-8")
 
@@ -1186,33 +1699,51 @@ def _ensure_config_notice(project_root: Path, config_path: Path) -> None:
         p.write_text("", encoding="utf-8")
 
 
-def check_project(project_root: Path, *, config_path: Path, cfg: SddKitConfig, detection: dict[str, str], locale: str) -> bool:
+def check_project(
+    project_root: Path,
+    *,
+    config_path: Path,
+    cfg: SddKitConfig,
+    detection: dict[str, str],
+    locale: str,
+    run: RunContext | None = None,
+) -> bool:
     kit_root = _kit_root()
-    plan = _plan_writes(project_root, kit_root, cfg, detection, locale)
-
+    ctx = (run or RunContext()).project(project_root, cfg, detection)
+    # Never trust the upstream lock here: a check must compare freshly rendered content.
+    plan = _plan_writes(ctx, kit_root, locale, reuse_lock=False)
     _assert_no_duplicate_plan_targets(plan, project_root=project_root)
+    return _check_project_plan(ctx, plan)
+
 
+def _check_project_plan(ctx: ProjectContext, plan: list[PlanItem], *, emit: Callable[[str], None] = print) -> bool:
+    """Compare a plan against the working tree; `emit` receives one line per problem."""
+
+    project_root, cfg = ctx.project_root, ctx.cfg
     ok = True
     for item in plan:
         if isinstance(item, PlannedUnmanaged):
-            print(f"UNMANAGED {_project_rel(item.target, project_root)}")
+            emit(f"UNMANAGED {_project_rel(item.target, project_root)}")
             ok = False
             continue
         if isinstance(item, PlannedSkip):
             # Skipped files are outside of management scope.
             continue
+        if isinstance(item, PlannedUpstreamLock):
+            # Bookkeeping for delta planning; a stale lock only costs a full re-render.
+            continue
         if isinstance(item, PlannedEnsureExists):
             if not item.target.exists():
-                print(f"MISSING {_project_rel(item.target, project_root)}")
+                emit(f"MISSING {_project_rel(item.target, project_root)}")
                 ok = False
             continue
         if not item.target.exists():
-            print(f"MISSING {_project_rel(item.target, project_root)}")
+            emit(f"MISSING {_project_rel(item.target, project_root)}")
             ok = False
             continue
         actual = item.target.read_text(encoding="utf-8", errors="replace")
         if actual != item.content:
-            print(f"DRIFT {_project_rel(item.target, project_root)}")
+            emit(f"DRIFT {_project_rel(item.target, project_root)}")
             ok = False
 
     # In speckit mode, only validate the AGENTS.md MANUAL block against the overlay fragment.
@@ -1222,19 +1753,28 @@ def check_project(project_root: Path, *, config_path: Path, cfg: SddKitConfig, d
         if agents_path.exists() and frag_path.exists():
             cur = agents_path.read_text(encoding="utf-8", errors="replace")
             team = frag_path.read_text(encoding="utf-8", errors="replace")
-            auto = _render_agents_auto_fragment(project_root=project_root, cfg=cfg, detection=detection)
+            auto = ctx.agents_auto_fragment
             frag = _compose_agents_manual_fragment(auto_fragment=auto, team_fragment=team)
             expected = _upsert_agents_manual_block(cur, frag)
             if _normalize_newlines(cur) != expected:
-                print(f"DRIFT {_project_rel(agents_path, project_root)} (manual block)")
+                emit(f"DRIFT {_project_rel(agents_path, project_root)} (manual block)")
                 ok = False
 
     return ok
 
 
-def _plan_skill_install(project_root: Path, kit_root: Path, *, pack: str, dest: str) -> list[PlanItem]:
+def _plan_skill_install(
+    project_root: Path,
+    kit_root: Path,
+    *,
+    pack: str,
+    dest: str,
+    select: tuple[str, ...] | None = None,
+) -> list[PlanItem]:
     pack_root = kit_root / "skillpacks" / pack / "skills"
-    if not pack_root.exists():
+    # Loose pack dirs win (kit development); the packed archive is used when only it ships.
+    archive = skillpack_archive_path(pack_root.parent)
+    if not pack_root.exists() and not archive.is_file():
         return [PlannedSkip(target=pack_root, reason=f"skillpack not found: {pack}")]
 
     if dest == "project":
@@ -1245,12 +1785,27 @@ def _plan_skill_install(project_root: Path, kit_root: Path, *, pack: str, dest:
     else:
         return [PlannedSkip(target=pack_root, reason=f"unknown skills destination: {dest}")]
 
+    if pack_root.exists():
+        skill_dirs = sorted({p.parent.relative_to(pack_root).as_posix() for p in pack_root.rglob("SKILL.md") if p.is_file()})
+    else:
+        skill_dirs = open_skillpack_archive(archive).skill_dirs()
+    # Only the selected skills are planned, so large per-skill assets of other skills are never copied.
+    skill_dirs, unmatched = select_skill_dirs(skill_dirs, select)
+    if unmatched:
+        raise ValueError(f"No skills in pack '{pack}' match: {', '.join(unmatched)}")
+
     items: list[PlanItem] = []
-    skill_dirs = sorted({p.parent for p in pack_root.rglob("SKILL.md")})
-    for skill_dir in skill_dirs:
-        if not skill_dir.is_dir():
-            continue
-        rel = skill_dir.relative_to(pack_root)
+    if not pack_root.exists():
+        for rel_dir in skill_dirs:
+            dst = dest_root / rel_dir
+            if dst.exists():
+                items.append(PlannedSkip(target=dst, reason="skill dir already exists"))
+                continue
+            items.append(PlannedExtractSkill(archive=archive, skill_dir=rel_dir, target=dst, reason="install skill dir from archive"))
+        return items
+
+    for rel in skill_dirs:
+        skill_dir = pack_root / rel
         dst = dest_root / rel
         if dst.exists():
             items.append(PlannedSkip(target=dst, reason="skill dir already exists"))
@@ -1260,6 +1815,7 @@ def _plan_skill_install(project_root: Path, kit_root: Path, *, pack: str, dest:
 
 
 def _plan_speckit_skill_install(
+    run: RunContext,
     project_root: Path,
     kit_root: Path,
     *,
@@ -1277,12 +1833,12 @@ def _plan_speckit_skill_install(
     else:
         return [PlannedSkip(target=project_root, reason=f"unknown skills destination: {dest}")]
 
-    upstream = ensure_speckit_upstream(kit_root)
+    upstream = run.speckit_upstream(kit_root)
     plan: list[PlanItem] = []
 
-    for src in list_command_templates(upstream):
+    for src in run.speckit_commands(upstream):
         name = src.stem
-        raw = src.read_text(encoding="utf-8", errors="replace")
+        raw = run.upstream_text(src)
         prompt = generate_command_prompt(
             raw,
             script_variant=cfg.speckit_script_variant,
@@ -1301,7 +1857,7 @@ def _plan_speckit_skill_install(
         reason = "create" if not target.exists() else ("update (managed)" if is_managed_file(target) else "update")
         plan.append(PlannedWrite(target=target, content=prompt, reason=reason))
 
-    overlay_tmpl = load_template("en", "speckit/commands/planreview.md.tmpl").text
+    overlay_tmpl = run.template("en", "speckit/commands/planreview.md.tmpl").text
     langs = [p for p in re.split(r"[,\s]+", detection.get("languages", "") or "") if p]
     pms = [p for p in re.split(r"[,\s]+", detection.get("package_managers", "") or "") if p]
     overlay_body = render_template(
@@ -50,8 +50,7 @@ def list_template_names(locale: str, root: str) -> list[str]:
     if not base.exists():
         base = resources.files("sddkit").joinpath(f"_templates/en/{root}")
         locale = "en"
-    names = sorted(set(walk(base, root)))
-    return names
+    return sorted(set(walk(base, root)))
 
 
 def render_template(template_text: str, data: dict[str, str]) -> str:
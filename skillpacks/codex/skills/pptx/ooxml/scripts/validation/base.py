@@ -2,11 +2,139 @@
 Base validator with common validation logic for document files.
 """
 
+import hashlib
+import io
+import json
+import os
 import re
+import zipfile
 from pathlib import Path
 
 import lxml.etree
 
+# Compiled XSD schemas by resolved schema path, shared by every schema validator
+# in the process (DOCX, PPTX, and original-file comparisons). lxml cannot
+# serialize a compiled XMLSchema, so there is no on-disk cache.
+_SCHEMA_CACHE = {}
+
+# XSD error lists by content key (see _xsd_errors_key). Every part is memoized
+# in memory; only original-package parts, which repeat across runs, also go to
+# the on-disk cache, which is pruned to the most recently used files.
+_XSD_ERRORS_CACHE = {}
+_XSD_ERRORS_CACHE_MAX_FILES = 500
+_VALIDATOR_FINGERPRINT = None
+_XSD_ERRORS_CACHE_PRUNED = False
+
+
+def _load_schema(schema_path):
+    """Return the compiled XMLSchema for schema_path, compiling it at most once."""
+    key = str(Path(schema_path).resolve())
+    schema = _SCHEMA_CACHE.get(key)
+    if schema is None:
+        with open(key, "rb") as xsd_file:
+            parser = lxml.etree.XMLParser()
+            xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=key)
+        schema = _SCHEMA_CACHE[key] = lxml.etree.XMLSchema(xsd_doc)
+    return schema
+
+
+def _xsd_errors_cache_dir():
+    """On-disk error cache: $OOXML_VALIDATION_CACHE_DIR, else the user cache dir."""
+    override = os.environ.get("OOXML_VALIDATION_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ooxml-validation"
+
+
+def _validator_fingerprint():
+    """Hash of the validator code and every schema file, computed once per process.
+
+    Covers imported XSDs and the preprocessing in this package, so editing
+    either invalidates cached errors without a hand-bumped version.
+    """
+    global _VALIDATOR_FINGERPRINT
+    if _VALIDATOR_FINGERPRINT is None:
+        here = Path(__file__).resolve().parent
+        schemas_dir = here.parent.parent / "schemas"
+        digest = hashlib.sha256(f"{lxml.etree.LXML_VERSION}\0".encode("utf-8"))
+        files = sorted(here.glob("*.py")) + sorted(
+            p for p in schemas_dir.rglob("*") if p.is_file()
+        )
+        for path in files:
+            digest.update(path.relative_to(here.parent.parent).as_posix().encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+        _VALIDATOR_FINGERPRINT = digest.hexdigest()
+    return _VALIDATOR_FINGERPRINT
+
+
+def _xsd_errors_key(xml_bytes, schema_path, clean_namespaces):
+    """Hash of everything the XSD errors of a part depend on."""
+    schema_path = Path(schema_path).resolve()
+    digest = hashlib.sha256()
+    digest.update(
+        f"{_validator_fingerprint()}\0{schema_path}\0{clean_namespaces}\0".encode(
+            "utf-8"
+        )
+    )
+    digest.update(xml_bytes)
+    return digest.hexdigest()
+
+
+def _load_xsd_errors(key, persist):
+    """Cached error list for key, or None."""
+    if key not in _XSD_ERRORS_CACHE:
+        if not persist:
+            return None
+        try:
+            path = _xsd_errors_cache_dir() / f"{key}.json"
+            _XSD_ERRORS_CACHE[key] = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)  # Mark as recently used for pruning
+        except (OSError, ValueError):
+            return None
+    return _XSD_ERRORS_CACHE[key]
+
+
+def _store_xsd_errors(key, errors, persist):
+    _XSD_ERRORS_CACHE[key] = errors
+    if not persist:
+        return
+    cache_dir = _xsd_errors_cache_dir()
+    tmp = cache_dir / f"{key}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(errors), encoding="utf-8")
+        os.replace(tmp, cache_dir / f"{key}.json")
+        _prune_xsd_errors_cache(cache_dir)
+    except OSError:
+        # The cache is an optimization only
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _prune_xsd_errors_cache(cache_dir):
+    """Keep the most recently used cache files, once per process."""
+    global _XSD_ERRORS_CACHE_PRUNED
+    if _XSD_ERRORS_CACHE_PRUNED:
+        return
+    _XSD_ERRORS_CACHE_PRUNED = True
+    entries = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            entries.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    for _, path in entries[_XSD_ERRORS_CACHE_MAX_FILES:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -108,6 +236,10 @@ class BaseSchemaValidator:
         self.original_file = Path(original_file)
         self.verbose = verbose
 
+        # Original package members and per-part original XSD errors, loaded lazily
+        self._original_part_bytes = None
+        self._original_errors = {}
+
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
@@ -830,42 +962,69 @@ class BaseSchemaValidator:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
-
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            xml_bytes = Path(xml_file).read_bytes()
+            relative_path = Path(xml_file).relative_to(base_path)
+        except Exception as e:
+            return False, {str(e)}
+        return self._validate_xml_bytes(xml_bytes, relative_path, schema_path)
 
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
+    def _validate_xml_bytes(self, xml_bytes, relative_path, schema_path, persist=False):
+        """Validate XML content against an XSD schema, memoized by content hash.
 
-            # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+        Args:
+            xml_bytes: Raw XML content of the part
+            relative_path: Path of the part within the package
+            schema_path: XSD schema to validate against
+            persist: Also use the on-disk cache (original-package parts only)
 
-            # Validate
-            if schema.validate(xml_doc):
-                return True, set()
-            else:
-                errors = set()
-                for error in schema.error_log:
-                    # Store normalized error message (without line numbers for comparison)
-                    errors.add(error.message)
-                return False, errors
+        Returns:
+            tuple: (is_valid, errors_set)
+        """
+        # Clean ignorable namespaces if needed
+        clean_namespaces = bool(
+            relative_path.parts and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+        )
 
+        try:
+            key = _xsd_errors_key(xml_bytes, schema_path, clean_namespaces)
+            errors = _load_xsd_errors(key, persist)
+            if errors is None:
+                errors = self._xsd_errors(xml_bytes, schema_path, clean_namespaces)
+                _store_xsd_errors(key, errors, persist)
         except Exception as e:
             return False, {str(e)}
 
+        return not errors, set(errors)
+
+    def _xsd_errors(self, xml_bytes, schema_path, clean_namespaces):
+        """Validate XML content against an XSD schema. Returns a sorted list of error messages."""
+        # Load schema (compiled once per process)
+        schema = _load_schema(schema_path)
+
+        # Load and preprocess XML
+        xml_doc = lxml.etree.parse(io.BytesIO(xml_bytes))
+        xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
+        xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
+        if clean_namespaces:
+            xml_doc = self._clean_ignorable_namespaces(xml_doc)
+
+        # Validate
+        if schema.validate(xml_doc):
+            return []
+        # Store normalized error messages (without line numbers for comparison)
+        return sorted({error.message for error in schema.error_log})
+
+    def _original_parts(self):
+        """XML and .rels members of the original file by name, read once into memory."""
+        if self._original_part_bytes is None:
+            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+                self._original_part_bytes = {
+                    info.filename.lstrip("/"): zip_ref.read(info)
+                    for info in zip_ref.infolist()
+                    if info.filename.endswith((".xml", ".rels"))
+                }
+        return self._original_part_bytes
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
@@ -875,33 +1034,23 @@ class BaseSchemaValidator:
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
         relative_path = xml_file.relative_to(unpacked_dir)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
-
-            if not original_xml_file.exists():
+        if relative_path not in self._original_errors:
+            original_bytes = self._original_parts().get(relative_path.as_posix())
+            schema_path = self._get_schema_path(xml_file)
+            if original_bytes is None or not schema_path:
                 # File didn't exist in original, so no original errors
-                return set()
-
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+                errors = set()
+            else:
+                _, errors = self._validate_xml_bytes(
+                    original_bytes, relative_path, schema_path, persist=True
+                )
+            self._original_errors[relative_path] = errors or set()
+        return self._original_errors[relative_path]
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
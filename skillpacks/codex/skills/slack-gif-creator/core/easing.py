@@ -4,9 +4,16 @@ Easing Functions - Timing functions for smooth animations.
 
 Provides various easing functions for natural motion and timing.
 All functions take a value t (0.0 to 1.0) and return eased value (0.0 to 1.0).
+
+The NumPy variants at the end (EASING_ARRAY_FUNCTIONS, interpolate_array, ...)
+evaluate a whole array of t values in one call, and Timeline precomputes every
+animated property for all frames up front.
 """
 
 import math
+from typing import Iterator, Sequence
+
+import numpy as np
 
 
 def linear(t: float) -> float:
@@ -232,3 +239,305 @@ EASING_FUNCTIONS.update(
         "overshoot": ease_back_out,  # Alias
     }
 )
+
+
+# ============ Vectorized (NumPy) variants ============
+# Same formulas as the scalar functions above, applied to arrays of t.
+
+
+def _endpoints(t: np.ndarray, eased: np.ndarray) -> np.ndarray:
+    # Elastic functions return t itself at exactly 0 and 1.
+    return np.where((t == 0) | (t == 1), t, eased)
+
+
+def linear_array(t: np.ndarray) -> np.ndarray:
+    return np.asarray(t, dtype=np.float64)
+
+
+def ease_in_quad_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    return t * t
+
+
+def ease_out_quad_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    return t * (2 - t)
+
+
+def ease_in_out_quad_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    return np.where(t < 0.5, 2 * t * t, -1 + (4 - 2 * t) * t)
+
+
+def ease_out_bounce_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    conditions = [t < 1 / 2.75, t < 2 / 2.75, t < 2.5 / 2.75]
+    branches = [
+        7.5625 * t * t,
+        7.5625 * (t - 1.5 / 2.75) ** 2 + 0.75,
+        7.5625 * (t - 2.25 / 2.75) ** 2 + 0.9375,
+    ]
+    return np.select(conditions, branches, 7.5625 * (t - 2.625 / 2.75) ** 2 + 0.984375)
+
+
+def ease_in_bounce_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    return 1 - ease_out_bounce_array(1 - t)
+
+
+def ease_in_out_bounce_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    return np.where(
+        t < 0.5,
+        ease_in_bounce_array(t * 2) * 0.5,
+        ease_out_bounce_array(t * 2 - 1) * 0.5 + 0.5,
+    )
+
+
+def ease_in_elastic_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    eased = -np.power(2.0, 10 * (t - 1)) * np.sin((t - 1.1) * 5 * math.pi)
+    return _endpoints(t, eased)
+
+
+def ease_out_elastic_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    eased = np.power(2.0, -10 * t) * np.sin((t - 0.1) * 5 * math.pi) + 1
+    return _endpoints(t, eased)
+
+
+def ease_in_out_elastic_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    u = t * 2 - 1
+    eased = np.where(
+        u < 0,
+        -0.5 * np.power(2.0, 10 * u) * np.sin((u - 0.1) * 5 * math.pi),
+        np.power(2.0, -10 * u) * np.sin((u - 0.1) * 5 * math.pi) * 0.5 + 1,
+    )
+    return _endpoints(t, eased)
+
+
+def ease_back_in_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    c1 = 1.70158
+    c3 = c1 + 1
+    return c3 * t * t * t - c1 * t * t
+
+
+def ease_back_out_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    c1 = 1.70158
+    c3 = c1 + 1
+    return 1 + c3 * (t - 1) ** 3 + c1 * (t - 1) ** 2
+
+
+def ease_back_in_out_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=np.float64)
+    c1 = 1.70158
+    c2 = c1 * 1.525
+    return np.where(
+        t < 0.5,
+        ((2 * t) ** 2 * ((c2 + 1) * 2 * t - c2)) / 2,
+        ((2 * t - 2) ** 2 * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2,
+    )
+
+
+EASING_ARRAY_FUNCTIONS = {
+    "linear": linear_array,
+    "ease_in": ease_in_quad_array,
+    "ease_out": ease_out_quad_array,
+    "ease_in_out": ease_in_out_quad_array,
+    "bounce_in": ease_in_bounce_array,
+    "bounce_out": ease_out_bounce_array,
+    "bounce": ease_in_out_bounce_array,
+    "elastic_in": ease_in_elastic_array,
+    "elastic_out": ease_out_elastic_array,
+    "elastic": ease_in_out_elastic_array,
+    "back_in": ease_back_in_array,
+    "back_out": ease_back_out_array,
+    "back_in_out": ease_back_in_out_array,
+    "anticipate": ease_back_in_array,  # Alias
+    "overshoot": ease_back_out_array,  # Alias
+}
+
+
+def get_easing_array(name: str = "linear"):
+    """Get vectorized easing function by name."""
+    return EASING_ARRAY_FUNCTIONS.get(name, linear_array)
+
+
+def interpolate_array(
+    start, end, t: np.ndarray, easing: str = "linear"
+) -> np.ndarray:
+    """
+    Interpolate between two values for many t at once.
+
+    Args:
+        start: Start value (scalar or sequence, e.g. an (x, y) point or RGB color)
+        end: End value (same shape as start)
+        t: Array of progress values from 0.0 to 1.0
+        easing: Name of easing function
+
+    Returns:
+        Array of shape t.shape (scalars) or t.shape + value shape (sequences)
+    """
+    eased = get_easing_array(easing)(t)
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    eased = eased.reshape(eased.shape + (1,) * start.ndim)
+    return start + (end - start) * eased
+
+
+def calculate_arc_motion_array(
+    start: tuple[float, float], end: tuple[float, float], height: float, t: np.ndarray
+) -> np.ndarray:
+    """
+    Positions along a parabolic arc for many t at once.
+
+    Args:
+        start: (x, y) starting position
+        end: (x, y) ending position
+        height: Arc height at midpoint (positive = upward)
+        t: Array of progress values (0.0-1.0)
+
+    Returns:
+        Array of shape t.shape + (2,) with (x, y) positions
+    """
+    t = np.asarray(t, dtype=np.float64)
+    x1, y1 = start
+    x2, y2 = end
+    x = x1 + (x2 - x1) * t
+    y = y1 + (y2 - y1) * t - 4 * height * t * (1 - t)
+    return np.stack([x, y], axis=-1)
+
+
+def apply_squash_stretch_array(
+    base_scale: tuple[float, float], intensity: np.ndarray, direction: str = "vertical"
+) -> np.ndarray:
+    """
+    Squash and stretch scales for an array of intensities.
+
+    Args:
+        base_scale: (width_scale, height_scale) base scales
+        intensity: Array of squash/stretch intensities (0.0-1.0)
+        direction: 'vertical', 'horizontal', or 'both'
+
+    Returns:
+        Array of shape intensity.shape + (2,) with (width_scale, height_scale)
+    """
+    intensity = np.asarray(intensity, dtype=np.float64)
+    width_scale = np.full(intensity.shape, float(base_scale[0]))
+    height_scale = np.full(intensity.shape, float(base_scale[1]))
+    if direction == "vertical":
+        height_scale *= 1 - intensity * 0.5
+        width_scale *= 1 + intensity * 0.5
+    elif direction == "horizontal":
+        width_scale *= 1 - intensity * 0.5
+        height_scale *= 1 + intensity * 0.5
+    elif direction == "both":
+        width_scale *= 1 - intensity * 0.3
+        height_scale *= 1 - intensity * 0.3
+    return np.stack([width_scale, height_scale], axis=-1)
+
+
+class Timeline:
+    """
+    Keyframed animation properties precomputed for every frame.
+
+    Example:
+        timeline = Timeline(num_frames=30)
+        timeline.keyframes("x", [(0.0, 40), (0.6, 400, "ease_out"), (1.0, 240, "bounce_out")])
+        timeline.keyframes("color", [(0.0, (255, 0, 0)), (1.0, (0, 0, 255))])
+        timeline.arc("ball", start=(40, 400), end=(440, 400), height=200)
+        for props in timeline:
+            draw_circle(frame, (int(props["x"]), 240), 20, fill_color=tuple(int(c) for c in props["color"]))
+
+    Each property is stored as one array with a row per frame, so per-frame
+    work is just indexing.
+    """
+
+    def __init__(self, num_frames: int, endpoint: bool = True):
+        """
+        Initialize timeline.
+
+        Args:
+            num_frames: Number of frames
+            endpoint: If True the last frame is at t=1.0, otherwise at
+                (num_frames - 1) / num_frames (for seamless loops)
+        """
+        self.num_frames = num_frames
+        denom = max(1, num_frames - 1) if endpoint else max(1, num_frames)
+        self.t = np.arange(num_frames, dtype=np.float64) / denom
+        self.properties: dict[str, np.ndarray] = {}
+
+    def keyframes(self, name: str, keys: Sequence[tuple]) -> np.ndarray:
+        """
+        Define a property by keyframes.
+
+        Args:
+            name: Property name
+            keys: (time, value) or (time, value, easing) tuples sorted by time
+                (0.0-1.0); easing shapes the segment that ends at that key.
+                Values may be scalars or sequences of equal length.
+
+        Returns:
+            Array with one value (row) per frame
+        """
+        if not keys:
+            raise ValueError(f"Property {name!r} needs at least one keyframe")
+        times = [float(k[0]) for k in keys]
+        if any(b < a for a, b in zip(times, times[1:])):
+            raise ValueError(f"Keyframes of {name!r} must be sorted by time")
+        values = [np.asarray(k[1], dtype=np.float64) for k in keys]
+
+        out = np.empty((self.num_frames,) + values[0].shape)
+        out[...] = values[0]  # before the first key: hold its value
+        for (t0, v0), (t1, v1), key in zip(zip(times, values), zip(times[1:], values[1:]), keys[1:]):
+            mask = (self.t >= t0) & (self.t <= t1) if t1 > t0 else (self.t == t1)
+            if not mask.any():
+                continue
+            local = (self.t[mask] - t0) / (t1 - t0) if t1 > t0 else np.ones(int(mask.sum()))
+            easing = key[2] if len(key) > 2 else "linear"
+            out[mask] = interpolate_array(v0, v1, local, easing)
+        out[self.t > times[-1]] = values[-1]  # after the last key: hold it
+        self.properties[name] = out
+        return out
+
+    def arc(
+        self,
+        name: str,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        height: float,
+        easing: str = "linear",
+    ) -> np.ndarray:
+        """Define an (x, y) property moving along a parabolic arc."""
+        out = calculate_arc_motion_array(start, end, height, get_easing_array(easing)(self.t))
+        self.properties[name] = out
+        return out
+
+    def set(self, name: str, values: Sequence) -> np.ndarray:
+        """Define a property from precomputed per-frame values."""
+        out = np.asarray(values, dtype=np.float64)
+        if len(out) != self.num_frames:
+            raise ValueError(f"Property {name!r} needs {self.num_frames} values, got {len(out)}")
+        self.properties[name] = out
+        return out
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.properties[name]
+
+    def frame(self, index: int) -> dict:
+        """All properties at one frame (scalars as floats, vectors as arrays), plus 't'."""
+        props = {"t": float(self.t[index])}
+        for name, values in self.properties.items():
+            value = values[index]
+            props[name] = float(value) if value.ndim == 0 else value
+        return props
+
+    def __len__(self) -> int:
+        return self.num_frames
+
+    def __iter__(self) -> Iterator[dict]:
+        for index in range(self.num_frames):
+            yield self.frame(index)
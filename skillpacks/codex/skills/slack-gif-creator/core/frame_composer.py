@@ -4,13 +4,23 @@ Frame Composer - Utilities for composing visual elements into frames.
 
 Provides functions for drawing shapes, text, emojis, and compositing elements
 together to create animation frames.
+
+Besides the PIL helpers, NumPy-backed primitives work on whole (H, W, 3) uint8
+arrays: gradients, anti-aliased circles, stars and polygons, and alpha
+compositing. Static layers can be cached by their parameters with
+cached_layer(), so identical backgrounds are generated once per animation.
 """
 
-from typing import Optional
+from collections import OrderedDict
+from typing import Callable, Optional
 
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+# Static layers by (function, parameters), least recently used first.
+_LAYER_CACHE: OrderedDict = OrderedDict()
+_LAYER_CACHE_SIZE = 32
+
 
 def create_blank_frame(
     width: int, height: int, color: tuple[int, int, int] = (255, 255, 255)
@@ -114,24 +124,11 @@ def create_gradient_background(
     Returns:
         PIL Image with gradient
     """
-    frame = Image.new("RGB", (width, height))
-    draw = ImageDraw.Draw(frame)
-
-    # Calculate color step for each row
-    r1, g1, b1 = top_color
-    r2, g2, b2 = bottom_color
-
-    for y in range(height):
-        # Interpolate color
-        ratio = y / height
-        r = int(r1 * (1 - ratio) + r2 * ratio)
-        g = int(g1 * (1 - ratio) + g2 * ratio)
-        b = int(b1 * (1 - ratio) + b2 * ratio)
-
-        # Draw horizontal line
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
-
-    return frame
+    # Backgrounds are usually identical for every frame: build the array once.
+    layer = cached_layer(
+        create_gradient_array, width, height, tuple(top_color), tuple(bottom_color)
+    )
+    return Image.fromarray(layer)
 
 
 def draw_star(
@@ -174,3 +171,322 @@ def draw_star(
     draw.polygon(points, fill=fill_color, outline=outline_color, width=outline_width)
 
     return frame
+
+
+def cached_layer(fn: Callable, *args, **kwargs) -> np.ndarray:
+    """
+    Build a static layer once per set of parameters.
+
+    Args:
+        fn: Function returning a PIL Image or array
+        *args, **kwargs: Passed to fn; must be hashable (use tuples for colors)
+
+    Returns:
+        Read-only array; copy it before drawing on it
+    """
+    key = (fn, args, tuple(sorted(kwargs.items())))
+    if key in _LAYER_CACHE:
+        _LAYER_CACHE.move_to_end(key)
+        return _LAYER_CACHE[key]
+
+    layer = fn(*args, **kwargs)
+    if isinstance(layer, Image.Image):
+        layer = np.array(layer)
+    layer.setflags(write=False)
+    _LAYER_CACHE[key] = layer
+    if len(_LAYER_CACHE) > _LAYER_CACHE_SIZE:
+        _LAYER_CACHE.popitem(last=False)
+    return layer
+
+
+def clear_layer_cache():
+    """Drop all cached static layers."""
+    _LAYER_CACHE.clear()
+
+
+def create_gradient_array(
+    width: int,
+    height: int,
+    start_color: tuple[int, int, int],
+    end_color: tuple[int, int, int],
+    direction: str = "vertical",
+) -> np.ndarray:
+    """
+    Create a gradient as an RGB array.
+
+    Args:
+        width: Frame width
+        height: Frame height
+        start_color: RGB color at the top / left / top-left / center
+        end_color: RGB color at the bottom / right / bottom-right / corners
+        direction: "vertical", "horizontal", "diagonal" or "radial"
+
+    Returns:
+        (height, width, 3) uint8 array
+    """
+    if direction == "vertical":
+        ratio = (np.arange(height) / height)[:, None]
+    elif direction == "horizontal":
+        ratio = (np.arange(width) / width)[None, :]
+    elif direction == "diagonal":
+        ratio = (np.arange(height)[:, None] / height + np.arange(width)[None, :] / width) / 2
+    elif direction == "radial":
+        dy = np.arange(height)[:, None] - (height - 1) / 2
+        dx = np.arange(width)[None, :] - (width - 1) / 2
+        ratio = np.hypot(dx, dy) / max(1e-9, np.hypot((width - 1) / 2, (height - 1) / 2))
+    else:
+        raise ValueError(f"Unknown gradient direction: {direction}")
+
+    start = np.asarray(start_color, dtype=np.float64)
+    end = np.asarray(end_color, dtype=np.float64)
+    ratio = ratio[..., None]
+    colors = (start * (1 - ratio) + end * ratio).astype(np.uint8)  # truncates, like int()
+    if direction == "vertical":
+        return np.repeat(colors, width, axis=1)
+    if direction == "horizontal":
+        return np.repeat(colors, height, axis=0)
+    return colors
+
+
+def _region(
+    frame: np.ndarray, cx: float, cy: float, extent: float
+) -> Optional[tuple[int, int, np.ndarray, np.ndarray]]:
+    """Clipped bounding box around (cx, cy) as (y0, x0, ys, xs) pixel coordinates."""
+    h, w = frame.shape[:2]
+    x0, x1 = max(0, int(np.floor(cx - extent))), min(w, int(np.ceil(cx + extent)) + 1)
+    y0, y1 = max(0, int(np.floor(cy - extent))), min(h, int(np.ceil(cy + extent)) + 1)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    ys = np.arange(y0, y1, dtype=np.float32)[:, None]
+    xs = np.arange(x0, x1, dtype=np.float32)[None, :]
+    return y0, x0, ys, xs
+
+
+def _polygon_distance(points: np.ndarray, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """Signed distance to a polygon (positive inside, even-odd rule)."""
+    dist = np.full(np.broadcast_shapes(ys.shape, xs.shape), np.inf, dtype=np.float32)
+    inside = np.zeros(dist.shape, dtype=bool)
+    for (ax, ay), (bx, by) in zip(points, np.roll(points, -1, axis=0)):
+        ex, ey = bx - ax, by - ay
+        length_sq = ex * ex + ey * ey
+        if length_sq > 0:
+            t = np.clip(((xs - ax) * ex + (ys - ay) * ey) / length_sq, 0, 1)
+        else:
+            t = np.zeros_like(dist)
+        np.minimum(dist, np.hypot(xs - ax - t * ex, ys - ay - t * ey), out=dist)
+        if ay != by:
+            crosses = (ay > ys) != (by > ys)
+            inside ^= crosses & (xs < ex * (ys - ay) / ey + ax)
+    return np.where(inside, dist, -dist)
+
+
+def _fill_shape(
+    frame: np.ndarray,
+    y0: int,
+    x0: int,
+    signed_distance: np.ndarray,
+    fill_color: Optional[tuple[int, int, int]],
+    outline_color: Optional[tuple[int, int, int]],
+    outline_width: int,
+    opacity: float,
+) -> np.ndarray:
+    # Coverage ramps over one pixel across the edge (anti-aliasing).
+    coverage = np.clip(signed_distance + 0.5, 0, 1)
+    if outline_color is None:
+        if fill_color is not None:
+            composite_color(frame, coverage, fill_color, opacity, (x0, y0))
+        return frame
+
+    # The outline is the band of width outline_width just inside the edge.
+    inner = np.clip(signed_distance - outline_width + 0.5, 0, 1)
+    if fill_color is not None:
+        composite_color(frame, inner, fill_color, opacity, (x0, y0))
+    composite_color(frame, coverage - inner, outline_color, opacity, (x0, y0))
+    return frame
+
+
+def composite_color(
+    frame: np.ndarray,
+    coverage: np.ndarray,
+    color: tuple[int, int, int],
+    opacity: float = 1.0,
+    position: tuple[int, int] = (0, 0),
+) -> np.ndarray:
+    """
+    Blend a solid color into a frame through a coverage mask (in place).
+
+    Args:
+        frame: (H, W, 3) uint8 array to draw on
+        coverage: (h, w) mask in [0, 1], e.g. from circle_coverage
+        color: RGB color, or (h, w, 3) per-pixel colors
+        opacity: Extra opacity multiplier
+        position: (x, y) of the mask's top-left corner in the frame
+
+    Returns:
+        Modified frame
+    """
+    x, y = position
+    region = frame[y : y + coverage.shape[0], x : x + coverage.shape[1]]
+    rh, rw = region.shape[:2]
+    alpha = coverage[:rh, :rw, None].astype(np.float32) * opacity
+    color = np.asarray(color, dtype=np.float32)
+    if color.ndim == 3:
+        color = color[:rh, :rw]
+    region[...] = (region + (color - region) * alpha + 0.5).astype(np.uint8)
+    return frame
+
+
+def alpha_composite(
+    frame: np.ndarray, overlay: np.ndarray, position: tuple[int, int] = (0, 0)
+) -> np.ndarray:
+    """
+    Composite an RGBA overlay (sprite, glow, text layer, ...) onto a frame (in place).
+
+    Args:
+        frame: (H, W, 3) uint8 array to draw on
+        overlay: (h, w, 4) uint8 RGBA array
+        position: (x, y) of the overlay's top-left corner (may be off-frame)
+
+    Returns:
+        Modified frame
+    """
+    x, y = position
+    h, w = frame.shape[:2]
+    fx0, fy0 = max(0, x), max(0, y)
+    fx1, fy1 = min(w, x + overlay.shape[1]), min(h, y + overlay.shape[0])
+    if fx0 >= fx1 or fy0 >= fy1:
+        return frame
+    src = overlay[fy0 - y : fy1 - y, fx0 - x : fx1 - x]
+    return composite_color(frame, src[..., 3] / 255.0, src[..., :3], position=(fx0, fy0))
+
+
+def circle_coverage(
+    width: int, height: int, center: tuple[float, float], radius: float
+) -> np.ndarray:
+    """
+    Anti-aliased coverage mask of a filled circle.
+
+    Args:
+        width: Mask width
+        height: Mask height
+        center: (x, y) center position
+        radius: Circle radius
+
+    Returns:
+        (height, width) float32 mask in [0, 1]
+    """
+    ys = np.arange(height, dtype=np.float32)[:, None]
+    xs = np.arange(width, dtype=np.float32)[None, :]
+    return np.clip(radius - np.hypot(xs - center[0], ys - center[1]) + 0.5, 0, 1)
+
+
+def star_points(
+    center: tuple[float, float], size: float, points: int = 5, inner_ratio: float = 0.4
+) -> np.ndarray:
+    """Vertices of a star (same geometry as draw_star) as a (2 * points, 2) array."""
+    i = np.arange(2 * points)
+    angle = np.radians(i * (180 / points) - 90)  # start at top
+    radius = np.where(i % 2 == 0, size, size * inner_ratio)
+    return np.stack(
+        [center[0] + radius * np.cos(angle), center[1] + radius * np.sin(angle)], axis=1
+    )
+
+
+def draw_circle_array(
+    frame: np.ndarray,
+    center: tuple[float, float],
+    radius: float,
+    fill_color: Optional[tuple[int, int, int]] = None,
+    outline_color: Optional[tuple[int, int, int]] = None,
+    outline_width: int = 1,
+    opacity: float = 1.0,
+) -> np.ndarray:
+    """
+    Draw an anti-aliased circle on an RGB array (in place).
+
+    Only the circle's bounding box is touched, so it is cheap to call per frame.
+
+    Args:
+        frame: (H, W, 3) uint8 array to draw on
+        center: (x, y) center position (sub-pixel positions are fine)
+        radius: Circle radius
+        fill_color: RGB fill color (None for no fill)
+        outline_color: RGB outline color (None for no outline)
+        outline_width: Outline width in pixels (drawn inside the radius)
+        opacity: Opacity from 0 to 1
+
+    Returns:
+        Modified frame
+    """
+    region = _region(frame, center[0], center[1], radius + 1)
+    if region is None:
+        return frame
+    y0, x0, ys, xs = region
+    signed_distance = radius - np.hypot(xs - center[0], ys - center[1])
+    return _fill_shape(
+        frame, y0, x0, signed_distance, fill_color, outline_color, outline_width, opacity
+    )
+
+
+def draw_polygon_array(
+    frame: np.ndarray,
+    points,
+    fill_color: Optional[tuple[int, int, int]] = None,
+    outline_color: Optional[tuple[int, int, int]] = None,
+    outline_width: int = 1,
+    opacity: float = 1.0,
+) -> np.ndarray:
+    """
+    Draw an anti-aliased polygon on an RGB array (in place).
+
+    Args:
+        frame: (H, W, 3) uint8 array to draw on
+        points: Sequence of (x, y) vertices
+        fill_color: RGB fill color (None for no fill)
+        outline_color: RGB outline color (None for no outline)
+        outline_width: Outline width in pixels (drawn inside the edges)
+        opacity: Opacity from 0 to 1
+
+    Returns:
+        Modified frame
+    """
+    points = np.asarray(points, dtype=np.float32)
+    lo, hi = points.min(axis=0), points.max(axis=0)
+    center = (lo + hi) / 2
+    region = _region(frame, center[0], center[1], float((hi - lo).max()) / 2 + 1)
+    if region is None:
+        return frame
+    y0, x0, ys, xs = region
+    signed_distance = _polygon_distance(points, ys, xs)
+    return _fill_shape(
+        frame, y0, x0, signed_distance, fill_color, outline_color, outline_width, opacity
+    )
+
+
+def draw_star_array(
+    frame: np.ndarray,
+    center: tuple[float, float],
+    size: float,
+    fill_color: Optional[tuple[int, int, int]] = None,
+    outline_color: Optional[tuple[int, int, int]] = None,
+    outline_width: int = 1,
+    opacity: float = 1.0,
+) -> np.ndarray:
+    """
+    Draw an anti-aliased 5-pointed star on an RGB array (in place).
+
+    Args:
+        frame: (H, W, 3) uint8 array to draw on
+        center: (x, y) center position
+        size: Star size (outer radius)
+        fill_color: RGB fill color (None for no fill)
+        outline_color: RGB outline color (None for no outline)
+        outline_width: Outline width in pixels
+        opacity: Opacity from 0 to 1
+
+    Returns:
+        Modified frame
+    """
+    return draw_polygon_array(
+        frame, star_points(center, size), fill_color, outline_color, outline_width, opacity
+    )
@@ -6,6 +6,9 @@ This module provides the main interface for creating GIFs from programmatically
 generated frames, with automatic optimization for Slack's requirements.
 """
 
+import io
+import math
+import struct
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +16,435 @@ import imageio.v3 as imageio
 import numpy as np
 from PIL import Image
 
+from .pipeline import render_frames
+from .quantize import apply_lut, build_lut, build_palette, quantize_frames
+
+# Rows per band of the downsampled pre-filter used by deduplicate_frames
+# (8 * 255 still fits the uint16 band sums).
+_DEDUP_BAND = 8
+
+
+def _band_sums(frame: np.ndarray) -> np.ndarray:
+    """Exact sums over bands of rows, per column and channel (cropped to whole bands)."""
+    h = frame.shape[0] // _DEDUP_BAND * _DEDUP_BAND
+    bands = frame[:h].reshape(h // _DEDUP_BAND, _DEDUP_BAND, frame[0].size)
+    return bands.sum(axis=1, dtype=np.uint16).astype(np.int32)
+
+
+def _sum_uint8(buf: np.ndarray) -> int:
+    """Exact sum of a uint8 array, reduced in uint16 chunks (256 * 255 fits)."""
+    flat = buf.reshape(-1)
+    k = flat.size // 256 * 256
+    total = flat[:k].reshape(-1, 256).sum(axis=1, dtype=np.uint16).sum(dtype=np.uint64)
+    return int(total) + int(flat[k:].sum(dtype=np.uint64))
+
+
+def _float_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """The reference metric: 1 - mean absolute difference / 255, in float32."""
+    diff = np.abs(np.array(a, dtype=np.float32) - np.array(b, dtype=np.float32))
+    return 1.0 - (np.mean(diff) / 255.0)
+
+
+def _to_rgb_frame(frame: np.ndarray | Image.Image, width: int, height: int) -> np.ndarray:
+    """Convert a frame to an RGB array of the given size."""
+    if isinstance(frame, Image.Image):
+        frame = np.array(frame.convert("RGB"))
+
+    # Ensure frame is correct size
+    if frame.shape[:2] != (height, width):
+        pil_frame = Image.fromarray(frame)
+        pil_frame = pil_frame.resize((width, height), Image.Resampling.LANCZOS)
+        frame = np.array(pil_frame)
+
+    return frame
+
+
+def _palette_from_pixels(pixels: np.ndarray, num_colors: int) -> Image.Image:
+    """Build a palette image from an (N, 3) uint8 pixel cloud."""
+    # Create a properly-shaped RGB image from the pixel data
+    # We'll make a roughly square image from all the pixels
+    total_pixels = len(pixels)
+    width = min(512, int(np.sqrt(total_pixels)))  # Reasonable width, max 512
+    height = (total_pixels + width - 1) // width  # Ceiling division
+
+    # Pad if necessary to fill the rectangle
+    pixels_needed = width * height
+    if pixels_needed > total_pixels:
+        padding = np.zeros((pixels_needed - total_pixels, 3), dtype=np.uint8)
+        pixels = np.vstack([pixels, padding])
+
+    # Reshape to proper RGB image format (H, W, 3)
+    img_array = pixels[:pixels_needed].reshape(height, width, 3).astype(np.uint8)
+    combined_img = Image.fromarray(img_array, mode="RGB")
+
+    return combined_img.quantize(colors=num_colors, method=2)
+
+
+def _print_summary(info: dict) -> None:
+    print(f"\n✓ GIF created successfully!")
+    print(f"  Path: {info['path']}")
+    print(f"  Size: {info['size_kb']:.1f} KB ({info['size_mb']:.2f} MB)")
+    print(f"  Dimensions: {info['dimensions']}")
+    print(f"  Frames: {info['frame_count']} @ {info['fps']} fps")
+    print(f"  Duration: {info['duration_seconds']:.1f}s")
+    print(f"  Colors: {info['colors']}")
+
+
+def _gif_image_block(indices: np.ndarray, palette: list[int], left: int, top: int) -> bytes:
+    """
+    Encode palette indices as one GIF image block (descriptor + LZW data).
+
+    Pillow does the LZW encoding of a single-frame GIF; the image block is cut
+    out of it and re-positioned at (left, top).
+    """
+    img = Image.fromarray(indices, mode="P")
+    img.putpalette(palette)
+    buf = io.BytesIO()
+    img.save(buf, format="GIF", optimize=False)
+    data = buf.getvalue()
+
+    pos = 13
+    if data[10] & 0x80:
+        pos += 3 * (2 << (data[10] & 0x07))
+    while data[pos] == 0x21:  # skip extensions
+        pos += 2
+        while data[pos]:
+            pos += data[pos] + 1
+        pos += 1
+    if data[pos] != 0x2C:
+        raise ValueError("Unexpected GIF structure from Pillow")
+
+    end = pos + 10
+    if data[pos + 9] & 0x80:
+        end += 3 * (2 << (data[pos + 9] & 0x07))
+    end += 1  # LZW minimum code size
+    while data[end]:
+        end += data[end] + 1
+    end += 1
+    block = bytearray(data[pos:end])
+    block[1:5] = struct.pack("<HH", left, top)
+    return bytes(block)
+
+
+def _write_palette_gif(fp, palette: np.ndarray, indices: list[np.ndarray], duration: float):
+    """Write palette-index frames sharing one palette as a looping GIF."""
+    frames = [Image.fromarray(idx, mode="P") for idx in indices]
+    for frame in frames:
+        frame.putpalette(palette.tobytes())
+    frames[0].save(
+        fp,
+        format="GIF",
+        save_all=True,
+        append_images=frames[1:],
+        duration=duration,
+        loop=0,  # Infinite loop
+        optimize=False,
+    )
+
+
+class _BudgetSearch:
+    """
+    Find the best-looking encoding of a set of frames that fits a byte budget.
+
+    Candidates (scale, frame skip, colors) are tried from highest to lowest
+    quality. Each is first sized from partial encodes of a few short windows of
+    frames; only candidates whose estimate fits are fully encoded, and the
+    ratio of actual to estimated size corrects the estimates that follow.
+    Scaled frames, palettes and index frames are cached across attempts.
+    """
+
+    # (scale, keep every nth frame), best quality first
+    STAGES = (
+        (1.0, 1), (1.0, 2), (0.75, 1), (0.75, 2), (0.6, 2),
+        (0.5, 2), (0.5, 3), (0.4, 3), (0.33, 4),
+    )
+    # Color counts tried within each stage (below the requested num_colors)
+    COLORS = (96, 64, 48)
+    # Only tried at the last stage, before giving up
+    LAST_RESORT_COLORS = (32, 16)
+    WINDOWS = 3
+    WINDOW_FRAMES = 4
+
+    def __init__(self, frames: list[np.ndarray], fps: int, dither: bool = False):
+        self.frames = frames
+        self.fps = fps
+        self.dither = dither
+        self._scaled: dict[tuple, np.ndarray] = {}
+        self._palettes: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        self._indices: dict[tuple, dict[int, np.ndarray]] = {}
+
+    def candidates(self, num_colors: int):
+        colors = [num_colors] + [c for c in self.COLORS if c < num_colors]
+        for scale, skip in self.STAGES:
+            for c in colors:
+                yield scale, skip, c
+        scale, skip = self.STAGES[-1]
+        for c in self.LAST_RESORT_COLORS:
+            if c < colors[-1]:
+                yield scale, skip, c
+
+    def size_at(self, scale: float) -> tuple[int, int]:
+        h, w = self.frames[0].shape[:2]
+        if scale == 1.0:
+            return w, h
+        return max(16, round(w * scale)), max(16, round(h * scale))
+
+    def frame_ids(self, skip: int) -> list[int]:
+        return list(range(0, len(self.frames), skip))
+
+    def encode(self, scale: float, skip: int, colors: int, ids: Optional[list[int]] = None) -> bytes:
+        """Encode the given frames (default: every `skip`th frame) to GIF bytes."""
+        if ids is None:
+            ids = self.frame_ids(skip)
+        palette, lut = self._palette(colors)
+        cache = self._indices.setdefault((scale, colors), {})
+        for i in ids:
+            if i not in cache:
+                cache[i] = apply_lut(self._frame(scale, i), lut, dither=self.dither)
+        buf = io.BytesIO()
+        _write_palette_gif(buf, palette, [cache[i] for i in ids], 1000 * skip / self.fps)
+        return buf.getvalue()
+
+    def estimate(self, scale: float, skip: int, colors: int) -> float:
+        """Estimated full size from a few windows of consecutive frames."""
+        ids = self.frame_ids(skip)
+        if len(ids) <= self.WINDOWS * self.WINDOW_FRAMES:
+            return float(len(self.encode(scale, skip, colors, ids)))
+
+        # One full frame plus deltas: each window is encoded whole and as its
+        # first frame alone, which separates the two costs.
+        starts = np.linspace(0, len(ids) - self.WINDOW_FRAMES, self.WINDOWS).round().astype(int)
+        first = delta = 0.0
+        for start in starts:
+            window = ids[start : start + self.WINDOW_FRAMES]
+            single = len(self.encode(scale, skip, colors, window[:1]))
+            whole = len(self.encode(scale, skip, colors, window))
+            first += single
+            delta += (whole - single) / (len(window) - 1)
+        return first / len(starts) + delta / len(starts) * (len(ids) - 1)
+
+    def fit(self, target_bytes: int, num_colors: int) -> tuple[tuple, bytes, bool, int]:
+        """
+        Search for the best candidate under target_bytes.
+
+        Returns:
+            Tuple of ((scale, skip, colors), GIF bytes, whether the target was
+            met, number of full encodes)
+        """
+        correction = 1.0
+        passes = 0
+        smallest = None
+        candidate = None
+        for candidate in self.candidates(num_colors):
+            estimate = self.estimate(*candidate)
+            if estimate * correction > target_bytes:
+                continue
+            data = self.encode(*candidate)
+            passes += 1
+            if len(data) <= target_bytes:
+                return candidate, data, True, passes
+            correction = len(data) / estimate
+            if smallest is None or len(data) < len(smallest[1]):
+                smallest = (candidate, data)
+
+        # Nothing fits: fall back to the smallest encoding we can make.
+        data = self.encode(*candidate)
+        passes += 1
+        if smallest is not None and len(smallest[1]) < len(data):
+            candidate, data = smallest
+        return candidate, data, False, passes
+
+    def _frame(self, scale: float, i: int) -> np.ndarray:
+        if scale == 1.0:
+            return self.frames[i]
+        key = (scale, i)
+        if key not in self._scaled:
+            img = Image.fromarray(self.frames[i])
+            self._scaled[key] = np.array(img.resize(self.size_at(scale), Image.Resampling.LANCZOS))
+        return self._scaled[key]
+
+    def _palette(self, colors: int) -> tuple[np.ndarray, np.ndarray]:
+        # Scaling barely changes the color distribution, so palettes (and
+        # their lookup tables) are built once per color count at full size.
+        if colors not in self._palettes:
+            palette = build_palette(self.frames, colors)
+            self._palettes[colors] = palette, build_lut(palette)
+        return self._palettes[colors]
+
+
+class GIFStreamWriter:
+    """
+    Streaming GIF encoder with a global palette and bounded memory.
+
+    Frames are held only until the palette is built from a reservoir sample of
+    the first `warmup_frames` frames (plus any frames passed to `sample()`);
+    after that each added frame is quantized and written immediately, so peak
+    memory is a few frames regardless of the animation length.
+
+    Use as a context manager, or call close() to finish the file.
+    """
+
+    def __init__(
+        self,
+        output_path: str | Path,
+        width: int = 480,
+        height: int = 480,
+        fps: int = 15,
+        num_colors: int = 128,
+        warmup_frames: int = 8,
+        sample_size: int = 1 << 17,
+        seed: int = 0,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            output_path: Where to save the GIF
+            width: Frame width in pixels
+            height: Frame height in pixels
+            fps: Frames per second
+            num_colors: Number of colors in the global palette
+            warmup_frames: Frames buffered (and sampled) before the palette is fixed
+            sample_size: Pixels kept in the reservoir sample
+            seed: Seed for the reservoir sampler (deterministic output)
+        """
+        self.output_path = Path(output_path)
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.num_colors = num_colors
+        self.warmup_frames = max(1, warmup_frames)
+        self.frame_count = 0
+
+        self._rng = np.random.default_rng(seed)
+        self._reservoir = np.empty((sample_size, 3), dtype=np.uint8)
+        self._seen = 0
+        self._pending: list[np.ndarray] = []
+        self._palette_img: Optional[Image.Image] = None
+        self._palette: list[int] = []
+        self._prev: Optional[np.ndarray] = None
+        self._delay = int(1000 / fps / 10)  # centiseconds, as Pillow rounds it
+        self._fh = open(self.output_path, "wb")
+
+    def __enter__(self) -> "GIFStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._fh.close()
+
+    def sample(self, frame: np.ndarray | Image.Image):
+        """Add a frame to the palette sample without encoding it."""
+        if self._palette_img is not None:
+            raise RuntimeError("Palette already built; sample() must precede encoding")
+        self._sample(_to_rgb_frame(frame, self.width, self.height))
+
+    def add_frame(self, frame: np.ndarray | Image.Image):
+        """Add a frame; it is encoded as soon as the palette is known."""
+        frame = _to_rgb_frame(frame, self.width, self.height)
+        if self._palette_img is None:
+            self._sample(frame)
+            self._pending.append(frame)
+            if len(self._pending) >= self.warmup_frames:
+                self._build_palette()
+            return
+        self._write_frame(frame)
+
+    def add_frames(self, frames):
+        """Add multiple frames (any iterable, consumed lazily)."""
+        for frame in frames:
+            self.add_frame(frame)
+
+    def close(self) -> dict:
+        """
+        Flush pending frames and finish the file.
+
+        Returns:
+            Dictionary with file info (path, size, dimensions, frame_count)
+        """
+        if self._fh.closed:
+            raise RuntimeError("GIFStreamWriter is already closed")
+        if self._palette_img is None:
+            if not self._pending:
+                self._fh.close()
+                raise ValueError("No frames to save. Add frames with add_frame() first.")
+            self._build_palette()
+        self._fh.write(b";")
+        self._fh.close()
+
+        size_kb = self.output_path.stat().st_size / 1024
+        info = {
+            "path": str(self.output_path),
+            "size_kb": size_kb,
+            "size_mb": size_kb / 1024,
+            "dimensions": f"{self.width}x{self.height}",
+            "frame_count": self.frame_count,
+            "fps": self.fps,
+            "duration_seconds": self.frame_count / self.fps,
+            "colors": self.num_colors,
+        }
+        _print_summary(info)
+        return info
+
+    def _sample(self, frame: np.ndarray):
+        # Vectorized reservoir sampling (Algorithm R) over the frame's pixels.
+        pixels = frame.reshape(-1, 3)
+        cap = len(self._reservoir)
+        fill = max(0, min(cap - self._seen, len(pixels)))
+        if fill:
+            self._reservoir[self._seen : self._seen + fill] = pixels[:fill]
+        rest = pixels[fill:]
+        if len(rest):
+            seen = self._seen + fill + np.arange(len(rest))
+            slots = self._rng.integers(0, seen + 1)
+            keep = slots < cap
+            self._reservoir[slots[keep]] = rest[keep]
+        self._seen += len(pixels)
+
+    def _build_palette(self):
+        sample = self._reservoir[: min(self._seen, len(self._reservoir))]
+        self._palette_img = _palette_from_pixels(sample, self.num_colors)
+        palette = self._palette_img.getpalette() or []
+        # The global color table holds 2^k entries.
+        entries = max(2, len(palette) // 3)
+        bits = max(1, math.ceil(math.log2(entries)))
+        self._palette = palette + [0] * (3 * (1 << bits) - len(palette))
+        self._write_header(bits)
+        pending, self._pending = self._pending, []
+        for frame in pending:
+            self._write_frame(frame)
+
+    def _write_header(self, bits: int):
+        self._fh.write(b"GIF89a")
+        self._fh.write(struct.pack("<HHBBB", self.width, self.height, 0xF0 | (bits - 1), 0, 0))
+        self._fh.write(bytes(self._palette))
+        # NETSCAPE2.0 application extension: loop forever
+        self._fh.write(b"!\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def _write_frame(self, frame: np.ndarray):
+        quantized = Image.fromarray(frame).quantize(palette=self._palette_img, dither=1)
+        indices = np.asarray(quantized, dtype=np.uint8)
+
+        # Only encode the region that changed since the previous frame.
+        left, top, right, bottom = 0, 0, self.width, self.height
+        if self._prev is not None:
+            changed = indices != self._prev
+            rows = np.flatnonzero(changed.any(axis=1))
+            if len(rows):
+                cols = np.flatnonzero(changed.any(axis=0))
+                top, bottom = int(rows[0]), int(rows[-1]) + 1
+                left, right = int(cols[0]), int(cols[-1]) + 1
+            else:
+                right, bottom = 1, 1
+        self._prev = indices
+
+        # Graphic control extension: disposal 1 (keep), frame delay
+        self._fh.write(b"!\xf9\x04" + struct.pack("<BHBB", 1 << 2, self._delay, 0, 0))
+        self._fh.write(_gif_image_block(np.ascontiguousarray(indices[top:bottom, left:right]), self._palette, left, top))
+        self.frame_count += 1
+
 
 class GIFBuilder:
     """Builder for creating optimized GIFs from frames."""
@@ -38,26 +470,30 @@ class GIFBuilder:
         Args:
             frame: Frame as numpy array or PIL Image (will be converted to RGB)
         """
-        if isinstance(frame, Image.Image):
-            frame = np.array(frame.convert("RGB"))
-
-        # Ensure frame is correct size
-        if frame.shape[:2] != (self.height, self.width):
-            pil_frame = Image.fromarray(frame)
-            pil_frame = pil_frame.resize(
-                (self.width, self.height), Image.Resampling.LANCZOS
-            )
-            frame = np.array(pil_frame)
-
-        self.frames.append(frame)
+        self.frames.append(_to_rgb_frame(frame, self.width, self.height))
 
     def add_frames(self, frames: list[np.ndarray | Image.Image]):
-        """Add multiple frames at once."""
+        """Add multiple frames at once (any iterable)."""
         for frame in frames:
             self.add_frame(frame)
 
+    def render(self, frame_fn, num_frames: int, **kwargs):
+        """
+        Render frames from a pure frame function in parallel and add them.
+
+        Args:
+            frame_fn: Function of t in [0, 1) returning a frame (see core.pipeline)
+            num_frames: Number of frames to render
+            **kwargs: Passed to render_frames (workers, chunk_size, layers)
+        """
+        self.add_frames(render_frames(frame_fn, num_frames, **kwargs))
+
     def optimize_colors(
-        self, num_colors: int = 128, use_global_palette: bool = True
+        self,
+        num_colors: int = 128,
+        use_global_palette: bool = True,
+        quantizer: str = "pil",
+        ordered_dither: bool = False,
     ) -> list[np.ndarray]:
         """
         Reduce colors in all frames using quantization.
@@ -65,10 +501,21 @@ class GIFBuilder:
         Args:
             num_colors: Target number of colors (8-256)
             use_global_palette: Use a single palette for all frames (better compression)
+            quantizer: "pil" (Pillow, Floyd-Steinberg dithering) or "fast"
+                (vectorized median cut + lookup table, see core.quantize)
+            ordered_dither: With quantizer="fast", apply ordered (Bayer) dithering
 
         Returns:
             List of color-optimized frames
         """
+        if quantizer == "fast" and self.frames:
+            palette, indices = quantize_frames(
+                self.frames, num_colors, dither=ordered_dither
+            )
+            return [np.take(palette, idx, axis=0) for idx in indices]
+        if quantizer != "pil":
+            raise ValueError(f"Unknown quantizer: {quantizer!r} (use 'pil' or 'fast')")
+
         optimized = []
 
         if use_global_palette and len(self.frames) > 1:
@@ -86,26 +533,8 @@ class GIFBuilder:
                 [f.reshape(-1, 3) for f in sample_frames]
             )  # (total_pixels, 3)
 
-            # Create a properly-shaped RGB image from the pixel data
-            # We'll make a roughly square image from all the pixels
-            total_pixels = len(all_pixels)
-            width = min(512, int(np.sqrt(total_pixels)))  # Reasonable width, max 512
-            height = (total_pixels + width - 1) // width  # Ceiling division
-
-            # Pad if necessary to fill the rectangle
-            pixels_needed = width * height
-            if pixels_needed > total_pixels:
-                padding = np.zeros((pixels_needed - total_pixels, 3), dtype=np.uint8)
-                all_pixels = np.vstack([all_pixels, padding])
-
-            # Reshape to proper RGB image format (H, W, 3)
-            img_array = (
-                all_pixels[:pixels_needed].reshape(height, width, 3).astype(np.uint8)
-            )
-            combined_img = Image.fromarray(img_array, mode="RGB")
-
             # Generate global palette
-            global_palette = combined_img.quantize(colors=num_colors, method=2)
+            global_palette = _palette_from_pixels(all_pixels, num_colors)
 
             # Apply global palette to all frames
             for frame in self.frames:
@@ -138,19 +567,47 @@ class GIFBuilder:
         deduplicated = [self.frames[0]]
         removed_count = 0
 
-        for i in range(1, len(self.frames)):
-            # Compare with previous frame
-            prev_frame = np.array(deduplicated[-1], dtype=np.float32)
-            curr_frame = np.array(self.frames[i], dtype=np.float32)
+        # Work on exact integer sums of |prev - curr| in uint8 buffers and only fall
+        # back to the float32 reference metric within a small margin of the
+        # threshold, so decisions match it exactly. Band sums give a lower bound
+        # on the difference (|sum(a) - sum(b)| <= sum|a - b|) that settles most
+        # clearly-different frames without a full-resolution pass.
+        cutoff = (1.0 - threshold) * 255.0  # mean absolute difference at the threshold
+        margin = 0.01 + 1e-4 * abs(cutoff)
+        hi: np.ndarray | None = None
+        lo: np.ndarray | None = None
+        prev = self.frames[0]
+        prev_bands = _band_sums(prev) if prev.dtype == np.uint8 else None
 
-            # Calculate similarity (normalized)
-            diff = np.abs(prev_frame - curr_frame)
-            similarity = 1.0 - (np.mean(diff) / 255.0)
+        for i in range(1, len(self.frames)):
+            curr = self.frames[i]
+            if prev_bands is None or curr.dtype != np.uint8 or curr.shape != prev.shape:
+                is_new = _float_similarity(prev, curr) < threshold
+                curr_bands = _band_sums(curr) if curr.dtype == np.uint8 else None
+            else:
+                n = curr.size
+                curr_bands = _band_sums(curr)
+                lower_bound = np.abs(prev_bands - curr_bands).sum() / n
+                if lower_bound > cutoff + margin:
+                    is_new = True
+                else:
+                    if hi is None or hi.shape != curr.shape:
+                        hi = np.empty_like(curr)
+                        lo = np.empty_like(curr)
+                    np.maximum(prev, curr, out=hi)
+                    np.minimum(prev, curr, out=lo)
+                    np.subtract(hi, lo, out=hi)
+                    mean_diff = _sum_uint8(hi) / n
+                    if abs(mean_diff - cutoff) > margin:
+                        is_new = mean_diff > cutoff
+                    else:
+                        is_new = _float_similarity(prev, curr) < threshold
 
             # Keep frame if sufficiently different
             # High threshold (0.9995+) means only remove nearly identical frames
-            if similarity < threshold:
-                deduplicated.append(self.frames[i])
+            if is_new:
+                deduplicated.append(curr)
+                prev, prev_bands = curr, curr_bands
             else:
                 removed_count += 1
 
@@ -163,6 +620,9 @@ class GIFBuilder:
         num_colors: int = 128,
         optimize_for_emoji: bool = False,
         remove_duplicates: bool = False,
+        quantizer: str = "pil",
+        ordered_dither: bool = False,
+        target_bytes: Optional[int] = None,
     ) -> dict:
         """
         Save frames as optimized GIF for Slack.
@@ -172,9 +632,15 @@ class GIFBuilder:
             num_colors: Number of colors to use (fewer = smaller file)
             optimize_for_emoji: If True, optimize for emoji size (128x128, fewer colors)
             remove_duplicates: If True, remove duplicate consecutive frames (opt-in)
+            quantizer: "pil" or "fast" (vectorized, much faster on long animations)
+            ordered_dither: With quantizer="fast", apply ordered dithering
+            target_bytes: Byte budget. Searches over colors (up to num_colors),
+                frame skipping and scaling for the best GIF that fits; always
+                uses the fast quantizer. The builder's frames are left untouched.
 
         Returns:
-            Dictionary with file info (path, size, dimensions, frame_count)
+            Dictionary with file info (path, size, dimensions, frame_count;
+            plus target_bytes and target_met with a byte budget)
         """
         if not self.frames:
             raise ValueError("No frames to save. Add frames with add_frame() first.")
@@ -217,19 +683,44 @@ class GIFBuilder:
                     self.frames[i] for i in range(0, len(self.frames), keep_every)
                 ]
 
-        # Optimize colors with global palette
-        optimized_frames = self.optimize_colors(num_colors, use_global_palette=True)
-
         # Calculate frame duration in milliseconds
         frame_duration = 1000 / self.fps
+        width, height, fps = self.width, self.height, self.fps
+        frame_count = len(self.frames)
 
-        # Save GIF
-        imageio.imwrite(
-            output_path,
-            optimized_frames,
-            duration=frame_duration,
-            loop=0,  # Infinite loop
-        )
+        if target_bytes is not None:
+            search = _BudgetSearch(self.frames, self.fps, dither=ordered_dither)
+            (scale, skip, num_colors), data, target_met, passes = search.fit(
+                target_bytes, num_colors
+            )
+            output_path.write_bytes(data)
+            width, height = search.size_at(scale)
+            fps = self.fps / skip if skip > 1 else self.fps
+            frame_count = len(search.frame_ids(skip))
+            print(
+                f"  Byte budget {target_bytes / 1024:.1f} KB: {width}x{height}, "
+                f"every {skip} frame(s), {num_colors} colors ({passes} full encode(s))"
+            )
+        elif quantizer == "fast":
+            # Write palette frames directly; an RGB round trip would make the
+            # writer quantize every frame again.
+            palette, indices = quantize_frames(
+                self.frames, num_colors, dither=ordered_dither
+            )
+            _write_palette_gif(output_path, palette, indices, frame_duration)
+        else:
+            # Optimize colors with global palette
+            optimized_frames = self.optimize_colors(
+                num_colors, use_global_palette=True, quantizer=quantizer
+            )
+
+            # Save GIF
+            imageio.imwrite(
+                output_path,
+                optimized_frames,
+                duration=frame_duration,
+                loop=0,  # Infinite loop
+            )
 
         # Get file info
         file_size_kb = output_path.stat().st_size / 1024
@@ -239,31 +730,50 @@ class GIFBuilder:
             "path": str(output_path),
             "size_kb": file_size_kb,
             "size_mb": file_size_mb,
-            "dimensions": f"{self.width}x{self.height}",
-            "frame_count": len(optimized_frames),
-            "fps": self.fps,
-            "duration_seconds": len(optimized_frames) / self.fps,
+            "dimensions": f"{width}x{height}",
+            "frame_count": frame_count,
+            "fps": fps,
+            "duration_seconds": frame_count / fps,
             "colors": num_colors,
         }
+        if target_bytes is not None:
+            info["target_bytes"] = target_bytes
+            info["target_met"] = target_met
 
         # Print info
-        print(f"\n✓ GIF created successfully!")
-        print(f"  Path: {output_path}")
-        print(f"  Size: {file_size_kb:.1f} KB ({file_size_mb:.2f} MB)")
-        print(f"  Dimensions: {self.width}x{self.height}")
-        print(f"  Frames: {len(optimized_frames)} @ {self.fps} fps")
-        print(f"  Duration: {info['duration_seconds']:.1f}s")
-        print(f"  Colors: {num_colors}")
+        _print_summary(info)
 
         # Size info
         if optimize_for_emoji:
             print(f"  Optimized for emoji (128x128, reduced colors)")
-        if file_size_mb > 1.0:
+        if target_bytes is not None and not target_met:
+            print(f"\n  Note: Could not reach {target_bytes / 1024:.1f} KB")
+            print("  Consider: fewer frames, a shorter animation, or simpler graphics")
+        elif file_size_mb > 1.0:
             print(f"\n  Note: Large file size ({file_size_kb:.1f} KB)")
             print("  Consider: fewer frames, smaller dimensions, or fewer colors")
 
         return info
 
+    def stream(self, output_path: str | Path, num_colors: int = 128, **kwargs) -> GIFStreamWriter:
+        """
+        Open a streaming writer with this builder's size and fps.
+
+        Frames go straight to the file instead of being collected in
+        self.frames, so memory stays bounded for long animations.
+
+        Args:
+            output_path: Where to save the GIF
+            num_colors: Number of colors in the global palette
+            **kwargs: Passed to GIFStreamWriter (warmup_frames, sample_size, seed)
+
+        Returns:
+            GIFStreamWriter (use as a context manager)
+        """
+        return GIFStreamWriter(
+            output_path, self.width, self.height, self.fps, num_colors=num_colors, **kwargs
+        )
+
     def clear(self):
         """Clear all frames (useful for creating multiple GIFs)."""
         self.frames = []
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Frame Pipeline - Render animation frames in parallel.
+
+Takes a pure frame function `frame_fn(t) -> Image` (t = frame index / frame
+count, in [0, 1)) and renders frames across a process pool in ordered chunks,
+so they can be fed straight into a GIFBuilder or GIFStreamWriter.
+
+Static layers (backgrounds, logos, ...) are rendered once in the parent and
+shipped to each worker once; the frame function then receives them as
+`frame_fn(t, layers)` instead of redrawing them for every frame.
+"""
+
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+from PIL import Image
+
+# Per-worker state set by the pool initializer.
+_worker_fn: Optional[Callable] = None
+_worker_layers: Optional[dict] = None
+
+
+def _init_worker(frame_fn: Callable, layers: Optional[dict]):
+    global _worker_fn, _worker_layers
+    _worker_fn = frame_fn
+    _worker_layers = layers
+
+
+def _render_one(frame_fn: Callable, layers: Optional[dict], t: float) -> np.ndarray:
+    frame = frame_fn(t) if layers is None else frame_fn(t, layers)
+    if isinstance(frame, Image.Image):
+        frame = np.asarray(frame.convert("RGB"))
+    return frame
+
+
+def _render_chunk(times: list[float]) -> list[np.ndarray]:
+    return [_render_one(_worker_fn, _worker_layers, t) for t in times]
+
+
+def _picklable(*objects) -> bool:
+    try:
+        pickle.dumps(objects)
+    except Exception:
+        return False
+    return True
+
+
+def render_frames(
+    frame_fn: Callable,
+    num_frames: int,
+    workers: Optional[int] = None,
+    chunk_size: int = 4,
+    layers: Optional[dict] = None,
+) -> Iterator[np.ndarray]:
+    """
+    Render frames in parallel, yielding them in order as RGB arrays.
+
+    Args:
+        frame_fn: Pure function of t (or of t and layers) returning a PIL Image
+            or RGB array. Must be a module-level function to run in worker
+            processes; lambdas and closures are rendered in-process instead.
+        num_frames: Number of frames; frame i gets t = i / num_frames
+        workers: Worker processes (default: CPU count; 1 = render in-process)
+        chunk_size: Frames per task (amortizes inter-process overhead)
+        layers: Static layers (name -> Image or array) passed to frame_fn as its
+            second argument. Treat them as read-only; copy before drawing on them.
+
+    Yields:
+        Frames as (H, W, 3) uint8 arrays, in frame order
+    """
+    times = [i / num_frames for i in range(num_frames)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, max(1, num_frames // max(1, chunk_size)))
+
+    if workers <= 1 or not _picklable(frame_fn, layers):
+        for t in times:
+            yield _render_one(frame_fn, layers, t)
+        return
+
+    chunks = [times[i : i + chunk_size] for i in range(0, num_frames, chunk_size)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(frame_fn, layers)
+    ) as pool:
+        # Keep a bounded window of chunks in flight so finished frames don't pile up.
+        pending = deque()
+        next_chunk = 0
+        while next_chunk < len(chunks) or pending:
+            while next_chunk < len(chunks) and len(pending) < 2 * workers:
+                pending.append(pool.submit(_render_chunk, chunks[next_chunk]))
+                next_chunk += 1
+            yield from pending.popleft().result()
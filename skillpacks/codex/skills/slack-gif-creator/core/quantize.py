@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Quantize - Fast vectorized global-palette color quantization.
+
+Builds one palette for a whole animation (median cut over a subsampled pixel
+cloud, optionally refined with k-means) and maps every frame to it through a
+precomputed 32x32x32 lookup table, with optional ordered (Bayer) dithering.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+# Bits kept per channel in the lookup table (32^3 cells).
+LUT_BITS = 5
+
+_BAYER_4X4 = np.array(
+    [[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]], dtype=np.float32
+)
+
+
+def sample_pixels(
+    frames: list[np.ndarray], max_pixels: int = 1 << 16, seed: int = 0
+) -> np.ndarray:
+    """
+    Uniformly subsample pixels across all frames.
+
+    Args:
+        frames: RGB frames (H, W, 3) uint8
+        max_pixels: Size of the returned pixel cloud
+        seed: Random seed (deterministic output)
+
+    Returns:
+        (N, 3) uint8 array of pixels
+    """
+    rng = np.random.default_rng(seed)
+    sizes = np.array([f.shape[0] * f.shape[1] for f in frames])
+    total = int(sizes.sum())
+    picks = np.sort(rng.choice(total, size=min(max_pixels, total), replace=False))
+    bounds = np.concatenate([[0], np.cumsum(sizes)])
+    out = np.empty((len(picks), 3), dtype=np.uint8)
+    for i, frame in enumerate(frames):
+        lo, hi = np.searchsorted(picks, bounds[i : i + 2])
+        if hi > lo:
+            out[lo:hi] = frame.reshape(-1, 3)[picks[lo:hi] - bounds[i]]
+    return out
+
+
+def median_cut_palette(pixels: np.ndarray, num_colors: int) -> np.ndarray:
+    """
+    Median-cut palette for a pixel cloud.
+
+    Repeatedly splits the box with the largest (channel range x pixel count)
+    at the median of its widest channel.
+
+    Args:
+        pixels: (N, 3) uint8 pixels
+        num_colors: Maximum palette size
+
+    Returns:
+        (K, 3) uint8 palette, K <= num_colors
+    """
+
+    def entry(box: np.ndarray) -> tuple[int, int, np.ndarray]:
+        if len(box) < 2:
+            return -1, 0, box
+        spread = box.max(axis=0).astype(np.int32) - box.min(axis=0)
+        channel = int(np.argmax(spread))
+        return int(spread[channel]) * len(box), channel, box
+
+    boxes = [entry(pixels)]
+    while len(boxes) < num_colors:
+        best = max(range(len(boxes)), key=lambda i: boxes[i][0])
+        score, channel, box = boxes[best]
+        if score <= 0:
+            break  # every box is a single color
+        mid = len(box) // 2
+        order = np.argpartition(box[:, channel], mid)
+        boxes[best] = entry(box[order[:mid]])
+        boxes.append(entry(box[order[mid:]]))
+    return np.array([box.mean(axis=0) for _, _, box in boxes]).round().astype(np.uint8)
+
+
+def _nearest(points: np.ndarray, palette: np.ndarray, chunk: int = 8192) -> np.ndarray:
+    """Index of the nearest palette color for each point (squared RGB distance)."""
+    pal = palette.astype(np.float32)
+    pal_sq = (pal * pal).sum(axis=1)
+    out = np.empty(len(points), dtype=np.uint8)
+    for start in range(0, len(points), chunk):
+        p = points[start : start + chunk].astype(np.float32)
+        # |p - c|^2 = |p|^2 - 2 p.c + |c|^2; |p|^2 is constant per row.
+        dist = pal_sq[None, :] - 2.0 * (p @ pal.T)
+        out[start : start + chunk] = dist.argmin(axis=1)
+    return out
+
+
+def kmeans_refine(
+    pixels: np.ndarray, palette: np.ndarray, iterations: int = 3
+) -> np.ndarray:
+    """
+    Refine a palette with a few Lloyd (k-means) iterations on the pixel cloud.
+
+    Args:
+        pixels: (N, 3) uint8 pixels
+        palette: (K, 3) uint8 starting palette
+        iterations: Number of iterations
+
+    Returns:
+        (K, 3) uint8 palette
+    """
+    centers = palette.astype(np.float64)
+    points = pixels.astype(np.float64)
+    for _ in range(iterations):
+        labels = _nearest(pixels, centers.round().astype(np.uint8))
+        counts = np.bincount(labels, minlength=len(centers))
+        for c in range(3):
+            sums = np.bincount(labels, weights=points[:, c], minlength=len(centers))
+            np.divide(sums, counts, out=centers[:, c], where=counts > 0)
+    return centers.round().astype(np.uint8)
+
+
+def build_lut(palette: np.ndarray, bits: int = LUT_BITS) -> np.ndarray:
+    """
+    Nearest-palette lookup table over the RGB cube.
+
+    Args:
+        palette: (K, 3) uint8 palette
+        bits: Bits per channel (table has 2^(3*bits) cells)
+
+    Returns:
+        (2^bits, 2^bits, 2^bits) uint8 table of palette indices
+    """
+    n = 1 << bits
+    step = 256 // n
+    centers = np.arange(n, dtype=np.uint16) * step + step // 2
+    r, g, b = np.meshgrid(centers, centers, centers, indexing="ij")
+    cells = np.stack([r, g, b], axis=-1).reshape(-1, 3).astype(np.uint8)
+    return _nearest(cells, palette).reshape(n, n, n)
+
+
+def apply_lut(
+    frames: np.ndarray, lut: np.ndarray, dither: bool = False
+) -> np.ndarray:
+    """
+    Map frames to palette indices through a lookup table.
+
+    Args:
+        frames: (..., H, W, 3) uint8 frames (a single frame or a stack)
+        lut: Table from build_lut
+        dither: Apply 4x4 ordered (Bayer) dithering
+
+    Returns:
+        (..., H, W) uint8 palette indices
+    """
+    shift = 8 - int(np.log2(lut.shape[0]))
+    if dither:
+        h, w = frames.shape[-3:-1]
+        tile = np.tile(_BAYER_4X4, ((h + 3) // 4, (w + 3) // 4))[:h, :w]
+        # Threshold offsets spanning one LUT cell, centered on zero.
+        offset = np.round(((tile + 0.5) / 16.0 - 0.5) * (1 << shift)).astype(np.int16)
+        frames = np.clip(frames.astype(np.int16) + offset[..., None], 0, 255).astype(np.uint8)
+    # Flat cell index (r << 2b) + (g << b) + b, then one gather from the table.
+    bits = 8 - shift
+    q = frames >> shift
+    cell = q[..., 0].astype(np.uint16) * (1 << 2 * bits) + q[..., 1].astype(np.uint16) * (1 << bits) + q[..., 2]
+    return np.take(lut.reshape(-1), cell)
+
+
+def build_palette(
+    frames: list[np.ndarray],
+    num_colors: int = 128,
+    sample_size: int = 1 << 16,
+    kmeans_iterations: int = 2,
+) -> np.ndarray:
+    """
+    Global palette for a set of frames (median cut + k-means on a pixel sample).
+
+    Args:
+        frames: RGB frames (H, W, 3) uint8
+        num_colors: Palette size (2-256)
+        sample_size: Pixels sampled across all frames
+        kmeans_iterations: k-means refinement passes after median cut (0 = off)
+
+    Returns:
+        (K, 3) uint8 palette
+    """
+    pixels = sample_pixels(frames, sample_size)
+    palette = median_cut_palette(pixels, max(2, min(256, num_colors)))
+    if kmeans_iterations:
+        palette = kmeans_refine(pixels, palette, kmeans_iterations)
+    return palette
+
+
+def quantize_frames(
+    frames: list[np.ndarray],
+    num_colors: int = 128,
+    dither: bool = False,
+    sample_size: int = 1 << 16,
+    kmeans_iterations: int = 2,
+    chunk_frames: int = 16,
+    palette: Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    """
+    Quantize all frames to one global palette.
+
+    Args:
+        frames: RGB frames (H, W, 3) uint8, all the same size
+        num_colors: Palette size (2-256)
+        dither: Apply ordered dithering
+        sample_size: Pixels sampled across all frames for the palette
+        kmeans_iterations: k-means refinement passes after median cut (0 = off)
+        chunk_frames: Frames mapped per vectorized batch (bounds temporary memory)
+        palette: Reuse an existing (K, 3) palette instead of building one
+
+    Returns:
+        Tuple of (palette (K, 3) uint8, list of (H, W) uint8 index frames)
+    """
+    if palette is None:
+        palette = build_palette(frames, num_colors, sample_size, kmeans_iterations)
+    lut = build_lut(palette)
+
+    indices: list[np.ndarray] = []
+    for start in range(0, len(frames), chunk_frames):
+        batch = np.stack(frames[start : start + chunk_frames])
+        indices.extend(apply_lut(batch, lut, dither=dither))
+    return palette, indices
@@ -3,9 +3,124 @@
 Validators - Check if GIFs meet Slack's requirements.
 
 These validators help ensure your GIFs meet Slack's size and dimension constraints.
+GIFs are read by walking their block structure (descriptors, extensions and
+palettes) without decoding any pixel data.
 """
 
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+_NETSCAPE_IDS = (b"NETSCAPE2.0", b"ANIMEXTS1.0")
+
+
+def _skip_sub_blocks(data: bytes, pos: int) -> int:
+    """Position just past a chain of data sub-blocks (ended by a zero-length block)."""
+    while True:
+        size = data[pos]
+        pos += 1
+        if size == 0:
+            return pos
+        pos += size
+
+
+def parse_gif(gif_path: str | Path) -> dict:
+    """
+    Read GIF structure in a single pass, without decoding pixel data.
+
+    Args:
+        gif_path: Path to GIF file
+
+    Returns:
+        Dictionary with width, height, size_bytes, frame_count, frames (per
+        frame: left, top, width, height, delay_ms, disposal, transparency,
+        palette_size, local_palette, interlaced), durations_ms,
+        duration_seconds, global_palette_size and loop_count (None if the
+        GIF does not loop; 0 = forever)
+
+    Raises:
+        ValueError: If the file is not a GIF or is truncated
+    """
+    data = Path(gif_path).read_bytes()
+    if data[:6] not in (b"GIF87a", b"GIF89a"):
+        raise ValueError("Not a GIF file")
+
+    try:
+        width, height, flags = struct.unpack_from("<HHB", data, 6)
+        pos = 13
+        global_palette_size = 0
+        if flags & 0x80:
+            global_palette_size = 2 << (flags & 0x07)
+            pos += 3 * global_palette_size
+
+        frames = []
+        loop_count = None
+        control = None  # graphic control extension for the next image
+        while pos < len(data):
+            block = data[pos]
+            if block == 0x3B:  # trailer
+                break
+            if block == 0x21:  # extension
+                label = data[pos + 1]
+                pos += 2
+                if label == 0xF9 and data[pos] >= 4:
+                    packed, delay, transparency = struct.unpack_from("<BHB", data, pos + 1)
+                    control = {
+                        "delay_ms": delay * 10,
+                        "disposal": (packed >> 2) & 0x07,
+                        "transparency": transparency if packed & 0x01 else None,
+                    }
+                elif label == 0xFF and data[pos] == 11 and data[pos + 1 : pos + 12] in _NETSCAPE_IDS:
+                    sub = pos + 12
+                    if data[sub] >= 3 and data[sub + 1] == 1:
+                        loop_count = struct.unpack_from("<H", data, sub + 2)[0]
+                pos = _skip_sub_blocks(data, pos)
+            elif block == 0x2C:  # image descriptor
+                left, top, frame_width, frame_height, packed = struct.unpack_from(
+                    "<HHHHB", data, pos + 1
+                )
+                pos += 10
+                local_palette_size = 0
+                if packed & 0x80:
+                    local_palette_size = 2 << (packed & 0x07)
+                    pos += 3 * local_palette_size
+                pos = _skip_sub_blocks(data, pos + 1)  # skip LZW code size + image data
+                control = control or {"delay_ms": 0, "disposal": 0, "transparency": None}
+                frames.append(
+                    {
+                        "left": left,
+                        "top": top,
+                        "width": frame_width,
+                        "height": frame_height,
+                        **control,
+                        "palette_size": local_palette_size or global_palette_size,
+                        "local_palette": bool(local_palette_size),
+                        "interlaced": bool(packed & 0x40),
+                    }
+                )
+                control = None
+            else:
+                raise ValueError(f"Unexpected block 0x{block:02x} at offset {pos}")
+    except (IndexError, struct.error):
+        raise ValueError("Truncated GIF data") from None
+
+    if pos > len(data):
+        raise ValueError("Truncated GIF data")
+
+    durations_ms = [frame["delay_ms"] for frame in frames]
+    return {
+        "width": width,
+        "height": height,
+        "size_bytes": len(data),
+        "frame_count": len(frames),
+        "frames": frames,
+        "durations_ms": durations_ms,
+        "duration_seconds": sum(durations_ms) / 1000,
+        "global_palette_size": global_palette_size,
+        "loop_count": loop_count,
+    }
 
 
 def validate_gif(
@@ -22,45 +137,26 @@ def validate_gif(
     Returns:
         Tuple of (passes: bool, results: dict with all details)
     """
-    from PIL import Image
-
     gif_path = Path(gif_path)
 
     if not gif_path.exists():
         return False, {"error": f"File not found: {gif_path}"}
 
-    # Get file size
-    size_bytes = gif_path.stat().st_size
-    size_kb = size_bytes / 1024
-    size_mb = size_kb / 1024
-
-    # Get dimensions and frame info
+    # Get dimensions, frame info and size from the block structure
     try:
-        with Image.open(gif_path) as img:
-            width, height = img.size
-
-            # Count frames
-            frame_count = 0
-            try:
-                while True:
-                    img.seek(frame_count)
-                    frame_count += 1
-            except EOFError:
-                pass
-
-            # Get duration
-            try:
-                duration_ms = img.info.get("duration", 100)
-                total_duration = (duration_ms * frame_count) / 1000
-                fps = frame_count / total_duration if total_duration > 0 else 0
-            except:
-                total_duration = None
-                fps = None
-
+        gif = parse_gif(gif_path)
     except Exception as e:
         return False, {"error": f"Failed to read GIF: {e}"}
 
+    width, height = gif["width"], gif["height"]
+    frame_count = gif["frame_count"]
+    size_kb = gif["size_bytes"] / 1024
+    size_mb = size_kb / 1024
+    total_duration = gif["duration_seconds"]
+    fps = frame_count / total_duration if total_duration > 0 else 0
+
     # Validate dimensions
+    optimal = None
     if is_emoji:
         optimal = width == height == 128
         acceptable = width == height and 64 <= width <= 128
@@ -83,39 +179,107 @@ def validate_gif(
         "frame_count": frame_count,
         "duration_seconds": total_duration,
         "fps": fps,
+        "frame_durations_ms": gif["durations_ms"],
+        "palette_sizes": [frame["palette_size"] for frame in gif["frames"]],
+        "loop_count": gif["loop_count"],
         "is_emoji": is_emoji,
-        "optimal": optimal if is_emoji else None,
+        "optimal": optimal,
     }
 
     # Print if verbose
     if verbose:
-        print(f"\nValidating {gif_path.name}:")
-        print(
-            f"  Dimensions: {width}x{height}"
-            + (
-                f" ({'optimal' if optimal else 'acceptable'})"
-                if is_emoji and acceptable
-                else ""
-            )
-        )
-        print(
-            f"  Size: {size_kb:.1f} KB"
-            + (f" ({size_mb:.2f} MB)" if size_mb >= 1.0 else "")
+        _print_results(results)
+
+    return dim_pass, results
+
+
+def _print_results(results: dict) -> None:
+    if "error" in results:
+        print(f"\nValidating {Path(results.get('file', '?')).name}:")
+        print(f"  Error: {results['error']}")
+        return
+
+    size_kb, size_mb = results["size_kb"], results["size_mb"]
+    fps, total_duration = results["fps"], results["duration_seconds"]
+    durations = results["frame_durations_ms"]
+
+    print(f"\nValidating {Path(results['file']).name}:")
+    print(
+        f"  Dimensions: {results['width']}x{results['height']}"
+        + (
+            f" ({'optimal' if results['optimal'] else 'acceptable'})"
+            if results["is_emoji"] and results["passes"]
+            else ""
         )
+    )
+    print(
+        f"  Size: {size_kb:.1f} KB"
+        + (f" ({size_mb:.2f} MB)" if size_mb >= 1.0 else "")
+    )
+    print(
+        f"  Frames: {results['frame_count']}"
+        + (f" @ {fps:.1f} fps ({total_duration:.1f}s)" if fps else "")
+    )
+    if len(set(durations)) > 1:
+        print(f"  Frame delays: {min(durations)}-{max(durations)} ms (variable)")
+
+    if not results["passes"]:
         print(
-            f"  Frames: {frame_count}"
-            + (f" @ {fps:.1f} fps ({total_duration:.1f}s)" if fps else "")
+            f"  Note: {'Emoji should be 128x128' if results['is_emoji'] else 'Unusual dimensions for Slack'}"
         )
 
-        if not dim_pass:
-            print(
-                f"  Note: {'Emoji should be 128x128' if is_emoji else 'Unusual dimensions for Slack'}"
-            )
+    if size_mb > 5.0:
+        print(f"  Note: Large file size - consider fewer frames/colors")
 
-        if size_mb > 5.0:
-            print(f"  Note: Large file size - consider fewer frames/colors")
 
-    return dim_pass, results
+def _validate_quiet(args: tuple[str, bool]) -> dict:
+    gif_path, is_emoji = args
+    _, results = validate_gif(gif_path, is_emoji, verbose=False)
+    results.setdefault("file", gif_path)
+    results.setdefault("passes", False)
+    return results
+
+
+def validate_directory(
+    directory: str | Path,
+    is_emoji: bool = True,
+    verbose: bool = True,
+    pattern: str = "*.gif",
+    workers: Optional[int] = None,
+) -> list[dict]:
+    """
+    Validate every GIF in a directory, in parallel.
+
+    Args:
+        directory: Directory to scan
+        is_emoji: True for emoji GIFs, False for message GIFs
+        verbose: Print validation details for each file
+        pattern: Glob pattern for files to check
+        workers: Worker processes (default: CPU count; 1 = validate in-process)
+
+    Returns:
+        List of validate_gif result dicts (sorted by path; each has "file" and
+        "passes", plus "error" for unreadable files)
+    """
+    paths = sorted(str(p) for p in Path(directory).glob(pattern) if p.is_file())
+    tasks = [(path, is_emoji) for path in paths]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(tasks))
+
+    if workers <= 1:
+        results = [_validate_quiet(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_validate_quiet, tasks, chunksize=8))
+
+    if verbose:
+        for result in results:
+            _print_results(result)
+        passed = sum(result["passes"] for result in results)
+        print(f"\n{passed}/{len(results)} GIFs pass")
+
+    return results
 
 
 def is_slack_ready(
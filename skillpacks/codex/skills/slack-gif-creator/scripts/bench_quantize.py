@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Pillow vs vectorized ("fast") global-palette quantization.
+
+Renders a synthetic animation, then compares optimize_colors() time, the
+end-to-end save() time and the size of the saved GIF for each quantizer.
+
+Usage: python scripts/bench_quantize.py [--frames 60] [--size 480] [--colors 128]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.gif_builder import GIFBuilder  # noqa: E402
+
+
+def render_frame(i: int, size: int) -> Image.Image:
+    """Gradient background with a moving, color-shifting ball and a star."""
+    y = np.linspace(0.0, 1.0, size)[:, None, None]
+    top, bottom = np.array([40, 20, 90]), np.array([250, 140, 60])
+    frame = Image.fromarray(
+        np.broadcast_to(top * (1 - y) + bottom * y, (size, size, 3)).astype(np.uint8)
+    )
+    draw = ImageDraw.Draw(frame)
+    x = int(size * (0.15 + 0.7 * (i % 30) / 30))
+    r = size // 10
+    draw.ellipse([x - r, size // 2 - r, x + r, size // 2 + r], fill=(255, 200 - 3 * (i % 30), 40))
+    draw.regular_polygon((size // 4, size // 4, r), 5, rotation=i * 6, fill=(255, 255, 255))
+    return frame
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Quantizer benchmark")
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--size", type=int, default=480)
+    parser.add_argument("--colors", type=int, default=128)
+    args = parser.parse_args()
+
+    frames = [np.array(render_frame(i, args.size)) for i in range(args.frames)]
+    print(f"{args.frames} frames @ {args.size}x{args.size}, {args.colors} colors")
+    print(f"{'quantizer':<22} {'quantize s':>10} {'save s':>7} {'GIF KB':>9} {'mean abs err':>13}")
+
+    cases = [("pil", False), ("fast", False), ("fast", True)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for quantizer, dither in cases:
+            builder = GIFBuilder(args.size, args.size, fps=15)
+            builder.frames = list(frames)
+            start = time.perf_counter()
+            optimized = builder.optimize_colors(
+                args.colors, quantizer=quantizer, ordered_dither=dither
+            )
+            elapsed = time.perf_counter() - start
+            err = np.mean(
+                [np.abs(o.astype(np.int16) - f).mean() for o, f in zip(optimized, frames)]
+            )
+
+            out = Path(tmp) / f"{quantizer}-{dither}.gif"
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                info = builder.save(
+                    out, num_colors=args.colors, quantizer=quantizer, ordered_dither=dither
+                )
+            save_s = time.perf_counter() - start
+            label = quantizer + (" + ordered dither" if dither else "")
+            print(f"{label:<22} {elapsed:>10.2f} {save_s:>7.2f} {info['size_kb']:>9.1f} {err:>13.2f}")
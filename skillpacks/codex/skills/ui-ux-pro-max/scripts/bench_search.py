@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark: postings-based top-k BM25 vs the previous full-scan scorer
+Usage: python bench_search.py [--repeat 200]
+
+Also checks that both scorers produce identical rankings for every query.
+"""
+
+import argparse
+import time
+from collections import defaultdict
+
+from core import BM25, MAX_RESULTS, _load_csv, _sources
+
+QUERIES = [
+    "dark mode dashboard",
+    "beauty spa wellness",
+    "elegant minimal soft",
+    "accessibility keyboard navigation",
+    "hero social proof cta",
+    "fintech trust blue",
+    "responsive layout grid",
+    "animation performance",
+]
+
+
+def full_scan_score(bm25, query):
+    """The previous BM25.score: visit every document, then sort all scores"""
+    query_tokens = bm25.tokenize(query)
+    scores = []
+    for idx, doc in enumerate(bm25.corpus):
+        score = 0
+        doc_len = bm25.doc_lengths[idx]
+        term_freqs = defaultdict(int)
+        for word in doc:
+            term_freqs[word] += 1
+        for token in query_tokens:
+            if token in bm25.idf:
+                tf = term_freqs[token]
+                idf = bm25.idf[token]
+                numerator = tf * (bm25.k1 + 1)
+                denominator = tf + bm25.k1 * (1 - bm25.b + bm25.b * doc_len / bm25.avgdl)
+                score += idf * numerator / denominator
+        scores.append((idx, score))
+    return sorted(scores, key=lambda x: x[1], reverse=True)
+
+
+def _time(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            fn(query)
+    return (time.perf_counter() - start) / (repeat * len(QUERIES)) * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BM25 scoring micro-benchmark")
+    parser.add_argument("--repeat", type=int, default=200, help="Passes over the query set per source")
+    args = parser.parse_args()
+
+    print(f"{'source':<22} {'docs':>5} {'full scan us':>13} {'top-k us':>9} {'speedup':>8}")
+    for name, filepath, search_cols, _ in _sources():
+        if not filepath.exists():
+            continue
+        bm25 = BM25()
+        bm25.fit([" ".join(str(row.get(col, "")) for col in search_cols) for row in _load_csv(filepath)])
+
+        for query in QUERIES:
+            legacy = full_scan_score(bm25, query)
+            assert bm25.score(query) == legacy, f"{name}: ranking differs for {query!r}"
+            expected = [(idx, score) for idx, score in legacy[:MAX_RESULTS] if score > 0]
+            assert bm25.top(query, MAX_RESULTS) == expected, f"{name}: top-k differs for {query!r}"
+
+        slow = _time(lambda q: full_scan_score(bm25, q)[:MAX_RESULTS], args.repeat)
+        fast = _time(lambda q: bm25.top(q, MAX_RESULTS), args.repeat)
+        print(f"{name:<22} {bm25.N:>5} {slow:>13.1f} {fast:>9.1f} {slow / fast:>7.1f}x")
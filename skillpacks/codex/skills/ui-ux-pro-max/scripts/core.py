@@ -5,7 +5,12 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
+import hashlib
+import heapq
+import json
+import os
 import re
+import tempfile
 from pathlib import Path
 from math import log
 from collections import defaultdict
@@ -13,6 +18,7 @@ from collections import defaultdict
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
 MAX_RESULTS = 3
+INDEX_VERSION = 1
 
 CSV_CONFIG = {
     "style": {
@@ -89,6 +95,8 @@ class BM25:
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        self.postings = {}
+        self.norms = []
         self.N = 0
 
     def tokenize(self, text):
@@ -105,39 +113,188 @@ class BM25:
         self.doc_lengths = [len(doc) for doc in self.corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
 
-        for doc in self.corpus:
-            seen = set()
+        for idx, doc in enumerate(self.corpus):
             for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
-
-        for word, freq in self.doc_freqs.items():
-            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+                plist = self.postings.setdefault(word, {})
+                plist[idx] = plist.get(idx, 0) + 1
+
+        for word, plist in self.postings.items():
+            self.doc_freqs[word] = len(plist)
+            self.idf[word] = log((self.N - len(plist) + 0.5) / (len(plist) + 0.5) + 1)
+        self._compute_norms()
+
+    def _compute_norms(self):
+        # Length normalization term of the BM25 denominator, per document.
+        self.norms = [self.k1 * (1 - self.b + self.b * doc_len / self.avgdl) for doc_len in self.doc_lengths]
+
+    def to_dict(self):
+        """Serializable form: postings, IDF and document lengths (no raw corpus)"""
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "N": self.N,
+            "avgdl": self.avgdl,
+            "doc_lengths": self.doc_lengths,
+            "idf": self.idf,
+            "postings": {word: sorted(plist.items()) for word, plist in self.postings.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore a fitted index produced by `to_dict`"""
+        bm25 = cls(k1=data["k1"], b=data["b"])
+        bm25.N = data["N"]
+        bm25.avgdl = data["avgdl"]
+        bm25.doc_lengths = data["doc_lengths"]
+        bm25.idf = data["idf"]
+        bm25.postings = {word: dict(pairs) for word, pairs in data["postings"].items()}
+        bm25.doc_freqs = defaultdict(int, {word: len(plist) for word, plist in bm25.postings.items()})
+        bm25._compute_norms()
+        return bm25
+
+    def _accumulate(self, query):
+        """Scores of documents containing at least one query token, via postings lists"""
+        scores = {}
+        for token in self.tokenize(query):
+            plist = self.postings.get(token)
+            if not plist:
+                continue
+            idf = self.idf[token]
+            for idx, tf in plist.items():
+                numerator = tf * (self.k1 + 1)
+                denominator = tf + self.norms[idx]
+                scores[idx] = scores.get(idx, 0) + idf * numerator / denominator
+        return scores
+
+    def top(self, query, k):
+        """Top-k matching documents as (idx, score), best first; ties keep document order"""
+        if k <= 0:
+            return []
+        scores = self._accumulate(query)
+        return heapq.nsmallest(k, scores.items(), key=lambda x: (-x[1], x[0]))
 
     def score(self, query):
         """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
-
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
-
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
-
-            scores.append((idx, score))
-
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+        scores = self._accumulate(query)
+        ranked = sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+        # Documents without any query token score 0 and follow in document order.
+        ranked.extend((idx, 0) for idx in range(self.N) if idx not in scores)
+        return ranked
+
+
+# ============ PERSISTED INDEX ============
+class SearchIndex:
+    """Precomputed BM25 index for one CSV plus its output rows"""
+
+    def __init__(self, bm25, rows):
+        self.bm25 = bm25
+        self.rows = rows
+
+    @classmethod
+    def build(cls, filepath, search_cols, output_cols):
+        data = _load_csv(filepath)
+        documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+        bm25 = BM25()
+        bm25.fit(documents)
+        rows = [{col: row.get(col, "") for col in output_cols if col in row} for row in data]
+        return cls(bm25, rows)
+
+    def search(self, query, max_results):
+        # Only matching documents (score > 0) are ranked.
+        return [self.rows[idx] for idx, _ in self.bm25.top(query, max_results)]
+
+
+def index_dir():
+    """Where indexes live: $UI_UX_PRO_MAX_INDEX_DIR, else a per-install dir in the user cache"""
+    override = os.environ.get("UI_UX_PRO_MAX_INDEX_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha1(str(DATA_DIR.resolve()).encode("utf-8")).hexdigest()[:12]
+    return Path(base) / "ui-ux-pro-max" / digest
+
+
+def _source_key(filepath, search_cols, output_cols):
+    # The index depends on the CSV bytes, the columns and the index format.
+    h = hashlib.sha256(filepath.read_bytes())
+    h.update(json.dumps([INDEX_VERSION, search_cols, output_cols]).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _index_path(filepath):
+    # stacks/react.csv -> stacks__react.json
+    try:
+        rel = filepath.relative_to(DATA_DIR)
+    except ValueError:
+        rel = Path(filepath.name)
+    return index_dir() / (rel.with_suffix("").as_posix().replace("/", "__") + ".json")
+
+
+def _write_index(path, payload):
+    """Atomic write; a read-only cache just means indexes stay in memory"""
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=path.name, dir=str(path.parent))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    finally:
+        # Still present only if dump/replace failed; never leave it behind.
+        if tmp is not None and os.path.exists(tmp):
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+_LOADED = {}  # filepath -> ((mtime_ns, size), SearchIndex)
+
+
+def load_index(filepath, search_cols, output_cols, rebuild=False):
+    """Return the index for a CSV, loading it lazily and rebuilding when the CSV hash changes"""
+    st = filepath.stat()
+    stat_key = (st.st_mtime_ns, st.st_size)
+    cached = _LOADED.get(filepath)
+    if cached is not None and cached[0] == stat_key and not rebuild:
+        return cached[1]
+
+    key = _source_key(filepath, search_cols, output_cols)
+    path = _index_path(filepath)
+    index = None
+    if not rebuild:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("key") == key:
+                index = SearchIndex(BM25.from_dict(payload["bm25"]), payload["rows"])
+        except (OSError, ValueError, KeyError, TypeError):
+            index = None
+    if index is None:
+        index = SearchIndex.build(filepath, search_cols, output_cols)
+        _write_index(path, {"key": key, "bm25": index.bm25.to_dict(), "rows": index.rows})
+
+    _LOADED[filepath] = (stat_key, index)
+    return index
+
+
+def _sources():
+    """All searchable CSVs: (name, filepath, search_cols, output_cols)"""
+    for domain, config in CSV_CONFIG.items():
+        yield domain, DATA_DIR / config["file"], config["search_cols"], config["output_cols"]
+    for stack, config in STACK_CONFIG.items():
+        yield f"stack:{stack}", DATA_DIR / config["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"]
+
+
+def build_indexes(force=False):
+    """Precompute indexes for every domain and stack; returns {name: document count}"""
+    built = {}
+    for name, filepath, search_cols, output_cols in _sources():
+        if filepath.exists():
+            built[name] = load_index(filepath, search_cols, output_cols, rebuild=force).bm25.N
+    return built
 
 
 # ============ SEARCH FUNCTIONS ============
@@ -152,24 +309,7 @@ def _search_csv(filepath, search_cols, output_cols, query, max_results):
     if not filepath.exists():
         return []
 
-    data = _load_csv(filepath)
-
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
-
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
-
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
-
-    return results
+    return load_index(filepath, search_cols, output_cols).search(query, max_results)
 
 
 def detect_domain(query):
@@ -234,3 +374,64 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def _score_ceiling(bm25, query):
+    """Upper bound of a query's BM25 score in this index: every token at max IDF, saturated tf"""
+    if bm25.N == 0:
+        return 0
+    idf_max = log((bm25.N - 1 + 0.5) / (1 + 0.5) + 1)
+    return len(bm25.tokenize(query)) * idf_max * (bm25.k1 + 1)
+
+
+def search_all(query, stack=None, max_results=MAX_RESULTS):
+    """Search every domain (plus one stack) and fuse the hits into one ranked list
+
+    Raw BM25 scores are not comparable across CSVs of different size and
+    vocabulary, so each score is divided by that index's ceiling for the query
+    (see `_score_ceiling`). Ties keep CSV_CONFIG order, then per-domain rank.
+    """
+    sources = [(domain, config["file"], config["search_cols"], config["output_cols"]) for domain, config in CSV_CONFIG.items()]
+    if stack:
+        if stack not in STACK_CONFIG:
+            return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}
+        sources.append(("stack", STACK_CONFIG[stack]["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"]))
+
+    # The global top-k is contained in the union of the per-domain top-k lists.
+    candidates = []
+    for order, (domain, file, search_cols, output_cols) in enumerate(sources):
+        filepath = DATA_DIR / file
+        if not filepath.exists():
+            continue
+        index = load_index(filepath, search_cols, output_cols)
+        ceiling = _score_ceiling(index.bm25, query)
+        for rank, (idx, score) in enumerate(index.bm25.top(query, max_results)):
+            candidates.append((-score / ceiling, order, rank, domain, file, index.rows[idx]))
+
+    results = [
+        {"domain": domain, "file": file, "score": round(-neg_score, 4), "row": row}
+        for neg_score, _, _, domain, file, row in heapq.nsmallest(max_results, candidates, key=lambda c: c[:3])
+    ]
+    result = {"domain": "all", "query": query, "count": len(results), "results": results}
+    if stack:
+        result["stack"] = stack
+    return result
+
+
+def run_query(request):
+    """Answer one batch request: {"query", "domain"? ("all" = fused), "stack"?, "max_results"?}"""
+    query = request.get("query")
+    if not isinstance(query, str):
+        return {"error": "query is required"}
+    max_results = request.get("max_results", MAX_RESULTS)
+    if not isinstance(max_results, int) or isinstance(max_results, bool):
+        return {"error": f"max_results must be an integer, got {max_results!r}"}
+
+    domain = request.get("domain")
+    if domain == "all":
+        return search_all(query, request.get("stack"), max_results)
+    if request.get("stack"):
+        return search_stack(query, request["stack"], max_results)
+    if domain is not None and domain not in CSV_CONFIG:
+        return {"error": f"Unknown domain: {domain}. Available: {', '.join(CSV_CONFIG)}"}
+    return search(query, domain, max_results)
@@ -3,13 +3,19 @@
 """
 UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
+       python search.py --batch [<file>|-]   (JSON lines in, JSON lines out)
+       python search.py --build-index [--force]
+       python search.py --serve | --stop      (optional warm worker)
 
-Domains: style, prompt, color, chart, landing, product, ux, typography
+Domains: style, prompt, color, chart, landing, product, ux, typography, all (fused across domains)
 Stacks: html-tailwind, react, nextjs
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
+import json
+import sys
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, build_indexes, index_dir, run_query
+import worker
 
 
 def format_output(result):
@@ -18,6 +24,8 @@ def format_output(result):
         return f"Error: {result['error']}"
 
     output = []
+    if result["domain"] == "all":
+        return _format_fused(result)
     if result.get("stack"):
         output.append(f"## UI Pro Max Stack Guidelines")
         output.append(f"**Stack:** {result['stack']} | **Query:** {result['query']}")
@@ -38,24 +46,99 @@ def format_output(result):
     return "\n".join(output)
 
 
+def _format_fused(result):
+    output = ["## UI Pro Max Search Results (all domains)"]
+    stack = f" + stack {result['stack']}" if result.get("stack") else ""
+    output.append(f"**Domains:** {', '.join(CSV_CONFIG)}{stack} | **Query:** {result['query']}")
+    output.append(f"**Found:** {result['count']} results\n")
+
+    for i, hit in enumerate(result['results'], 1):
+        output.append(f"### Result {i} ({hit['domain']}, {hit['file']}, score {hit['score']})")
+        for key, value in hit['row'].items():
+            value_str = str(value)
+            if len(value_str) > 300:
+                value_str = value_str[:300] + "..."
+            output.append(f"- **{key}:** {value_str}")
+        output.append("")
+
+    return "\n".join(output)
+
+
+def _parse_batch_line(line):
+    """A JSON object request, or a plain-text line taken as the query"""
+    try:
+        req = json.loads(line)
+    except ValueError:
+        return {"query": line}
+    return req if isinstance(req, dict) else {"query": line}
+
+
+def run_batch(lines, out, use_worker=True):
+    """Answer one request per input line, streaming one JSON result per line"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        req = _parse_batch_line(line)
+        resp = worker.request([req]) if use_worker else None
+        if resp is None:
+            # No (or a dead) worker: answer in-process, indexes stay loaded for the rest of the batch.
+            use_worker = False
+            try:
+                result = run_query(req)
+            except Exception as e:  # Same per-request guard as the worker: one bad line must not end the batch.
+                result = {"error": f"{type(e).__name__}: {e}"}
+        else:
+            result = resp[0]
+        if "id" in req:
+            result = {"id": req["id"], **result}
+        out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        out.flush()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
-    parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
+    parser.add_argument("query", nargs="?", help="Search query")
+    parser.add_argument("--domain", "-d", choices=[*CSV_CONFIG, "all"], help="Search domain ('all' fuses every domain, plus --stack if given)")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--build-index", action="store_true", help="Precompute search indexes for all domains and stacks")
+    parser.add_argument("--force", action="store_true", help="With --build-index: rebuild even if CSVs are unchanged")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE", help="Read JSON-lines queries from FILE or stdin ('-')")
+    parser.add_argument("--serve", action="store_true", help="Run a worker that keeps indexes warm for later calls")
+    parser.add_argument("--idle-timeout", type=float, default=worker.DEFAULT_IDLE_TIMEOUT, help="With --serve: exit after N idle seconds (0 = never)")
+    parser.add_argument("--stop", action="store_true", help="Stop a running worker")
+    parser.add_argument("--no-worker", action="store_true", help="Do not use a running worker")
 
     args = parser.parse_args()
 
-    # Stack search takes priority
-    if args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
-    else:
-        result = search(args.query, args.domain, args.max_results)
+    if args.build_index:
+        built = build_indexes(force=args.force)
+        print(f"Indexed {len(built)} sources ({sum(built.values())} rows) in {index_dir()}")
+        raise SystemExit(0)
+    if args.serve:
+        build_indexes()
+        worker.serve(idle_timeout=args.idle_timeout)
+        raise SystemExit(0)
+    if args.stop:
+        raise SystemExit(0 if worker.stop() else 1)
+    if args.batch is not None:
+        if args.batch == "-":
+            run_batch(sys.stdin, sys.stdout, use_worker=not args.no_worker)
+        else:
+            with open(args.batch, "r", encoding="utf-8") as f:
+                run_batch(f, sys.stdout, use_worker=not args.no_worker)
+        raise SystemExit(0)
+    if args.query is None:
+        parser.error("query is required (or use --batch / --build-index)")
+
+    # Stack search takes priority, unless --domain all folds the stack into the fused search
+    req = {"query": args.query, "domain": args.domain, "stack": args.stack, "max_results": args.max_results}
+    resp = None if args.no_worker else worker.request([req])
+    result = resp[0] if resp is not None else run_query(req)
 
     if args.json:
-        import json
         print(json.dumps(result, indent=2, ensure_ascii=False))
     else:
         print(format_output(result))
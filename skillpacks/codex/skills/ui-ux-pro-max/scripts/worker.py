@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Worker - keeps search indexes warm across search.py calls
+Start: python search.py --serve [--idle-timeout 900]
+Stop:  python search.py --stop
+
+Requests and responses are JSON lines over a Unix socket; search.py uses the
+worker automatically when it is running and falls back to in-process search.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+
+from core import index_dir, run_query
+
+DEFAULT_IDLE_TIMEOUT = 900
+_CLIENT_TIMEOUT = 30
+# sockaddr_un.sun_path is 104-108 bytes depending on the platform.
+_MAX_SOCKET_PATH = 100
+
+
+def supported():
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path():
+    """Socket next to the indexes, or a hashed temp path when that is too long"""
+    path = index_dir() / "worker.sock"
+    if len(os.fsencode(path)) <= _MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha1(os.fsencode(path)).hexdigest()[:16]
+    uid = getattr(os, "getuid", lambda: 0)()
+    return Path(tempfile.gettempdir()) / f"ui-ux-pro-max-{uid}-{digest}.sock"
+
+
+def request(requests):
+    """Send requests to the worker; returns the responses, or None if no worker answered"""
+    if not supported():
+        return None
+    path = socket_path()
+    if not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_CLIENT_TIMEOUT)
+            sock.connect(str(path))
+            sock.sendall(b"".join(json.dumps(r, ensure_ascii=False).encode("utf-8") + b"\n" for r in requests))
+            sock.shutdown(socket.SHUT_WR)
+            with sock.makefile("rb") as f:
+                responses = [json.loads(line) for line in f]
+    except (OSError, ValueError):
+        return None
+    if len(responses) != len(requests):
+        return None
+    return responses
+
+
+def _handle(conn, state):
+    with conn, conn.makefile("rb") as rfile, conn.makefile("wb") as wfile:
+        for line in rfile:
+            try:
+                req = json.loads(line)
+                if not isinstance(req, dict):
+                    raise ValueError("request must be a JSON object")
+                if req.get("cmd") == "ping":
+                    resp = {"pid": os.getpid()}
+                elif req.get("cmd") == "stop":
+                    state["stop"] = True
+                    resp = {"stopped": True}
+                else:
+                    resp = run_query(req)
+            except Exception as e:  # One bad request must not take the worker down.
+                resp = {"error": f"{type(e).__name__}: {e}"}
+            wfile.write(json.dumps(resp, ensure_ascii=False).encode("utf-8") + b"\n")
+        wfile.flush()
+
+
+def serve(idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    """Serve until stopped or idle; indexes stay loaded (and re-check their CSVs per query)"""
+    if not supported():
+        raise SystemExit("Error: --serve requires Unix domain sockets")
+    path = socket_path()
+    if request([{"cmd": "ping"}]) is not None:
+        raise SystemExit(f"Error: worker already running on {path}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+    state = {"stop": False}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+        os.chmod(path, 0o600)
+        server.listen()
+        server.settimeout(idle_timeout or None)
+        try:
+            while not state["stop"]:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    break
+                conn.settimeout(_CLIENT_TIMEOUT)
+                try:
+                    _handle(conn, state)
+                except OSError:
+                    pass
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def stop():
+    """Ask a running worker to exit; returns True if one answered"""
+    return request([{"cmd": "stop"}]) is not None